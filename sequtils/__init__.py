@@ -25,12 +25,129 @@ For Developers:
 :code:`SequencePoint` and :code:`SequenceRange` both subclass The base class
 :code:`BaseSequenceLocation`, which defines most the dunders and :code:`_arithmetic` and
 :code:`_comparison_cast` which takes care of most of the math and comparason for the subclasses
+
+For bulk work there are columnar collections backed by numpy arrays:
+
+#. :code:`SequencePointArray`, many :code:`SequencePoint`'s stored as one position array, with
+   vectorized math, sorting, unique, membership and residue lookup
+#. :code:`SequenceRangeArray`, many :code:`SequenceRange`'s stored as start/stop arrays, it can
+   validate all rows at once via :code:`SequenceRangeArray.validation` which returns a
+   :code:`ValidationResult` with a boolean mask and :code:`InvalidReason` flags per row
+
+The collections can be joined with sort based algorithms instead of nested loops:
+
+- :code:`point_range_pairs` and :code:`point_range_counts`, which points are inside which ranges
+- :code:`range_overlap_pairs` and :code:`iter_range_overlaps`, which ranges overlap and where
+- :code:`nearest_range` and :code:`nearest_terminus`, the nearest range or range terminus to
+  each point (or range) and the signed distance to it
+- :code:`containment_forest`, :code:`maximal_ranges` and :code:`terminus_groups`, which
+  ranges are redundant, because they are nested in others or share a start or stop
+
+Proteome wide datasets, where every range or point belongs to a protein, are stored in
+:code:`KeyedRangeArray` and :code:`KeyedPointArray`, which dictionary encode the accessions and
+keep a sorted index per protein, :code:`coverage_report` and :code:`iter_coverage_report`
+compute coverage statistics per protein and sample in chunks and in parallel, for streaming
+data :code:`RangeIndex` is a mutable index with logarithmic inserts, deletes, overlap queries
+and running coverage
+
+Long sequences can be split into overlapping chunks with :code:`tile_sequence` to scan them in
+parallel, :code:`merge_tile_hits` shifts the hits back and drops the duplicates of the overlaps
+
+FASTA files are read lazily with :code:`read_fasta` and :code:`read_peptide_fasta`
+
+Proteins can be scanned for regular expression or PROSITE motifs with :code:`MotifScanner`
+
+:code:`EncodedProteins` integer encodes proteins once, to gather residue windows as machine
+learning features
+
+:code:`MassTable` gives the monoisotopic mass of ranges from prefix sums, and :code:`MassIndex`
+finds the ranges within a tolerance of precursor m/z
+
+The collections can be exchanged with Arrow and Parquet via :code:`to_arrow`,
+:code:`from_arrow`, :code:`write_parquet` and :code:`read_parquet` (requires :code:`pyarrow`)
+
+If pandas is installed, :code:`SequenceRangeDtype` (:code:`dtype="sequence_range"`) stores
+ranges compactly in pandas columns, with vectorized accessors under :code:`series.sequtils`
+
+:code:`write_ranges` writes collections as :code:`start:stop` text in bulk
+
+:code:`CompressedRangeArray` archives ranges delta encoded and bit packed in blocks, which can
+be decoded one at a time or streamed from a file with :code:`iter_compressed`
+
+For asyncio services :code:`aiter_chunks`, :code:`aiter_from_sequences`,
+:code:`from_sequences_async` and :code:`run_async` run the heavy work in chunks in an executor,
+so the event loop stays responsive
+
+Sequences repeated across many ranges can be interned in a :code:`SequenceStore` (or the
+:code:`global_sequence_store`) with :code:`SequenceRange.intern` and
+:code:`SequenceRangeArray.intern`, then each distinct :code:`seq` is in memory once, equality
+is an identity check and :code:`SequenceRangeArray.seq_ids` gives integer ids for bulk work
+
+To find hot implicit conversions use :code:`with profiling() as profile:`, which counts
+constructions, casts, validations and exceptions and times the methods of :code:`SequencePoint`
+and :code:`SequenceRange` inside the block, see :code:`profile.summary()`
 """
 
 
 from ._point import SequencePoint
 from ._range import SequenceRange
+from ._interning import SequenceStore, global_sequence_store
+from ._point_array import SequencePointArray
+from ._range_array import SequenceRangeArray
+from ._validation import InvalidReason, ValidationResult
+from ._join import (PointRangeJoin, point_range_pairs, point_range_counts, OverlapJoin,
+                    range_overlap_pairs, iter_range_overlaps, NearestJoin, nearest_range,
+                    nearest_terminus)
+from ._redundancy import containment_forest, maximal_ranges, terminus_groups
+from ._keyed import KeyedPointArray, KeyedRangeArray
+from ._coverage import CoverageReport, coverage_report, iter_coverage_report
+from ._index import RangeIndex
+from ._tiling import tile_sequence, merge_tile_hits
+from ._motif import MotifScanner, prosite_to_regex
+from ._features import EncodedProteins
+from ._mass import MassTable, MassIndex, MassMatches, mass_to_mz, mz_to_mass
+from ._fasta import FastaBatch, read_fasta, read_peptide_fasta
+from ._arrow import (to_arrow, from_arrow, to_arrow_table, from_arrow_table, write_parquet,
+                     read_parquet)
+from ._format import format_ranges, write_ranges
+from ._compression import CompressedRangeArray, iter_compressed
+from ._profiling import Profile, profiling
+from ._aio import aiter_chunks, aiter_from_sequences, from_sequences_async, run_async
+
 
+__slots__ = ("SequencePoint", "SequenceRange", "SequencePointArray", "SequenceRangeArray",
+             "InvalidReason", "ValidationResult", "PointRangeJoin", "point_range_pairs",
+             "point_range_counts", "OverlapJoin", "range_overlap_pairs",
+             "iter_range_overlaps", "KeyedPointArray", "KeyedRangeArray", "FastaBatch",
+             "read_fasta", "read_peptide_fasta", "to_arrow", "from_arrow", "to_arrow_table",
+             "from_arrow_table", "write_parquet", "read_parquet", "format_ranges",
+             "write_ranges", "containment_forest", "maximal_ranges", "terminus_groups",
+             "aiter_chunks", "aiter_from_sequences", "from_sequences_async", "run_async",
+             "Profile", "profiling", "RangeIndex", "MotifScanner", "prosite_to_regex",
+             "EncodedProteins", "CoverageReport", "coverage_report", "iter_coverage_report",
+             "NearestJoin", "nearest_range", "nearest_terminus", "CompressedRangeArray",
+             "iter_compressed", "tile_sequence", "merge_tile_hits", "MassTable", "MassIndex",
+             "MassMatches", "mass_to_mz", "mz_to_mass", "SequenceStore",
+             "global_sequence_store")
+__all__ = ("SequencePoint", "SequenceRange", "SequencePointArray", "SequenceRangeArray",
+           "InvalidReason", "ValidationResult", "PointRangeJoin", "point_range_pairs",
+           "point_range_counts", "OverlapJoin", "range_overlap_pairs", "iter_range_overlaps",
+           "KeyedPointArray", "KeyedRangeArray", "FastaBatch", "read_fasta",
+           "read_peptide_fasta", "to_arrow", "from_arrow", "to_arrow_table",
+           "from_arrow_table", "write_parquet", "read_parquet", "format_ranges", "write_ranges",
+           "containment_forest", "maximal_ranges", "terminus_groups", "aiter_chunks",
+           "aiter_from_sequences", "from_sequences_async", "run_async", "Profile", "profiling",
+           "RangeIndex", "MotifScanner", "prosite_to_regex", "EncodedProteins", "CoverageReport",
+           "coverage_report", "iter_coverage_report", "NearestJoin", "nearest_range",
+           "nearest_terminus", "CompressedRangeArray", "iter_compressed", "tile_sequence",
+           "merge_tile_hits", "MassTable", "MassIndex", "MassMatches", "mass_to_mz",
+           "mz_to_mass", "SequenceStore", "global_sequence_store")
 
-__slots__ = ("SequencePoint", "SequenceRange")
-__all__ = ("SequencePoint", "SequenceRange")
+# the pandas extension dtype is only registered (and exported) if pandas is installed
+try:
+    from ._pandas import SequenceRangeDtype, SequenceRangeExtensionArray
+except ImportError:
+    pass
+else:
+    __slots__ += ("SequenceRangeDtype", "SequenceRangeExtensionArray")
+    __all__ += ("SequenceRangeDtype", "SequenceRangeExtensionArray")
@@ -0,0 +1,127 @@
+# core imports
+import asyncio
+import concurrent.futures
+import functools
+from collections import deque
+from collections.abc import Iterable
+from typing import AsyncIterator, Callable, Union
+
+# local imports
+from ._range_array import SequenceRangeArray
+
+
+_DEFAULT_CHUNK_SIZE = 100000
+
+
+async def aiter_chunks(function: Callable, *collections: Iterable,
+                       chunk_size: int=_DEFAULT_CHUNK_SIZE, prefetch: int=1,
+                       executor: Union[concurrent.futures.Executor, None]=None) -> AsyncIterator:
+    """
+    Apply :code:`function` to consecutive chunks of one or more aligned collections in an
+    executor, and yield the results in order, so the event loop stays responsive while the
+    work is done
+
+    :param function: called with one slice of each collection, e.g.
+                     :code:`function(ranges[i:i + chunk_size])`
+    :param collections: anything with :code:`len` and slicing, e.g. a
+                        :code:`SequenceRangeArray` or a list
+    :param chunk_size: the number of rows per call
+    :param prefetch: the number of chunks computed ahead of the consumer, the remaining chunks
+                     are only submitted when the results are consumed (backpressure)
+    :param executor: :code:`concurrent.futures.Executor`, the default executor of the
+                     loop if :code:`None`
+
+    .. code-block:: python
+
+        >>> async def lengths(ranges):
+        ...     return [chunk async for chunk in aiter_chunks(len, ranges, chunk_size=2)]
+        >>> asyncio.run(lengths(SequenceRangeArray([(1, 2), (3, 4), (5, 6)])))
+        [2, 1]
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size({}) < 1".format(chunk_size))
+    if prefetch < 0:
+        raise ValueError("prefetch({}) < 0".format(prefetch))
+    if not collections:
+        raise TypeError("at least one collection is required")
+    length = len(collections[0])
+    if any(len(collection) != length for collection in collections):
+        raise ValueError("the collections has to have the same length")
+
+    loop = asyncio.get_running_loop()
+    offsets = iter(range(0, length, chunk_size))
+    pending = deque()
+
+    def submit():
+        offset = next(offsets, None)
+        if offset is not None:
+            chunks = [collection[offset:offset + chunk_size] for collection in collections]
+            pending.append(loop.run_in_executor(executor, function, *chunks))
+
+    try:
+        for _ in range(prefetch + 1):
+            submit()
+        while pending:
+            result = await pending.popleft()
+            # the next chunk is computed while the consumer handles this one
+            submit()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _from_sequences(full_sequence, sequences):
+    return SequenceRangeArray.from_sequences(full_sequence, sequences)
+
+
+async def aiter_from_sequences(full_sequence: Union[str, Iterable], sequences: Iterable, *,
+                               chunk_size: int=_DEFAULT_CHUNK_SIZE, prefetch: int=1,
+                               executor: Union[concurrent.futures.Executor, None]=None
+                               ) -> AsyncIterator[SequenceRangeArray]:
+    """
+    :code:`SequenceRangeArray.from_sequences` in chunks, yields a :code:`SequenceRangeArray`
+    per chunk, so results can be streamed while the rest is computed, see
+    :code:`aiter_chunks` for the arguments
+    """
+
+    sequences = list(sequences)
+    if isinstance(full_sequence, str):
+        chunks = aiter_chunks(functools.partial(_from_sequences, full_sequence), sequences,
+                              chunk_size=chunk_size, prefetch=prefetch, executor=executor)
+    else:
+        chunks = aiter_chunks(_from_sequences, list(full_sequence), sequences,
+                              chunk_size=chunk_size, prefetch=prefetch, executor=executor)
+    async for ranges in chunks:
+        yield ranges
+
+
+async def from_sequences_async(full_sequence: Union[str, Iterable], sequences: Iterable, *,
+                               chunk_size: int=_DEFAULT_CHUNK_SIZE,
+                               executor: Union[concurrent.futures.Executor, None]=None
+                               ) -> SequenceRangeArray:
+    """
+    awaitable :code:`SequenceRangeArray.from_sequences`, the work is done in chunks in an
+    executor
+
+    .. code-block:: python
+
+        >>> asyncio.run(from_sequences_async('EVILELVISLIVES', ['ELVIS', 'LIVES']))
+        SequenceRangeArray([5:9, 10:14], length=2)
+    """
+
+    return SequenceRangeArray.concatenate([
+        ranges async for ranges in aiter_from_sequences(
+            full_sequence, sequences, chunk_size=chunk_size, executor=executor)])
+
+
+async def run_async(function: Callable, *args,
+                    executor: Union[concurrent.futures.Executor, None]=None, **kwargs):
+    """
+    run a single CPU heavy call, like :code:`KeyedRangeArray.coverage`, in an executor,
+    e.g. :code:`await run_async(peptides.coverage)`
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(function, *args, **kwargs))
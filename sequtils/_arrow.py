@@ -0,0 +1,136 @@
+# core imports
+import os
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._keyed import KeyedPointArray, KeyedRangeArray
+from ._point_array import SequencePointArray, POSITION_DTYPE
+from ._range_array import SequenceRangeArray
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow interop requires pyarrow, install it with: "
+                          "pip install sequtils[arrow]") from None
+    return pyarrow
+
+
+def _positions_to_arrow(pa, positions):
+    # pyarrow wraps contiguous primitive numpy arrays without copying
+    return pa.array(np.ascontiguousarray(positions, dtype=POSITION_DTYPE), type=pa.int32())
+
+
+def _positions_from_arrow(array):
+    if array.null_count:
+        raise ValueError("positions cannot be null")
+    return array.to_numpy(zero_copy_only=True).astype(POSITION_DTYPE, copy=False)
+
+
+def to_arrow(collection: Union[SequencePointArray, SequenceRangeArray]):
+    """
+    Convert a columnar collection to an Arrow array without copying the positions
+
+    * :code:`SequencePointArray` becomes an :code:`int32` array
+    * :code:`SequenceRangeArray` becomes a struct of :code:`int32` start and stop and a
+      :code:`string` seq (null where there is no sequence)
+    """
+
+    pa = _import_pyarrow()
+    if isinstance(collection, SequencePointArray):
+        return _positions_to_arrow(pa, collection.pos)
+    elif isinstance(collection, SequenceRangeArray):
+        start, stop = collection.pos
+        if collection.seq is None:
+            seq = pa.nulls(len(collection), type=pa.string())
+        else:
+            seq = pa.array(collection.seq, type=pa.string(), from_pandas=True)
+        return pa.StructArray.from_arrays(
+            [_positions_to_arrow(pa, start), _positions_to_arrow(pa, stop), seq],
+            names=['start', 'stop', 'seq'])
+    raise TypeError("cannot convert {} to arrow".format(type(collection)))
+
+
+def from_arrow(array, *, validate: bool=True) -> Union[SequencePointArray, SequenceRangeArray]:
+    """
+    Convert an Arrow array made by :code:`to_arrow` back to a columnar collection, the
+    positions are not copied, if the array has no nulls and is a single chunk
+    """
+
+    pa = _import_pyarrow()
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if pa.types.is_integer(array.type):
+        return SequencePointArray(_positions_from_arrow(array), validate=validate)
+    elif pa.types.is_struct(array.type):
+        if array.null_count:
+            raise ValueError("ranges cannot be null")
+        start = _positions_from_arrow(array.field('start'))
+        stop = _positions_from_arrow(array.field('stop'))
+        seq = None
+        if array.type.get_field_index('seq') != -1:
+            seq_array = array.field('seq')
+            if seq_array.null_count != len(seq_array):
+                seq = seq_array.to_numpy(zero_copy_only=False).astype(object, copy=False)
+        return SequenceRangeArray(start, stop, seq, validate=validate)
+    raise TypeError("cannot convert arrow type {} to a sequtils collection".format(array.type))
+
+
+def to_arrow_table(collection):
+    """
+    Convert a collection to an Arrow table with a :code:`ranges` or :code:`points` column,
+    keyed collections get an extra dictionary encoded :code:`key` column
+    """
+
+    pa = _import_pyarrow()
+    columns = {}
+    if isinstance(collection, (KeyedPointArray, KeyedRangeArray)):
+        columns['key'] = pa.DictionaryArray.from_arrays(
+            pa.array(collection.codes, type=pa.int32()), pa.array(collection.categories))
+        collection = collection.ranges if isinstance(collection, KeyedRangeArray) else \
+            collection.points
+    name = 'points' if isinstance(collection, SequencePointArray) else 'ranges'
+    columns[name] = to_arrow(collection)
+    return pa.table(columns)
+
+
+def from_arrow_table(table, *, validate: bool=True):
+    "inverse of :code:`to_arrow_table`"
+    pa = _import_pyarrow()
+    name = 'points' if 'points' in table.column_names else 'ranges'
+    values = from_arrow(table.column(name), validate=validate)
+    if 'key' not in table.column_names:
+        return values
+
+    key = table.column('key').combine_chunks()
+    if not pa.types.is_dictionary(key.type):
+        key = key.dictionary_encode()
+    cls = KeyedPointArray if name == 'points' else KeyedRangeArray
+    categories = key.dictionary.to_numpy(zero_copy_only=False)
+    order = np.argsort(categories, kind='stable')
+    remap = np.empty(len(order), dtype=np.int32)
+    remap[order] = np.arange(len(order))
+    codes = remap[key.indices.to_numpy(zero_copy_only=False)]
+    return cls.from_codes(categories[order], codes, values, validate=False)
+
+
+def write_parquet(collection, path: Union[str, os.PathLike], **kwargs):
+    """
+    Write a (keyed) collection to a Parquet file, :code:`kwargs` are passed on to
+    :code:`pyarrow.parquet.write_table`
+    """
+
+    _import_pyarrow()
+    import pyarrow.parquet
+    pyarrow.parquet.write_table(to_arrow_table(collection), path, **kwargs)
+
+
+def read_parquet(path: Union[str, os.PathLike], *, validate: bool=True):
+    "Read a collection written by :code:`write_parquet`"
+    _import_pyarrow()
+    import pyarrow.parquet
+    return from_arrow_table(pyarrow.parquet.read_table(path), validate=validate)
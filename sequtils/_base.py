@@ -108,6 +108,9 @@ class BaseSequenceLocation(metaclass=abc.ABCMeta):
 
     # comparison dunders
     def __lt__(self, other):
+        if type(other) is type(self):
+            # fast path, nothing to cast
+            return self.pos < other.pos
         if self._comparison_cast(other):
             #  try:
             return self.pos < self.__class__(other, validate=False).pos
@@ -116,6 +119,9 @@ class BaseSequenceLocation(metaclass=abc.ABCMeta):
         return NotImplemented
 
     def __eq__(self, other):
+        if type(other) is type(self):
+            # fast path, nothing to cast
+            return self.pos == other.pos
         if self._comparison_cast(other):
             #  try:
             return self.pos == self.__class__(other, validate=False).pos
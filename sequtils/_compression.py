@@ -0,0 +1,256 @@
+# core imports
+import struct
+from typing import BinaryIO, Iterator
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._point_array import POSITION_DTYPE
+from ._range import SequenceRange
+from ._range_array import SequenceRangeArray
+
+
+_DEFAULT_BLOCK_SIZE = 4096
+# magic, format version, number of ranges, block size, number of blocks
+_HEADER = struct.Struct("<4sBQII")
+_MAGIC = b"SQRC"
+_VERSION = 1
+# per block: where its data starts, the first start and the frame of reference and bit width
+# of the start deltas and of the lengths
+_BLOCK_DTYPE = np.dtype([('offset', '<u8'), ('first_start', '<i8'), ('min_delta', '<i8'),
+                         ('min_length', '<i8'), ('delta_width', 'u1'), ('length_width', 'u1')])
+
+
+def _bit_width(values) -> int:
+    return int(values.max()).bit_length() if len(values) else 0
+
+
+def _bit_pack(values, width) -> np.ndarray:
+    "pack non negative integers into :code:`width` bits each"
+    values = values.astype(np.uint64)
+    bits = (values[:, None] >> np.arange(width, dtype=np.uint64)) & np.uint64(1)
+    return np.packbits(bits.astype(np.uint8), bitorder='little')
+
+
+def _bit_unpack(data, width, count) -> np.ndarray:
+    "inverse of :code:`_bit_pack`, as int64"
+    values = np.zeros(count, dtype=np.int64)
+    if not width or not count:
+        return values
+    bits = np.unpackbits(data, count=count * width, bitorder='little').reshape(count, width)
+    for bit in range(width):
+        values |= bits[:, bit].astype(np.int64) << bit
+    return values
+
+
+def _packed_size(width, count) -> int:
+    return (width * count + 7) // 8
+
+
+def _encode_block(start, stop):
+    "the block table entry (without offset) and the packed data of one block"
+    delta = np.diff(start)
+    length = stop - start
+    min_delta = int(delta.min()) if len(delta) else 0
+    min_length = int(length.min())
+    # frame of reference: only the offsets from the block minimum are bit packed
+    delta, length = delta - min_delta, length - min_length
+    delta_width, length_width = _bit_width(delta), _bit_width(length)
+    data = np.concatenate([_bit_pack(delta, delta_width), _bit_pack(length, length_width)])
+    return (0, int(start[0]), min_delta, min_length, delta_width, length_width), data
+
+
+def _decode_block(entry, data, count):
+    "the (start, stop) columns of one block"
+    delta_size = _packed_size(int(entry['delta_width']), count - 1)
+    delta = _bit_unpack(data[:delta_size], int(entry['delta_width']), count - 1)
+    length = _bit_unpack(data[delta_size:], int(entry['length_width']), count)
+    start = np.empty(count, dtype=np.int64)
+    start[0] = entry['first_start']
+    np.cumsum(delta + int(entry['min_delta']), out=start[1:])
+    start[1:] += start[0]
+    stop = start + length + int(entry['min_length'])
+    return start.astype(POSITION_DTYPE), stop.astype(POSITION_DTYPE)
+
+
+class CompressedRangeArray:
+    """
+    Compressed, read-only storage of the positions of a :code:`SequenceRangeArray`, for
+    archiving large range sets on disk or in memory
+
+    The rows are split in blocks of :code:`block_size` ranges, in each block the differences
+    between consecutive starts and the lengths are stored relative to their block minimum
+    (frame of reference) and bit packed with the smallest bit width that fits, which takes a
+    few bits per range for sorted peptides instead of the 8 bytes of the raw positions. Every
+    block can be decoded on its own, so single blocks can be accessed randomly and big
+    archives can be decoded as a stream of blocks, see :code:`iter_compressed`
+
+    :param ranges: :code:`SequenceRangeArray` or iterable of range like objects, the
+                   :code:`seq` is not stored, the row order is kept, but sorted ranges
+                   compress best
+    :param block_size: the number of ranges per block
+
+    .. code-block:: python
+
+        >>> ranges = SequenceRangeArray([(1, 8), (3, 12), (4, 9), (10, 20)])
+        >>> compressed = CompressedRangeArray(ranges, block_size=2)
+        >>> compressed.block(1)
+        SequenceRangeArray([4:9, 10:20], length=2)
+        >>> compressed.decompress()
+        SequenceRangeArray([1:8, 3:12, 4:9, 10:20], length=4)
+        >>> CompressedRangeArray.from_bytes(compressed.to_bytes())[2]
+        SequenceRange(4, 9, seq=None)
+    """
+
+    def __init__(self, ranges, *, block_size: int=_DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("block_size({}) < 1".format(block_size))
+        if not isinstance(ranges, SequenceRangeArray):
+            ranges = SequenceRangeArray(ranges, validate=False)
+        start, stop = (column.astype(np.int64) for column in ranges.pos)
+
+        offsets = range(0, len(ranges), block_size)
+        blocks = np.zeros(len(offsets), dtype=_BLOCK_DTYPE)
+        data, offset = [], 0
+        for i, first in enumerate(offsets):
+            entry, block_data = _encode_block(start[first:first + block_size],
+                                              stop[first:first + block_size])
+            blocks[i] = (offset,) + entry[1:]
+            data.append(block_data)
+            offset += len(block_data)
+        self._init(len(ranges), block_size, blocks,
+                   np.concatenate(data) if data else np.zeros(0, dtype=np.uint8))
+
+    def _init(self, length, block_size, blocks, data):
+        self._length = length
+        self._block_size = block_size
+        self._blocks = blocks
+        self._data = data
+
+    # properties, to make it read-only
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def n_blocks(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def nbytes(self) -> int:
+        "the size of the compressed data, including the block table"
+        return self._blocks.nbytes + self._data.nbytes
+
+    # decoding
+    def _block_count(self, i):
+        return min(self._block_size, self._length - i * self._block_size)
+
+    def block(self, i: int) -> SequenceRangeArray:
+        "decode only the :code:`i`'th block, i.e. the rows :code:`i * block_size` and on"
+        if not -len(self._blocks) <= i < len(self._blocks):
+            raise IndexError("block {} out of range".format(i))
+        i %= len(self._blocks)
+        entry = self._blocks[i]
+        end = self._blocks[i + 1]['offset'] if i + 1 < len(self._blocks) else len(self._data)
+        start, stop = _decode_block(entry, self._data[entry['offset']:end], self._block_count(i))
+        return SequenceRangeArray._from_columns(start, stop)
+
+    def iter_blocks(self) -> Iterator[SequenceRangeArray]:
+        "decode the blocks one after the other"
+        for i in range(len(self._blocks)):
+            yield self.block(i)
+
+    def decompress(self) -> SequenceRangeArray:
+        "decode all blocks into one :code:`SequenceRangeArray`"
+        if not self._length:
+            return SequenceRangeArray._from_columns(np.zeros(0, dtype=POSITION_DTYPE),
+                                                    np.zeros(0, dtype=POSITION_DTYPE))
+        return SequenceRangeArray.concatenate(list(self.iter_blocks()))
+
+    # serialization
+    def _header(self):
+        return _HEADER.pack(_MAGIC, _VERSION, self._length, self._block_size, len(self._blocks))
+
+    def to_bytes(self) -> bytes:
+        return self._header() + self._blocks.tobytes() + self._data.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompressedRangeArray':
+        "Alternative Constructor, from the output of :code:`to_bytes`, without copying"
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        length, block_size, n_blocks = _read_header(bytes(buffer[:_HEADER.size]))
+        table_end = _HEADER.size + n_blocks * _BLOCK_DTYPE.itemsize
+        self = cls.__new__(cls)
+        self._init(length, block_size, buffer[_HEADER.size:table_end].view(_BLOCK_DTYPE),
+                   buffer[table_end:])
+        return self
+
+    def write(self, file: BinaryIO):
+        "write to a binary file object, see :code:`iter_compressed` to read it as a stream"
+        file.write(self._header())
+        file.write(self._blocks.tobytes())
+        file.write(self._data.tobytes())
+
+    @classmethod
+    def read(cls, file: BinaryIO) -> 'CompressedRangeArray':
+        "Alternative Constructor, read what :code:`write` wrote from a binary file object"
+        return cls.from_bytes(file.read())
+
+    # dunders
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, item) -> SequenceRange:
+        "single rows only, by decoding their block"
+        if not isinstance(item, (int, np.integer)):
+            raise TypeError("only integer indexes are supported, use block or decompress")
+        if not -self._length <= item < self._length:
+            raise IndexError("index {} out of range".format(item))
+        item %= self._length
+        return self.block(item // self._block_size)[item % self._block_size]
+
+    def __repr__(self):
+        return "{}(length={}, blocks={}, nbytes={})".format(
+            type(self).__name__, self._length, len(self._blocks), self.nbytes)
+
+
+def _read_header(data):
+    if len(data) != _HEADER.size:
+        raise ValueError("truncated compressed range data")
+    magic, version, length, block_size, n_blocks = _HEADER.unpack(data)
+    if magic != _MAGIC:
+        raise ValueError("not compressed range data")
+    if version != _VERSION:
+        raise ValueError("unsupported compressed range format version {}".format(version))
+    return length, block_size, n_blocks
+
+
+def iter_compressed(file: BinaryIO) -> Iterator[SequenceRangeArray]:
+    """
+    Decode a file written by :code:`CompressedRangeArray.write` one block at a time, so only
+    one block is in memory, not the whole archive
+
+    .. code-block:: python
+
+        >>> import io
+        >>> file = io.BytesIO()
+        >>> CompressedRangeArray([(1, 8), (3, 12), (4, 9)], block_size=2).write(file)
+        >>> _ = file.seek(0)
+        >>> [len(block) for block in iter_compressed(file)]
+        [2, 1]
+    """
+
+    length, block_size, n_blocks = _read_header(file.read(_HEADER.size))
+    table_size = n_blocks * _BLOCK_DTYPE.itemsize
+    blocks = np.frombuffer(file.read(table_size), dtype=_BLOCK_DTYPE)
+    if len(blocks) != n_blocks:
+        raise ValueError("truncated compressed range data")
+    for i, entry in enumerate(blocks):
+        count = min(block_size, length - i * block_size)
+        size = _packed_size(int(entry['delta_width']), count - 1) + \
+            _packed_size(int(entry['length_width']), count)
+        data = np.frombuffer(file.read(size), dtype=np.uint8)
+        if len(data) != size:
+            raise ValueError("truncated compressed range data")
+        yield SequenceRangeArray._from_columns(*_decode_block(entry, data, count))
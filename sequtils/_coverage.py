@@ -0,0 +1,221 @@
+# core imports
+import collections
+import concurrent.futures
+from collections.abc import Iterable, Mapping
+from typing import Iterator, Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._keyed import KeyedRangeArray
+
+
+_DEFAULT_CHUNK_SIZE = 1000
+_DEFAULT_MAX_DEPTH = 10
+
+
+class CoverageReport(collections.namedtuple("CoverageReport", (
+        "sample", "protein", "length", "covered", "percent_covered", "segments", "longest_gap",
+        "depth_histogram"))):
+    """
+    Coverage statistics, one row per protein and sample, all columns are numpy arrays
+
+    :ivar sample: the sample name of each row
+    :ivar protein: the protein identifier
+    :ivar length: the protein length
+    :ivar covered: the number of residues covered by at least one range
+    :ivar percent_covered: :code:`100 * covered / length`
+    :ivar segments: the number of covered segments, i.e. the merged ranges
+    :ivar longest_gap: the length of the longest stretch of uncovered residues
+    :ivar depth_histogram: 2-D, :code:`depth_histogram[i, d]` is the number of residues of row
+                           :code:`i` covered by :code:`d` ranges, the last column counts the
+                           residues covered by :code:`max_depth` or more ranges
+    """
+
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.protein)
+
+    @classmethod
+    def concatenate(cls, reports: Iterable['CoverageReport']) -> 'CoverageReport':
+        "one report from several, e.g. the chunks of :code:`iter_coverage_report`"
+        reports = list(reports)
+        if not reports:
+            raise ValueError("need at least one report to concatenate")
+        return cls(*(np.concatenate(column) for column in zip(*reports)))
+
+    def to_pandas(self):
+        "a :code:`pandas.DataFrame` with the histogram as the columns :code:`depth_0`, ..."
+        import pandas as pd
+        columns = self._asdict()
+        histogram = columns.pop('depth_histogram')
+        columns.update(("depth_{}".format(depth), histogram[:, depth])
+                       for depth in range(histogram.shape[1]))
+        return pd.DataFrame(columns)
+
+
+def _coverage_statistics(lengths, codes, start, stop, max_depth):
+    """
+    the statistics of a chunk of proteins, :code:`codes` is the index of the protein of each
+    range into :code:`lengths`, the ranges have to be inside of their protein
+    """
+
+    n = len(lengths)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    total = int(offsets[-1])
+
+    # depth of every residue of all proteins at once, via a difference array
+    first = offsets[codes] + start - 1
+    end = offsets[codes] + stop
+    depth = np.cumsum(np.bincount(first, minlength=total + 1)[:total] -
+                      np.bincount(end, minlength=total + 1)[:total])
+    protein = np.repeat(np.arange(n), lengths)
+
+    bins = max_depth + 1
+    histogram = np.bincount(protein * bins + np.minimum(depth, max_depth),
+                            minlength=n * bins).reshape(n, bins)
+    covered = lengths - histogram[:, 0]
+
+    # runs of covered and uncovered residues, which never continue into the next protein
+    is_covered = depth > 0
+    boundary = np.zeros(total + 1, dtype=bool)
+    boundary[offsets] = True
+    change = boundary[:total].copy()
+    change[1:] |= is_covered[1:] != is_covered[:-1]
+    run_start = np.flatnonzero(change)
+    run_length = np.diff(np.append(run_start, total))
+    run_protein = protein[run_start]
+    run_covered = is_covered[run_start]
+
+    segments = np.bincount(run_protein[run_covered], minlength=n)
+    longest_gap = np.zeros(n, dtype=np.int64)
+    np.maximum.at(longest_gap, run_protein[~run_covered], run_length[~run_covered])
+
+    percent = np.divide(100 * covered, lengths, out=np.zeros(n), where=lengths > 0)
+    return covered, percent, segments, longest_gap, histogram
+
+
+def _lengths(lengths):
+    "the sorted protein identifiers and their lengths"
+    if isinstance(lengths, Mapping):
+        lengths = lengths.items()
+    keys, values = [], []
+    for key, length in lengths:
+        keys.append(key)
+        values.append(length)
+    categories, index = np.unique(np.asarray(keys), return_index=True)
+    if len(categories) != len(keys):
+        raise ValueError("the protein identifiers has to be unique")
+    values = np.asarray(values, dtype=np.int64)[index]
+    if (values < 0).any():
+        raise ValueError("the protein lengths has to be >= 0")
+    return categories, values
+
+
+def _sample_ranges(peptides, categories, lengths):
+    "protein index into categories, start and stop of the ranges, sorted by protein"
+    protein = np.searchsorted(categories, peptides.categories)
+    known = protein < len(categories)
+    known[known] = categories[protein[known]] == peptides.categories[known]
+    if not known.all():
+        raise KeyError("no length for protein {!r}".format(
+            peptides.categories[np.flatnonzero(~known)[0]]))
+
+    codes = protein[peptides.codes]
+    start, stop = peptides.ranges.pos
+    # only the residues inside of the protein are counted
+    start = np.maximum(start.astype(np.int64), 1)
+    stop = np.minimum(stop.astype(np.int64), lengths[codes])
+    valid = stop >= start
+    order = np.argsort(codes[valid], kind='stable')
+    return codes[valid][order], start[valid][order], stop[valid][order]
+
+
+def iter_coverage_report(peptides: Union[KeyedRangeArray, Mapping], lengths: Union[Mapping,
+                         Iterable], *, max_depth: int=_DEFAULT_MAX_DEPTH,
+                         chunk_size: int=_DEFAULT_CHUNK_SIZE,
+                         processes: Union[int, None]=None) -> Iterator[CoverageReport]:
+    """
+    Coverage statistics of every protein in every sample, computed vectorized for
+    :code:`chunk_size` proteins at a time, optionally in parallel processes, and streamed as
+    one :code:`CoverageReport` per chunk in order (by sample and then by protein)
+
+    :param peptides: the ranges of one sample keyed by protein, or a mapping of sample name to
+                     such a :code:`KeyedRangeArray`
+    :param lengths: mapping of protein identifier to length, or an iterable of
+                    :code:`(identifier, length)` pairs, every protein is reported, also the
+                    ones without ranges
+    :param max_depth: the last bin of the depth histogram, which counts any deeper residue
+    :param chunk_size: the number of proteins per chunk
+    :param processes: the number of worker processes, compute in this process if :code:`None`
+
+    Ranges sticking out of their protein only count with the residues inside of it, ranges of
+    proteins without a length raise a :code:`KeyError`
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size({}) < 1".format(chunk_size))
+    if max_depth < 1:
+        raise ValueError("max_depth({}) < 1".format(max_depth))
+    samples = peptides if isinstance(peptides, Mapping) else {None: peptides}
+    categories, lengths = _lengths(lengths)
+
+    def chunks():
+        for sample, sample_peptides in samples.items():
+            codes, start, stop = _sample_ranges(sample_peptides, categories, lengths)
+            for first in range(0, len(categories), chunk_size):
+                last = min(first + chunk_size, len(categories))
+                lo, hi = np.searchsorted(codes, [first, last])
+                yield sample, first, last, (lengths[first:last], codes[lo:hi] - first,
+                                            start[lo:hi], stop[lo:hi], max_depth)
+
+    def report(sample, first, last, statistics):
+        column = np.empty(last - first, dtype=object)
+        column[:] = [sample] * (last - first)
+        return CoverageReport(column, categories[first:last], lengths[first:last], *statistics)
+
+    if processes is None:
+        for sample, first, last, arguments in chunks():
+            yield report(sample, first, last, _coverage_statistics(*arguments))
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        pending = collections.deque()
+        # at most two chunks per process are in flight, so the results can be streamed
+        for sample, first, last, arguments in chunks():
+            pending.append((sample, first, last, pool.submit(_coverage_statistics, *arguments)))
+            if len(pending) >= 2 * processes:
+                sample, first, last, future = pending.popleft()
+                yield report(sample, first, last, future.result())
+        while pending:
+            sample, first, last, future = pending.popleft()
+            yield report(sample, first, last, future.result())
+
+
+def coverage_report(peptides: Union[KeyedRangeArray, Mapping], lengths: Union[Mapping, Iterable],
+                    **kwargs) -> CoverageReport:
+    """
+    All of :code:`iter_coverage_report` in one :code:`CoverageReport`
+
+    .. code-block:: python
+
+        >>> peptides = KeyedRangeArray(["P1", "P1", "P1"], [(1, 4), (3, 6), (12, 15)])
+        >>> report = coverage_report({"A": peptides}, {"P1": 20, "P2": 5}, max_depth=2)
+        >>> report.protein, report.covered, report.segments, report.longest_gap
+        (array(['P1', 'P2'], dtype='<U2'), array([10,  0]), array([2, 0]), array([5, 5]))
+        >>> report.depth_histogram
+        array([[10,  8,  2],
+               [ 5,  0,  0]])
+    """
+
+    reports = list(iter_coverage_report(peptides, lengths, **kwargs))
+    if reports:
+        return CoverageReport.concatenate(reports)
+    # no proteins or no samples
+    empty = np.zeros(0, dtype=np.int64)
+    return CoverageReport(np.empty(0, dtype=object), np.empty(0, dtype=str), empty,
+                          *_coverage_statistics(empty, empty, empty, empty,
+                                                kwargs.get('max_depth', _DEFAULT_MAX_DEPTH)))
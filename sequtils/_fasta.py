@@ -0,0 +1,126 @@
+# core imports
+import collections
+import mmap
+import os
+from typing import Callable, Tuple, Union
+
+# local imports
+from ._range import SequenceRange
+from ._range_array import SequenceRangeArray
+
+
+class FastaBatch(collections.namedtuple("FastaBatch", ("headers", "ranges"))):
+    """
+    Columnar batch of FASTA records
+
+    :param headers: list of the headers (without :code:`>`)
+    :param ranges: :code:`SequenceRangeArray` with the coordinates and sequences
+    """
+
+    __slots__ = ()
+
+
+def _peptide_coordinates(header: str) -> Tuple[int, int]:
+    "parse :code:`start-stop` from the last :code:`|` field of e.g. :code:`sp|P01275|21-89`"
+    start, stop = header.rsplit('|', 1)[-1].split('-')
+    return int(start), int(stop)
+
+
+def _protein_coordinates(header: str) -> None:
+    "proteins have no coordinates in the header, they start at 1 and the stop is the length"
+    return None
+
+
+def _iter_records(path):
+    """
+    yield :code:`(header, sequence)` for each record of a FASTA file, the file is memory mapped,
+    so only the current record is held in memory, records without a sequence are skipped
+    """
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(b'>')
+            while pos != -1:
+                header_end = mm.find(b'\n', pos)
+                if header_end == -1:
+                    header_end = len(mm)
+                next_record = mm.find(b'\n>', header_end)
+                seq_end = len(mm) if next_record == -1 else next_record
+                header = mm[pos + 1:header_end].rstrip(b'\r').decode()
+                seq = mm[header_end + 1:seq_end].translate(None, b'\r\n\t ').decode('ascii')
+                if seq:
+                    yield header, seq
+                pos = -1 if next_record == -1 else next_record + 1
+
+
+def _read_records(path, coordinates):
+    for header, seq in _iter_records(path):
+        pos = coordinates(header)
+        if pos is None:
+            yield header, SequenceRange(1, seq=seq)
+        else:
+            yield header, SequenceRange(*pos, seq=seq)
+
+
+def _read_batches(path, coordinates, batch_size):
+    headers, starts, stops, seqs = [], [], [], []
+    for header, seq in _iter_records(path):
+        pos = coordinates(header)
+        start, stop = (1, len(seq)) if pos is None else pos
+        headers.append(header)
+        starts.append(start)
+        stops.append(stop)
+        seqs.append(seq)
+        if len(headers) == batch_size:
+            yield FastaBatch(headers, SequenceRangeArray(starts, stops, seq=seqs))
+            headers, starts, stops, seqs = [], [], [], []
+    if headers:
+        yield FastaBatch(headers, SequenceRangeArray(starts, stops, seq=seqs))
+
+
+def _read(path, coordinates, batch_size):
+    "the arguments are checked here, before the lazy reading starts"
+    if batch_size is None:
+        return _read_records(path, coordinates)
+    if batch_size < 1:
+        raise ValueError("batch_size({}) < 1".format(batch_size))
+    return _read_batches(path, coordinates, batch_size)
+
+
+def read_fasta(path: Union[str, os.PathLike], *, batch_size: Union[int, None]=None):
+    """
+    Lazily read a protein FASTA file, the file is memory mapped and only one record (or one
+    batch) is kept in memory, so multi-GB proteomes can be processed in constant memory
+
+    :param path: the FASTA file
+    :param batch_size: if :code:`None` yield :code:`(header, SequenceRange)` per protein,
+                       otherwise yield :code:`FastaBatch`'s with up to :code:`batch_size`
+                       proteins
+
+    Each protein is a :code:`SequenceRange` starting at 1 with :code:`seq` set to the protein
+    sequence, records without a sequence are skipped, see :code:`read_peptide_fasta` for files
+    with coordinates in the headers
+    """
+
+    return _read(path, _protein_coordinates, batch_size)
+
+
+def read_peptide_fasta(path: Union[str, os.PathLike], *, batch_size: Union[int, None]=None,
+                       coordinates: Callable[[str], Tuple[int, int]]=_peptide_coordinates):
+    """
+    Lazily read a peptide FASTA file, where the headers carry the :code:`start-stop`
+    coordinates of the peptide in its protein, like :code:`>sp|P01275|21-89`
+
+    :param path: the FASTA file
+    :param batch_size: if :code:`None` yield :code:`(header, SequenceRange)` per peptide,
+                       otherwise yield :code:`FastaBatch`'s with up to :code:`batch_size`
+                       peptides
+    :param coordinates: function that parses :code:`(start, stop)` from a header, the default
+                        reads the last :code:`|` separated field
+
+    Records without a sequence are skipped
+    """
+
+    return _read(path, coordinates, batch_size)
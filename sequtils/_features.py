@@ -0,0 +1,158 @@
+# core imports
+from collections.abc import Iterable, Mapping
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._keyed import KeyedPointArray
+from ._motif import _sequences
+from ._point_array import SequencePointArray, POSITION_DTYPE
+from ._range_array import SequenceRangeArray
+
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+# code of the positions outside of the protein
+PADDING = 0
+
+
+class EncodedProteins:
+    """
+    A set of proteins integer encoded once into one contiguous :code:`uint8` buffer, from which
+    windows of residues can be gathered for many sites at once, e.g. as features for machine
+    learning
+
+    :param proteins: mapping of protein identifier to sequence, or an iterable of
+                     :code:`(identifier, sequence)` pairs, e.g. from :code:`read_fasta`
+    :param alphabet: the residues, which are encoded as 1, 2, ..., :code:`len(alphabet)`, any
+                     other letter is encoded as :code:`len(alphabet) + 1` and positions outside
+                     of the protein are padded with :code:`PADDING` (0)
+
+    .. code-block:: python
+
+        >>> proteins = EncodedProteins({"P1": "ELVISLIVES", "P2": "MKW"})
+        >>> proteins.windows([2, 9], 2, keys=["P2", "P1"])
+        array([[ 0, 11,  9, 19,  0],
+               [ 8, 18,  4, 16,  0]], dtype=uint8)
+    """
+
+    def __init__(self, proteins: Union[Mapping, Iterable], *, alphabet: str=AMINO_ACIDS):
+        if len(alphabet) > 254:
+            raise ValueError("the alphabet can have at most 254 letters")
+        keys, sequences = _sequences(proteins)
+        categories, codes = np.unique(np.asarray(keys), return_inverse=True)
+        if len(categories) != len(keys):
+            raise ValueError("the protein identifiers has to be unique")
+
+        self._alphabet = alphabet
+        self._table = np.full(256, len(alphabet) + 1, dtype=np.uint8)
+        self._table[np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)] = \
+            np.arange(1, len(alphabet) + 1)
+
+        # the proteins are stored in the order of categories
+        order = np.argsort(codes.reshape(-1), kind='stable')
+        sequences = [sequences[i] for i in order]
+        self._categories = categories
+        self._lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+        self._offsets = np.concatenate([[0], np.cumsum(self._lengths)])
+        self._buffer = self.encode("".join(sequences))
+
+    def encode(self, sequence: str) -> np.ndarray:
+        "the codes of the residues in :code:`sequence`"
+        return self._table[np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)]
+
+    # properties, to make it read-only
+    @property
+    def alphabet(self) -> str:
+        return self._alphabet
+
+    @property
+    def categories(self) -> np.ndarray:
+        "the protein identifiers, sorted"
+        return self._categories
+
+    @property
+    def lengths(self) -> np.ndarray:
+        "the length of each protein in :code:`categories`"
+        return self._lengths
+
+    @property
+    def buffer(self) -> np.ndarray:
+        "the codes of all proteins concatenated in the order of :code:`categories`"
+        return self._buffer
+
+    def _codes(self, keys, n):
+        if keys is None:
+            if len(self._categories) != 1:
+                raise ValueError("keys are required, if there is more than one protein")
+            return np.zeros(n, dtype=np.intp)
+        keys = np.asarray(keys)
+        codes = np.searchsorted(self._categories, keys)
+        codes = np.minimum(codes, len(self._categories) - 1)
+        missing = self._categories[codes] != keys
+        if missing.any():
+            raise KeyError(keys[np.flatnonzero(missing)[0]])
+        return codes
+
+    def _centers(self, centers, keys):
+        if isinstance(centers, KeyedPointArray):
+            if keys is not None:
+                raise ValueError("keys cannot be given for a KeyedPointArray")
+            keys, centers = centers.key, centers.points
+        if not isinstance(centers, SequencePointArray):
+            centers = SequencePointArray(centers, validate=False)
+        return centers.pos.astype(np.int64), self._codes(keys, len(centers))
+
+    def windows(self, centers, window: int, *, keys: Union[Iterable, None]=None) -> np.ndarray:
+        """
+        Gather the residues :code:`center - window` to :code:`center + window` of each center
+        into a :code:`(len(centers), 2 * window + 1)` :code:`uint8` array, the residues are at
+        the positions of :code:`SequenceRange.from_center_and_window(center, window,
+        max_length=len(protein))` and the positions it clips away are :code:`PADDING`
+
+        :param centers: :code:`SequencePointArray`, iterable of point like objects or a
+                        :code:`KeyedPointArray`
+        :param window: extension to the left and right of each center
+        :param keys: the protein of each center, not needed for a :code:`KeyedPointArray` or
+                     if there is only one protein
+
+        A one-hot encoding is :code:`np.eye(len(alphabet) + 2, dtype=np.uint8)[windows]`
+        """
+
+        if window < 0:
+            raise ValueError("window({}) < 0".format(window))
+        centers, codes = self._centers(centers, keys)
+        index = centers[:, None] - 1 + np.arange(-window, window + 1)
+        inside = (index >= 0) & (index < self._lengths[codes][:, None])
+        index += self._offsets[codes][:, None]
+        if not len(self._buffer):
+            return np.zeros(index.shape, dtype=np.uint8)
+        return np.where(inside, self._buffer[np.where(inside, index, 0)], PADDING).astype(
+            np.uint8, copy=False)
+
+    def window_ranges(self, centers, window: int, *,
+                      keys: Union[Iterable, None]=None) -> SequenceRangeArray:
+        """
+        The clipped window of each center, the vectorized
+        :code:`SequenceRange.from_center_and_window(center, window, max_length=len(protein))`
+        """
+
+        centers, codes = self._centers(centers, keys)
+        start = np.maximum(1, centers - window)
+        stop = np.minimum(self._lengths[codes], centers + window)
+        return SequenceRangeArray._from_columns(start.astype(POSITION_DTYPE),
+                                                stop.astype(POSITION_DTYPE))
+
+    # dunders
+    def __len__(self):
+        return len(self._categories)
+
+    def __getitem__(self, key) -> np.ndarray:
+        "the codes of one protein"
+        code = int(self._codes([key], 1)[0])
+        return self._buffer[self._offsets[code]:self._offsets[code + 1]]
+
+    def __repr__(self):
+        return "{}(proteins={}, residues={})".format(type(self).__name__, len(self),
+                                                     len(self._buffer))
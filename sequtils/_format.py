@@ -0,0 +1,113 @@
+# core imports
+import io
+from typing import TextIO, Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._point_array import SequencePointArray
+from ._range import SequenceRange
+from ._range_array import SequenceRangeArray
+
+
+# small chunks keep the digit matrix in cache, which is faster than formatting all at once
+_DEFAULT_CHUNK_SIZE = 16384
+
+
+def _format_chunk_printf(start, stop, separator, line_end):
+    "format one chunk with a single :code:`%` operation, works for any integers"
+    single = start == stop
+    range_format = "%d" + separator + "%d" + line_end
+    fmt = "".join(np.where(single, "%d" + line_end, range_format).tolist())
+    keep = np.ones((len(start), 2), dtype=bool)
+    keep[:, 1] = ~single
+    args = np.stack([start, stop], axis=1)[keep]
+    return fmt % tuple(args.tolist())
+
+
+def _format_chunk(start, stop, separator, line_end):
+    """
+    format one chunk without creating python objects per row, each row is written as ascii
+    bytes into a fixed width matrix (:code:`start`, separator, :code:`stop`, line end) and a
+    mask selects the digits that are not leading zeros and drops separator and stop for ranges
+    of length 1
+    """
+
+    if not len(start):
+        return ""
+    if min(start.min(), stop.min()) < 0:
+        return _format_chunk_printf(start, stop, separator, line_end)
+
+    single = start == stop
+    separator = np.frombuffer(separator.encode(), dtype=np.uint8)
+    line_end = np.frombuffer(line_end.encode(), dtype=np.uint8)
+    width = len(str(int(max(start.max(), stop.max()))))
+    stop_offset = width + len(separator)
+    end_offset = stop_offset + width
+    chars = np.empty((len(start), end_offset + len(line_end)), dtype=np.uint8)
+    keep = np.empty(chars.shape, dtype=bool)
+    for offset, values in ((0, start), (stop_offset, stop)):
+        values = values.astype(np.uint32)
+        for column in range(offset + width - 1, offset - 1, -1):
+            quotient = values // 10
+            chars[:, column] = values - quotient * 10 + ord('0')
+            keep[:, column] = values > 0
+            values = quotient
+        # 0 is written as 0
+        keep[:, offset + width - 1] = True
+    chars[:, width:stop_offset] = separator
+    keep[:, width:stop_offset] = ~single[:, None]
+    keep[:, stop_offset:end_offset] &= ~single[:, None]
+    chars[:, end_offset:] = line_end
+    keep[:, end_offset:] = True
+    return chars[keep].tobytes().decode()
+
+
+def _chunks(collection, chunk_size):
+    if isinstance(collection, SequencePointArray):
+        start = stop = collection.pos
+    elif isinstance(collection, SequenceRangeArray):
+        start, stop = collection.pos
+    else:
+        raise TypeError("cannot format {}".format(type(collection)))
+    for offset in range(0, len(start), chunk_size):
+        yield start[offset:offset + chunk_size], stop[offset:offset + chunk_size]
+
+
+def write_ranges(collection: Union[SequencePointArray, SequenceRangeArray], file: TextIO, *,
+                 line_end: str="\n", chunk_size: int=_DEFAULT_CHUNK_SIZE):
+    """
+    Write one :code:`str(SequenceRange)` per line, i.e. :code:`start:stop` or just
+    :code:`start` for ranges of length 1, to a text file, the formatting is done in chunks of
+    :code:`chunk_size` rows, so memory stays bounded
+
+    :param collection: :code:`SequenceRangeArray` or :code:`SequencePointArray`
+    :param file: text file object (anything with a :code:`write` method)
+    :param line_end: written after every range
+
+    This is many times faster than calling :code:`str` on each :code:`SequenceRange`, because
+    no python objects are created per row
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size({}) < 1".format(chunk_size))
+    for start, stop in _chunks(collection, chunk_size):
+        file.write(_format_chunk(start, stop, SequenceRange._str_separator, line_end))
+
+
+def format_ranges(collection: Union[SequencePointArray, SequenceRangeArray], *,
+                  line_end: str="\n") -> str:
+    """
+    Format all ranges into one string, see :code:`write_ranges`
+
+    .. code-block:: python
+
+        >>> print(format_ranges(SequenceRangeArray([(1, 5), (7, 7)])), end="")
+        1:5
+        7
+    """
+
+    buffer = io.StringIO()
+    write_ranges(collection, buffer, line_end=line_end)
+    return buffer.getvalue()
@@ -0,0 +1,305 @@
+# core imports
+import itertools
+import random
+from collections.abc import Iterable
+from typing import Iterator, List, Union
+
+# local imports
+from ._range import SequenceRange, range_types
+from ._range_array import SequenceRangeArray
+
+
+class _Node:
+    __slots__ = ('key', 'range', 'priority', 'left', 'right', 'max_stop')
+
+    def __init__(self, key, sequence_range, priority):
+        self.key = key
+        self.range = sequence_range
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.max_stop = key[1]
+
+
+def _update(node):
+    max_stop = node.key[1]
+    if node.left is not None and node.left.max_stop > max_stop:
+        max_stop = node.left.max_stop
+    if node.right is not None and node.right.max_stop > max_stop:
+        max_stop = node.right.max_stop
+    node.max_stop = max_stop
+
+
+def _split(node, key):
+    "split a treap into the nodes with keys :code:`< key` and :code:`>= key`"
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        _update(node)
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    "merge two treaps, where all keys in :code:`left` are smaller than the keys in :code:`right`"
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _insert(node, new):
+    "insert :code:`new` into the treap rooted at :code:`node`, returns the new root"
+    if node is None or new.priority > node.priority:
+        new.left, new.right = _split(node, new.key)
+        _update(new)
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    _update(node)
+    return node
+
+
+def _delete(node, key):
+    "delete the node with :code:`key` from the treap rooted at :code:`node`, returns the new root"
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    else:
+        node.right = _delete(node.right, key)
+    _update(node)
+    return node
+
+
+class _CoverageTree:
+    r"""
+    segment tree over the positions that counts how many ranges cover each node completely,
+    which gives the number of covered positions at the root in :math:`O(\log n)` per update,
+    it doubles in size when a range stops after the last position
+    """
+
+    def __init__(self, size=1024):
+        self._size = size
+        self._count = [0] * (2 * size)
+        self._covered = [0] * (2 * size)
+
+    @property
+    def covered(self):
+        return self._covered[1]
+
+    def fits(self, stop):
+        return stop <= self._size
+
+    def add(self, start, stop, delta):
+        "add :code:`delta` to the cover count of the positions :code:`start` to :code:`stop`"
+        # bottom up over the nodes that exactly cover the positions, then update their parents
+        first, last = start - 1 + self._size, stop + self._size
+        left, right, width = first, last, 1
+        while left < right:
+            if left & 1:
+                self._apply(left, width, delta)
+                left += 1
+            if right & 1:
+                right -= 1
+                self._apply(right, width, delta)
+            left, right, width = left >> 1, right >> 1, width << 1
+        self._update_parents(first)
+        self._update_parents(last - 1)
+
+    def _apply(self, node, width, delta):
+        self._count[node] += delta
+        if self._count[node]:
+            self._covered[node] = width
+        elif node >= self._size:
+            self._covered[node] = 0
+        else:
+            self._covered[node] = self._covered[2 * node] + self._covered[2 * node + 1]
+
+    def _update_parents(self, node):
+        node >>= 1
+        while node:
+            # nodes with a count are fully covered regardless of their children
+            if not self._count[node]:
+                self._covered[node] = self._covered[2 * node] + self._covered[2 * node + 1]
+            node >>= 1
+
+
+class RangeIndex:
+    r"""
+    Mutable index of :code:`SequenceRange`'s, that can be updated one range at a time, for
+    streaming data where rebuilding a :code:`SequenceRangeArray` after every batch is too slow
+
+    The ranges are kept in a randomized balanced search tree (treap) ordered by position and
+    augmented with the maximum stop of each subtree, and the covered positions are counted in a
+    segment tree, so :code:`add`, :code:`remove` and :code:`coverage` are :math:`O(\log n)`
+    and :code:`overlapping` is :math:`O(\log n + k)` for :code:`k` results
+
+    :param ranges: the initial ranges
+
+    .. code-block:: python
+
+        >>> index = RangeIndex([(1, 10), (5, 20)])
+        >>> index.coverage
+        20
+        >>> index.add((30, 35))
+        >>> [str(sr) for sr in index.overlapping(8, 32)]
+        ['1:10', '5:20', '30:35']
+        >>> index.remove((5, 20))
+        >>> index.coverage
+        16
+    """
+
+    def __init__(self, ranges: Iterable=()):
+        self._root = None
+        self._length = 0
+        self._serial = itertools.count()
+        self._random = random.Random(0)
+        self._coverage = _CoverageTree()
+        self.update(ranges)
+
+    @staticmethod
+    def _as_range(sequence_range):
+        if isinstance(sequence_range, SequenceRange):
+            sequence_range.validate()
+            return sequence_range
+        return SequenceRange(sequence_range)
+
+    # updates
+    def add(self, sequence_range: range_types):
+        "add a range, duplicates are kept, like in a list"
+        sequence_range = self._as_range(sequence_range)
+        start, stop = sequence_range.pos
+        if not self._coverage.fits(stop):
+            self._grow(stop)
+        self._coverage.add(start, stop, 1)
+
+        node = _Node((start, stop, next(self._serial)), sequence_range, self._random.random())
+        self._root = _insert(self._root, node)
+        self._length += 1
+
+    def update(self, ranges: Iterable):
+        "add several ranges"
+        if isinstance(ranges, SequenceRangeArray):
+            ranges.validate()
+        for sequence_range in ranges:
+            self.add(sequence_range)
+
+    def remove(self, sequence_range: range_types):
+        """
+        remove one range equal to :code:`sequence_range` (position and :code:`seq`), raises a
+        :code:`KeyError` if there is no such range
+        """
+
+        sequence_range = SequenceRange(sequence_range, validate=False)
+        start, stop = sequence_range.pos
+        for node in self._nodes_between((start, stop), (start, stop + 1)):
+            if node.range == sequence_range:
+                break
+        else:
+            raise KeyError(sequence_range)
+
+        self._root = _delete(self._root, node.key)
+        self._length -= 1
+        self._coverage.add(start, stop, -1)
+
+    def discard(self, sequence_range: range_types):
+        "remove one range equal to :code:`sequence_range` if present"
+        try:
+            self.remove(sequence_range)
+        except KeyError:
+            pass
+
+    def _grow(self, stop):
+        size = self._coverage._size
+        while size < stop:
+            size *= 2
+        self._coverage = _CoverageTree(size)
+        for sequence_range in self:
+            self._coverage.add(*sequence_range.pos, 1)
+
+    # queries
+    @property
+    def coverage(self) -> int:
+        "the number of positions covered by at least one range"
+        return self._coverage.covered
+
+    def overlapping(self, start: int, stop: Union[int, None]=None) -> List[SequenceRange]:
+        """
+        the ranges that overlap :code:`start` to :code:`stop` sorted by position
+
+        :param start: first position of the query
+        :param stop: last position of the query, a single position if :code:`None`
+        """
+
+        stop = start if stop is None else stop
+        result = []
+        stack, node = [], self._root
+        while stack or node is not None:
+            # nothing in a subtree overlaps, if all of it stops before the query starts
+            while node is not None and node.max_stop >= start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if node.key[0] > stop:
+                # the remaining nodes start even later
+                break
+            if node.key[1] >= start:
+                result.append(node.range)
+            node = node.right
+        return result
+
+    def _nodes_between(self, low, high) -> Iterator[_Node]:
+        "in order iteration over the nodes with :code:`low <= key < high`"
+        stack, node = [], self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left if node.key > low else None
+            node = stack.pop()
+            if node.key >= high:
+                return
+            if node.key >= low:
+                yield node
+            node = node.right
+
+    def to_array(self) -> SequenceRangeArray:
+        "the ranges sorted by position as a :code:`SequenceRangeArray`"
+        return SequenceRangeArray(list(self), validate=False)
+
+    # dunders
+    def __len__(self):
+        return self._length
+
+    def __iter__(self) -> Iterator[SequenceRange]:
+        "the ranges sorted by position"
+        for node in self._nodes_between((), (float('inf'),)):
+            yield node.range
+
+    def __contains__(self, sequence_range):
+        try:
+            sequence_range = SequenceRange(sequence_range, validate=False)
+        except (TypeError, ValueError):
+            return False
+        start, stop = sequence_range.pos
+        return any(node.range == sequence_range
+                   for node in self._nodes_between((start, stop), (start, stop + 1)))
+
+    def __repr__(self):
+        return "{}(length={}, coverage={})".format(type(self).__name__, len(self), self.coverage)
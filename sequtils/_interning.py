@@ -0,0 +1,128 @@
+# core imports
+import threading
+from collections.abc import Iterable
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+
+class SequenceStore:
+    """
+    Interning store for sequences (e.g. the :code:`seq` of peptides), every distinct sequence
+    is kept once and numbered with an integer id in the order they are added
+
+    Ranges with interned sequences share one :code:`str` per distinct sequence instead of a
+    copy per range, and :code:`==` between two interned sequences is an identity check, in bulk
+    the integer ids can be compared, hashed, sorted and joined instead of the strings, see
+    :code:`SequenceRangeArray.seq_ids`
+
+    Adding sequences is thread safe, so a store (e.g. the global one) can be shared by threads
+
+    .. code-block:: python
+
+        >>> store = SequenceStore()
+        >>> store.ids(["ELVIS", None, "LIVES", "ELVIS"])
+        array([ 0, -1,  1,  0])
+        >>> store.sequences([1, -1, 0])
+        array(['LIVES', None, 'ELVIS'], dtype=object)
+        >>> store.intern("".join(["ELV", "IS"])) is store[0]
+        True
+    """
+
+    def __init__(self, sequences: Iterable=()):
+        self._ids = {}
+        self._sequences = []
+        self._lock = threading.Lock()
+        # object array of the sequences with None at the end (for id -1), rebuilt when the store
+        # has grown
+        self._lookup = None
+        for sequence in sequences:
+            self.id(sequence)
+
+    def id(self, sequence: str) -> int:
+        "the id of :code:`sequence`, which is added if it is new"
+        sequence_id = self._ids.get(sequence)
+        if sequence_id is None:
+            if not isinstance(sequence, str):
+                raise TypeError("only str can be interned, not {}".format(type(sequence)))
+            with self._lock:
+                # another thread might have added it in the meantime
+                sequence_id = self._ids.get(sequence)
+                if sequence_id is None:
+                    # the sequence is stored before its id is visible to the lock free path
+                    self._sequences.append(sequence)
+                    sequence_id = self._ids[sequence] = len(self._sequences) - 1
+        return sequence_id
+
+    def intern(self, sequence: Union[str, None]) -> Union[str, None]:
+        "the stored instance equal to :code:`sequence`, which is added if it is new"
+        if sequence is None:
+            return None
+        return self._sequences[self.id(sequence)]
+
+    def ids(self, sequences: Iterable) -> np.ndarray:
+        """
+        the ids of many sequences (-1 for :code:`None`), new sequences are added in the order
+        they appear
+        """
+
+        get = self._ids.get
+
+        def lookup(sequence):
+            if sequence is None:
+                return -1
+            sequence_id = get(sequence)
+            return self.id(sequence) if sequence_id is None else sequence_id
+
+        # one dict lookup per row, str caches its hash, so this is faster than sorting
+        if not hasattr(sequences, '__len__'):
+            sequences = list(sequences)
+        return np.fromiter(map(lookup, sequences), dtype=np.int64, count=len(sequences))
+
+    def sequences(self, ids) -> np.ndarray:
+        "the sequences of many ids as object array (:code:`None` for -1)"
+        lookup = self._lookup
+        if lookup is None or len(lookup) <= len(self._sequences):
+            sequences = self._sequences[:]
+            lookup = np.empty(len(sequences) + 1, dtype=object)
+            lookup[:-1] = sequences
+            self._lookup = lookup
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) and (ids.min() < -1 or ids.max() >= len(lookup) - 1):
+            raise IndexError("sequence ids has to be -1 or in [0, {})".format(len(lookup) - 1))
+        return lookup[ids]
+
+    # dunders
+    def __len__(self):
+        return len(self._sequences)
+
+    def __getitem__(self, sequence_id: int) -> str:
+        "the sequence of an id"
+        if sequence_id < 0:
+            raise IndexError("sequence id {} < 0".format(sequence_id))
+        return self._sequences[sequence_id]
+
+    def __contains__(self, sequence):
+        return sequence in self._ids
+
+    def __iter__(self):
+        return iter(self._sequences)
+
+    def __repr__(self):
+        return "{}(sequences={})".format(type(self).__name__, len(self))
+
+    def __getstate__(self):
+        return self._sequences
+
+    def __setstate__(self, sequences):
+        self.__init__(sequences)
+
+
+# the store used when none is given
+_global_store = SequenceStore()
+
+
+def global_sequence_store() -> SequenceStore:
+    "the process wide :code:`SequenceStore`, used by the :code:`intern` methods by default"
+    return _global_store
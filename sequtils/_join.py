@@ -0,0 +1,393 @@
+# core imports
+import collections
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._kernels import _expand, _factorize, _keyed_positions, _searchsorted
+from ._point_array import SequencePointArray
+from ._range_array import SequenceRangeArray
+
+
+class PointRangeJoin(collections.namedtuple("PointRangeJoin", ("point", "range"))):
+    """
+    Matching pairs of a join, :code:`point[i]` is inside :code:`range[i]`, both are integer
+    indexes into the collections given to the join
+    """
+
+    __slots__ = ()
+
+
+class OverlapJoin(collections.namedtuple("OverlapJoin", ("left", "right", "overlap"))):
+    """
+    Overlapping pairs of a join, :code:`left[i]` overlaps :code:`right[i]`, both are integer
+    indexes into the collections given to the join, :code:`overlap` is a
+    :code:`SequenceRangeArray` with the intersection of each pair, thus :code:`overlap.length`
+    is the overlap length
+    """
+
+    __slots__ = ()
+
+
+def _as_points(points):
+    if isinstance(points, SequencePointArray):
+        return points
+    return SequencePointArray(points, validate=False)
+
+
+def _as_ranges(ranges):
+    if isinstance(ranges, SequenceRangeArray):
+        return ranges
+    return SequenceRangeArray(ranges, validate=False)
+
+
+def _join_keys(left_keys, right_keys):
+    "shared integer codes for the keys of the two sides of a join or (None, None)"
+    if left_keys is None and right_keys is None:
+        return None, None
+    if left_keys is None or right_keys is None:
+        raise ValueError("keys has to be given for both or neither side of the join")
+    _, (left_codes, right_codes) = _factorize(left_keys, right_keys)
+    return left_codes, right_codes
+
+
+def point_range_pairs(points, ranges, *, point_keys=None, range_keys=None) -> PointRangeJoin:
+    r"""
+    All (point, range) pairs where the point is inside the range, computed with a sorted merge
+    in :math:`O((n + m)\log(n + m) + k)` instead of :code:`SequenceRange._contains` in nested
+    loops
+
+    :param points: :code:`SequencePointArray` or iterable of point like objects
+    :param ranges: :code:`SequenceRangeArray` or iterable of range like objects
+    :param point_keys: optional sequence identifier (e.g protein accession) of each point
+    :param range_keys: optional sequence identifier of each range, points only match
+                       ranges with the same key
+
+    The pairs are ordered by range and then by point position
+
+    .. code-block:: python
+
+        >>> sites = SequencePointArray([7, 2, 12])
+        >>> peptides = SequenceRangeArray([(1, 5), (6, 9), (5, 12)])
+        >>> point_range_pairs(sites, peptides)
+        PointRangeJoin(point=array([1, 0, 0, 2]), range=array([0, 1, 2, 2]))
+
+        # with keys, the site in P2 is not inside the peptide of P1
+        >>> point_range_pairs([3, 3], [(1, 5)], point_keys=["P1", "P2"], range_keys=["P1"])
+        PointRangeJoin(point=array([0]), range=array([0]))
+    """
+
+    points, ranges = _as_points(points), _as_ranges(ranges)
+    point_codes, range_codes = _join_keys(point_keys, range_keys)
+    return _point_range_pairs(points, ranges, point_codes, range_codes)
+
+
+def _point_range_pairs(points, ranges, point_codes, range_codes):
+    point_pos = _keyed_positions(point_codes, points.pos)
+    order = np.argsort(point_pos, kind='stable')
+    sorted_pos = point_pos[order]
+
+    start, stop = ranges.pos
+    lo = _searchsorted(sorted_pos, _keyed_positions(range_codes, start), side='left')
+    hi = _searchsorted(sorted_pos, _keyed_positions(range_codes, stop), side='right')
+    range_index, sorted_index = _expand(lo, np.maximum(lo, hi))
+    return PointRangeJoin(order[sorted_index], range_index)
+
+
+def point_range_counts(points, ranges, *, point_keys=None, range_keys=None) -> np.ndarray:
+    r"""
+    The number of ranges covering each point, see :code:`point_range_pairs`, this runs in
+    :math:`O((n + m)\log(m))` regardless of how many pairs there are, invalid ranges
+    (stop < start) are ignored
+
+    .. code-block:: python
+
+        >>> point_range_counts([7, 2, 12, 20], [(1, 5), (6, 9), (5, 12)])
+        array([2, 1, 1, 0])
+    """
+
+    points, ranges = _as_points(points), _as_ranges(ranges)
+    point_codes, range_codes = _join_keys(point_keys, range_keys)
+    return _point_range_counts(points, ranges, point_codes, range_codes)
+
+
+def _point_range_counts(points, ranges, point_codes, range_codes):
+    start, stop = ranges.pos
+    valid = stop >= start
+    start = np.sort(_keyed_positions(range_codes, start)[valid])
+    stop = np.sort(_keyed_positions(range_codes, stop)[valid])
+    point_pos = _keyed_positions(point_codes, points.pos)
+    order = np.argsort(point_pos, kind='stable')
+    sorted_pos = point_pos[order]
+
+    # started before or at the point minus stopped before the point
+    counts = np.empty(len(point_pos), dtype=np.intp)
+    counts[order] = (np.searchsorted(start, sorted_pos, side='right') -
+                     np.searchsorted(stop, sorted_pos, side='left'))
+    return counts
+
+
+def _overlap_indexes(left, right, min_overlap, left_codes, right_codes):
+    """
+    (left, right) index pairs of all overlapping ranges, split in two disjoint cases that can
+    both be found by a binary search in the starts of the other side:
+
+    #. the right range starts inside the left range
+    #. the left range starts inside the right range (but not at the same position)
+    """
+
+    left_start = _keyed_positions(left_codes, left.pos[0])
+    left_stop = _keyed_positions(left_codes, left.pos[1])
+    right_start = _keyed_positions(right_codes, right.pos[0])
+    right_stop = _keyed_positions(right_codes, right.pos[1])
+    shrink = min_overlap - 1
+
+    right_order = np.argsort(right_start, kind='stable')
+    sorted_start = right_start[right_order]
+    lo = _searchsorted(sorted_start, left_start, side='left')
+    hi = _searchsorted(sorted_start, left_stop - shrink, side='right')
+    left_a, sorted_a = _expand(lo, np.maximum(lo, hi))
+    right_a = right_order[sorted_a]
+
+    left_order = np.argsort(left_start, kind='stable')
+    sorted_start = left_start[left_order]
+    lo = _searchsorted(sorted_start, right_start, side='right')
+    hi = _searchsorted(sorted_start, right_stop - shrink, side='right')
+    right_b, sorted_b = _expand(lo, np.maximum(lo, hi))
+    left_b = left_order[sorted_b]
+
+    left_index = np.concatenate([left_a, left_b])
+    right_index = np.concatenate([right_a, right_b])
+    if min_overlap > 1:
+        keep = _overlap_length(left, right, left_index, right_index) >= min_overlap
+        left_index, right_index = left_index[keep], right_index[keep]
+    return left_index, right_index
+
+
+def _overlap_length(left, right, left_index, right_index):
+    start = np.maximum(left.pos[0][left_index], right.pos[0][right_index])
+    stop = np.minimum(left.pos[1][left_index], right.pos[1][right_index])
+    return stop - start + 1
+
+
+def _overlap_join(left, right, left_index, right_index):
+    start = np.maximum(left.pos[0][left_index], right.pos[0][right_index])
+    stop = np.minimum(left.pos[1][left_index], right.pos[1][right_index])
+    overlap = SequenceRangeArray._from_columns(start, stop)
+    return OverlapJoin(left_index, right_index, overlap)
+
+
+def range_overlap_pairs(left, right, *, min_overlap: int=1, left_keys=None,
+                        right_keys=None) -> OverlapJoin:
+    r"""
+    All pairs of overlapping ranges together with their intersection, computed with a sorted
+    sweep in :math:`O((n + m)\log(n + m) + k)`
+
+    :param left: :code:`SequenceRangeArray` or iterable of range like objects
+    :param right: :code:`SequenceRangeArray` or iterable of range like objects
+    :param min_overlap: only report pairs sharing at least this many residues
+    :param left_keys: optional sequence identifier (e.g protein accession) of each left range
+    :param right_keys: optional sequence identifier of each right range, ranges only overlap
+                       ranges with the same key
+
+    The pairs are not sorted, use e.g. :code:`np.argsort(join.left)` to group them by left range
+
+    .. code-block:: python
+
+        # protein:     ELVISLIVES
+        # - positions: 1234567890
+        # peptides:    -----            ELVIS
+        #                   ----        LIVE
+        # domain:         -----         ISLIV
+        >>> peptides = SequenceRangeArray([(1, 5), (6, 9)])
+        >>> domains = SequenceRangeArray([(4, 8)])
+        >>> join = range_overlap_pairs(peptides, domains)
+        >>> join.left, join.right
+        (array([0, 1]), array([0, 0]))
+        >>> list(join.overlap), join.overlap.length
+        ([SequenceRange(4, 5, seq=None), SequenceRange(6, 8, seq=None)], array([2, 3], dtype=int32))
+
+        >>> range_overlap_pairs(peptides, domains, min_overlap=3).left
+        array([1])
+    """
+
+    left, right = _as_ranges(left), _as_ranges(right)
+    if min_overlap < 1:
+        raise ValueError("min_overlap({}) < 1".format(min_overlap))
+    left_codes, right_codes = _join_keys(left_keys, right_keys)
+    left_index, right_index = _overlap_indexes(left, right, min_overlap, left_codes, right_codes)
+    return _overlap_join(left, right, left_index, right_index)
+
+
+def iter_range_overlaps(left, right, *, batch_size: int=100000, min_overlap: int=1,
+                        left_keys=None, right_keys=None):
+    """
+    Stream the result of :code:`range_overlap_pairs` as :code:`OverlapJoin` batches of at most
+    :code:`batch_size` pairs, the intersections are only materialized one batch at a time
+
+    .. code-block:: python
+
+        >>> batches = iter_range_overlaps([(1, 5), (6, 9)], [(4, 8)], batch_size=1)
+        >>> [str(batch.overlap[0]) for batch in batches]
+        ['4:5', '6:8']
+    """
+
+    left, right = _as_ranges(left), _as_ranges(right)
+    if min_overlap < 1:
+        raise ValueError("min_overlap({}) < 1".format(min_overlap))
+    left_codes, right_codes = _join_keys(left_keys, right_keys)
+    left_index, right_index = _overlap_indexes(left, right, min_overlap, left_codes, right_codes)
+    for offset in range(0, len(left_index), batch_size):
+        batch = slice(offset, offset + batch_size)
+        yield _overlap_join(left, right, left_index[batch], right_index[batch])
+
+
+class NearestJoin(collections.namedtuple("NearestJoin", ("range", "distance"))):
+    """
+    The nearest range of each query, :code:`range[i]` is an integer index into the ranges given
+    to the query or -1 if there is no range (with the same key), :code:`distance[i]` is the
+    signed distance from the range to the query: positive if the query is after the range,
+    negative if it is before and 0 if they overlap or if there is no range
+    """
+
+    __slots__ = ()
+
+
+def _as_queries(queries):
+    "start and stop positions of points or ranges"
+    if isinstance(queries, SequenceRangeArray):
+        return queries.pos
+    points = _as_points(queries)
+    return points.pos, points.pos
+
+
+def _sorted_valid(ranges, range_codes, positions):
+    "indexes of the valid ranges sorted by the keyed :code:`positions` and their codes"
+    start, stop = ranges.pos
+    valid = np.flatnonzero(stop >= start)
+    codes = None if range_codes is None else np.asarray(range_codes)[valid]
+    order = np.argsort(_keyed_positions(codes, positions[valid]), kind='stable')
+    return valid[order], None if codes is None else codes[order]
+
+
+def _same_key(codes, index, query_codes, found):
+    if codes is None:
+        return found
+    return found & (codes[np.minimum(index, len(codes) - 1)] == query_codes)
+
+
+def _choose(up, up_distance, has_up, down, down_distance, has_down):
+    "the upstream or downstream candidate, whichever is nearer, upstream on ties"
+    pick_up = has_up & (~has_down | (up_distance <= -down_distance))
+    pick_down = ~pick_up & has_down
+    index = np.full(len(up), -1, dtype=np.intp)
+    index[pick_up], index[pick_down] = up[pick_up], down[pick_down]
+    distance = np.zeros(len(up), dtype=np.int64)
+    distance[pick_up], distance[pick_down] = up_distance[pick_up], down_distance[pick_down]
+    return index, distance
+
+
+def _nearest_range(query_start, query_stop, ranges, query_codes, range_codes):
+    order, codes = _sorted_valid(ranges, range_codes, ranges.pos[0])
+    start = _keyed_positions(codes, ranges.pos[0][order])
+    stop = _keyed_positions(codes, ranges.pos[1][order])
+    query_start = _keyed_positions(query_codes, query_start)
+    query_stop = _keyed_positions(query_codes, query_stop)
+    if not len(order):
+        return NearestJoin(np.full(len(query_start), -1, dtype=np.intp),
+                           np.zeros(len(query_start), dtype=np.int64))
+
+    # of the ranges starting before the end of the query, the one reaching furthest either
+    # overlaps the query or is the nearest range before it
+    furthest = np.maximum.accumulate(stop)
+    furthest_index = np.maximum.accumulate(np.where(stop == furthest, np.arange(len(stop)), 0))
+    before = _searchsorted(start, query_stop, side='right')
+    up = furthest_index[np.maximum(before - 1, 0)]
+    has_up = _same_key(codes, up, query_codes, before > 0)
+    up_distance = np.maximum(query_start - stop[up], 0)
+
+    # the first range starting after the query
+    down = before
+    has_down = _same_key(codes, down, query_codes, down < len(start))
+    down_distance = query_stop - start[np.minimum(down, len(start) - 1)]
+
+    index, distance = _choose(up, up_distance, has_up, down, down_distance, has_down)
+    return NearestJoin(np.where(index >= 0, order[index], -1), distance)
+
+
+def nearest_range(queries, ranges, *, query_keys=None, range_keys=None) -> NearestJoin:
+    r"""
+    The nearest range to each point or range, e.g. the distance from mutations to the nearest
+    domain, with a prefix maximum over the ranges sorted by start and binary searches in
+    :math:`O((n + m)\log(m))` instead of arithmetic between all pairs
+
+    :param queries: :code:`SequencePointArray`, iterable of point like objects or
+                    :code:`SequenceRangeArray`
+    :param ranges: :code:`SequenceRangeArray` or iterable of range like objects, invalid
+                   ranges (stop < start) are ignored
+    :param query_keys: optional sequence identifier (e.g protein accession) of each query
+    :param range_keys: optional sequence identifier of each range, queries only find ranges
+                       with the same key
+
+    A query overlapping several ranges finds one of them (distance 0), at equal distance the
+    range before the query is preferred
+
+    .. code-block:: python
+
+        >>> domains = SequenceRangeArray([(10, 20), (40, 60)])
+        >>> nearest_range([5, 15, 27, 33], domains)
+        NearestJoin(range=array([0, 0, 0, 1]), distance=array([-5,  0,  7, -7]))
+        >>> nearest_range(SequenceRangeArray([(22, 30)]), domains).distance
+        array([2])
+    """
+
+    query_start, query_stop = _as_queries(queries)
+    query_codes, range_codes = _join_keys(query_keys, range_keys)
+    return _nearest_range(query_start, query_stop, _as_ranges(ranges), query_codes, range_codes)
+
+
+def _nearest_terminus(points, ranges, terminus, point_codes, range_codes):
+    if terminus not in ('start', 'stop'):
+        raise ValueError("terminus has to be one of ('start', 'stop')")
+    positions = ranges.pos[('start', 'stop').index(terminus)]
+    order, codes = _sorted_valid(ranges, range_codes, positions)
+    termini = _keyed_positions(codes, positions[order])
+    point_pos = _keyed_positions(point_codes, points.pos)
+    if not len(order):
+        return NearestJoin(np.full(len(point_pos), -1, dtype=np.intp),
+                           np.zeros(len(point_pos), dtype=np.int64))
+
+    # the termini on both sides of the point
+    down = _searchsorted(termini, point_pos, side='left')
+    up = down - 1
+    has_up = _same_key(codes, np.maximum(up, 0), point_codes, up >= 0)
+    has_down = _same_key(codes, down, point_codes, down < len(termini))
+    up_distance = point_pos - termini[np.maximum(up, 0)]
+    down_distance = point_pos - termini[np.minimum(down, len(termini) - 1)]
+
+    index, distance = _choose(up, up_distance, has_up, down, down_distance, has_down)
+    return NearestJoin(np.where(index >= 0, order[index], -1), distance)
+
+
+def nearest_terminus(points, ranges, terminus: str='start', *, point_keys=None,
+                     range_keys=None) -> NearestJoin:
+    r"""
+    The range with the nearest start (or stop) to each point, e.g. the closest peptide terminus
+    to each PTM site, with binary searches in :math:`O((n + m)\log(m))`, the distance is
+    :code:`point - terminus`, see :code:`nearest_range` for the arguments
+
+    :param terminus: :code:`'start'` or :code:`'stop'`
+
+    .. code-block:: python
+
+        >>> peptides = SequenceRangeArray([(1, 8), (12, 20)])
+        >>> nearest_terminus([3, 10, 17], peptides, 'start')
+        NearestJoin(range=array([0, 1, 1]), distance=array([ 2, -2,  5]))
+        >>> nearest_terminus([3, 10, 17], peptides, 'stop').distance
+        array([-5,  2, -3])
+    """
+
+    point_codes, range_codes = _join_keys(point_keys, range_keys)
+    return _nearest_terminus(_as_points(points), _as_ranges(ranges), terminus, point_codes,
+                             range_codes)
@@ -0,0 +1,142 @@
+# vectorized numpy helpers shared by the columnar algorithms (joins, coverage, etc.)
+
+# 3rd party imports
+import numpy as np
+
+
+# positions of different keys (e.g. proteins) are separated by this offset when they are
+# combined into one sortable int64 coordinate, see _keyed_positions
+_KEY_SHIFT = 32
+
+
+def _expand(lo, hi):
+    """
+    for each row i enumerate the integers in :code:`[lo[i], hi[i])`, returns the arrays
+    :code:`(row, value)` where :code:`row` is the owning row of each value
+
+    .. code-block:: python
+
+        >>> _expand(np.array([2, 0, 5]), np.array([4, 0, 6]))
+        (array([0, 0, 2]), array([2, 3, 5]))
+    """
+
+    counts = hi - lo
+    row = np.repeat(np.arange(len(lo)), counts)
+    group_offset = np.cumsum(counts) - counts
+    value = np.arange(len(row)) - np.repeat(group_offset - lo, counts)
+    return row, value
+
+
+def _searchsorted(sorted_values, queries, side='left'):
+    """
+    same as :code:`np.searchsorted`, but the queries are sorted first, which is several times
+    faster for large unsorted queries because the binary searches become cache friendly
+    """
+
+    queries = np.asarray(queries)
+    order = np.argsort(queries, kind='stable')
+    result = np.empty(len(queries), dtype=np.intp)
+    result[order] = np.searchsorted(sorted_values, queries[order], side=side)
+    return result
+
+
+def _factorize(*keys):
+    """
+    dictionary encode several key arrays with a shared dictionary, returns the categories
+    and one integer code array per key array
+    """
+
+    keys = [np.asarray(key) for key in keys]
+    categories, codes = np.unique(np.concatenate(keys), return_inverse=True)
+    splits = np.cumsum([len(key) for key in keys])[:-1]
+    return categories, np.split(codes.reshape(-1), splits)
+
+
+def _keyed_positions(codes, pos):
+    """
+    combine key codes and positions into one int64 coordinate, which sorts by key and then by
+    position, positions of different keys can thus never overlap or be adjacent
+    """
+
+    pos = np.asarray(pos, dtype=np.int64)
+    if codes is None:
+        return pos
+    return (np.asarray(codes, dtype=np.int64) << _KEY_SHIFT) + pos
+
+
+def _merge_intervals(start, stop):
+    """
+    merge overlapping and adjacent intervals (inclusive stop), returns the merged
+    :code:`(start, stop)` arrays sorted by start, invalid intervals (stop < start) are ignored
+
+    .. code-block:: python
+
+        >>> _merge_intervals(np.array([5, 1, 3, 10]), np.array([8, 2, 3, 12]))
+        (array([ 1,  5, 10]), array([ 3,  8, 12]))
+    """
+
+    valid = stop >= start
+    start, stop = start[valid], stop[valid]
+    if not len(start):
+        return start, stop
+    order = np.argsort(start, kind='stable')
+    start, stop = start[order], stop[order]
+    reach = np.maximum.accumulate(stop)
+    # an interval opens a new segment, if it starts after everything before it has stopped
+    new_segment = np.ones(len(start), dtype=bool)
+    new_segment[1:] = start[1:] > reach[:-1] + 1
+    first = np.flatnonzero(new_segment)
+    last = np.append(first[1:] - 1, len(start) - 1)
+    return start[first], reach[last]
+
+
+def _previous_greater_equal(values):
+    r"""
+    for each i the largest :code:`j < i` with :code:`values[j] >= values[i]` or -1, computed
+    with a sparse table of block maxima and binary lifting in :math:`O(n \log n)`
+
+    .. code-block:: python
+
+        >>> _previous_greater_equal(np.array([5, 3, 4, 4, 6]))
+        array([-1,  0,  0,  2, -1])
+    """
+
+    values = np.asarray(values)
+    # block_max[k][p] is the maximum of values[p:p + 2**k]
+    block_max = [values]
+    while 2 ** len(block_max) <= len(values):
+        previous, width = block_max[-1], 2 ** (len(block_max) - 1)
+        block_max.append(np.maximum(previous[:-width], previous[width:]))
+
+    # skip blocks to the left as long as they are all smaller
+    end = np.arange(len(values))
+    for k in range(len(block_max) - 1, -1, -1):
+        width = 2 ** k
+        candidate = end - width
+        can_skip = candidate >= 0
+        can_skip[can_skip] = block_max[k][candidate[can_skip]] < values[can_skip]
+        end[can_skip] = candidate[can_skip]
+    return end - 1
+
+
+def _pack(start, stop):
+    """
+    encode (start, stop) in one int64 :code:`(start << 32) + stop`, which sorts like the
+    :code:`(start, stop)` tuples, for positive positions it is the same as
+    :code:`(start << 32) | stop`
+
+    .. code-block:: python
+
+        >>> _pack(np.array([1, 1, 2]), np.array([5, -1, 2]))
+        array([4294967301, 4294967295, 8589934594])
+    """
+
+    return (np.asarray(start, dtype=np.int64) << _KEY_SHIFT) + np.asarray(stop, dtype=np.int64)
+
+
+def _unpack(packed):
+    "inverse of :code:`_pack`, returns :code:`(start, stop)` as int64"
+    packed = np.asarray(packed, dtype=np.int64)
+    # the stop is the low 32 bits interpreted as a signed integer
+    stop = ((packed + (1 << 31)) & 0xffffffff) - (1 << 31)
+    return (packed - stop) >> _KEY_SHIFT, stop
@@ -0,0 +1,297 @@
+# core imports
+from collections.abc import Iterable, Mapping
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._join import (PointRangeJoin, OverlapJoin, NearestJoin, _point_range_pairs,
+                    _point_range_counts, _overlap_indexes, _overlap_join, _nearest_range,
+                    _nearest_terminus)
+from ._kernels import _KEY_SHIFT, _keyed_positions, _merge_intervals
+from ._point_array import SequencePointArray
+from ._range_array import SequenceRangeArray
+from ._redundancy import _containment_parents, _terminus_groups
+
+
+class _KeyedArray:
+    """
+    Base class for the keyed collections, every row has a key (e.g. a protein accession) which
+    is dictionary encoded into :code:`categories` and integer :code:`codes`, the rows are kept
+    in the given order, but a sorted index (by key and then by position) is build once, so the
+    rows of any key can be found without grouping in python
+    """
+
+    _array_class = None
+
+    def __init__(self, keys: Iterable, values, *, validate: bool=True):
+        if not isinstance(values, self._array_class):
+            values = self._array_class(values, validate=validate)
+        elif validate:
+            values.validate()
+        categories, codes = np.unique(np.asarray(keys), return_inverse=True)
+        if len(codes) != len(values):
+            raise ValueError("there has to be exactly one key per row")
+        self._init(categories, codes.reshape(-1).astype(np.int32), values)
+
+    def _init(self, categories, codes, values):
+        self._categories = categories
+        self._codes = codes
+        self._values = values
+        self._order = self._sort_order()
+        self._offsets = np.searchsorted(codes[self._order], np.arange(len(categories) + 1))
+
+    @classmethod
+    def from_codes(cls, categories, codes, values, *, validate: bool=True):
+        """
+        Alternative Constructor, from already dictionary encoded keys
+
+        :param categories: the unique keys, sorted
+        :param codes: for each row, the index of its key in :code:`categories`
+        """
+
+        if not isinstance(values, cls._array_class):
+            values = cls._array_class(values, validate=validate)
+        elif validate:
+            values.validate()
+        self = cls.__new__(cls)
+        self._init(np.asarray(categories), np.asarray(codes, dtype=np.int32), values)
+        return self
+
+    @classmethod
+    def from_dict(cls, mapping: Mapping, *, validate: bool=True):
+        """
+        Alternative Constructor, from a mapping of key to values, e.g.
+        :code:`{"P01275": [(1, 20), (21, 89)]}`
+        """
+
+        keys = list(mapping)
+        values = [mapping[key] for key in keys]
+        values = [value if isinstance(value, cls._array_class) else cls._array_class(value)
+                  for value in values]
+        codes = np.repeat(np.arange(len(keys)), [len(value) for value in values])
+        categories, inverse = np.unique(np.asarray(keys), return_inverse=True)
+        return cls.from_codes(categories, inverse[codes], cls._array_class.concatenate(values),
+                              validate=validate)
+
+    def _sort_order(self):
+        raise NotImplementedError("Please Implement this method")
+
+    def _aligned_codes(self, other):
+        "codes of self and other, encoded with the same categories"
+        if np.array_equal(self._categories, other._categories):
+            return self._codes, other._codes
+        categories = np.union1d(self._categories, other._categories)
+        self_map = np.searchsorted(categories, self._categories)
+        other_map = np.searchsorted(categories, other._categories)
+        return self_map[self._codes], other_map[other._codes]
+
+    # properties, to make it read-only
+    @property
+    def categories(self) -> np.ndarray:
+        return self._categories
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self._codes
+
+    @property
+    def key(self) -> np.ndarray:
+        "the key of each row"
+        return self._categories[self._codes]
+
+    def rows(self, key) -> np.ndarray:
+        "indexes of the rows with :code:`key`, sorted by position"
+        code = self._code(key)
+        return self._order[self._offsets[code]:self._offsets[code + 1]]
+
+    def _code(self, key):
+        code = np.searchsorted(self._categories, key)
+        if code == len(self._categories) or self._categories[code] != key:
+            raise KeyError(key)
+        return int(code)
+
+    def groups(self):
+        "iterate over :code:`(key, values)` pairs, where values are sorted by position"
+        for code, key in enumerate(self._categories.tolist()):
+            yield key, self._values[self._order[self._offsets[code]:self._offsets[code + 1]]]
+
+    # dunders
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        try:
+            self._code(key)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __getitem__(self, key):
+        return self._values[self.rows(key)]
+
+    def __repr__(self):
+        return "{}(keys={}, length={})".format(type(self).__name__, len(self._categories),
+                                               len(self))
+
+    def __reduce__(self):
+        # the sorted index is rebuild on unpickling instead of being sent
+        return (_unpickle_keyed, (type(self), self._categories, self._codes, self._values))
+
+
+def _unpickle_keyed(cls, categories, codes, values):
+    return cls.from_codes(categories, codes, values, validate=False)
+
+
+class KeyedPointArray(_KeyedArray):
+    """
+    :code:`SequencePointArray` where every point belongs to a sequence (e.g. a protein)
+
+    :param keys: the sequence identifier of each point
+    :param points: anything :code:`SequencePointArray` accepts
+
+    .. code-block:: python
+
+        >>> sites = KeyedPointArray(["P2", "P1", "P1"], [5, 9, 3])
+        >>> sites["P1"]
+        SequencePointArray([3, 9], length=2)
+    """
+
+    _array_class = SequencePointArray
+
+    def _sort_order(self):
+        return np.lexsort((self._values.pos, self._codes))
+
+    @property
+    def points(self) -> SequencePointArray:
+        return self._values
+
+
+class KeyedRangeArray(_KeyedArray):
+    """
+    :code:`SequenceRangeArray` where every range belongs to a sequence (e.g. a protein), this is
+    the backbone for proteome wide datasets, queries, coverage and joins run per key without
+    grouping in python
+
+    :param keys: the sequence identifier of each range
+    :param ranges: anything :code:`SequenceRangeArray` accepts
+
+    .. code-block:: python
+
+        >>> peptides = KeyedRangeArray(["P1", "P2", "P1"], [(5, 10), (1, 4), (1, 6)])
+        >>> peptides["P1"]
+        SequenceRangeArray([1:6, 5:10], length=2)
+        >>> peptides.coverage()
+        array([10,  4])
+        >>> peptides.overlapping("P1", 8, 20)
+        array([0])
+    """
+
+    _array_class = SequenceRangeArray
+
+    def _init(self, categories, codes, values):
+        super()._init(categories, codes, values)
+        start, stop = values.pos
+        self._sorted_start = start[self._order]
+        # upper bound of the length of a range, used to bound the queries
+        self._max_length = int(values.length.max()) if len(values) else 0
+
+    def _sort_order(self):
+        start, stop = self._values.pos
+        return np.lexsort((stop, start, self._codes))
+
+    @property
+    def ranges(self) -> SequenceRangeArray:
+        return self._values
+
+    def overlapping(self, key, start: int, stop: Union[int, None]=None) -> np.ndarray:
+        """
+        indexes of the rows of :code:`key` that overlap :code:`start` to :code:`stop`
+
+        :param key: the sequence identifier
+        :param start: first position of the query
+        :param stop: last position of the query, a single position if :code:`None`
+        """
+
+        stop = start if stop is None else stop
+        code = self._code(key)
+        first, last = self._offsets[code], self._offsets[code + 1]
+        starts = self._sorted_start[first:last]
+        lo = np.searchsorted(starts, start - self._max_length + 1, side='left')
+        hi = np.searchsorted(starts, stop, side='right')
+        rows = self._order[first + lo:first + hi]
+        return rows[self._values.pos[1][rows] >= start]
+
+    def merged(self) -> 'KeyedRangeArray':
+        """
+        the covered segments of each key, i.e. overlapping and adjacent ranges merged
+
+        .. code-block:: python
+
+            >>> peptides = KeyedRangeArray(["P1", "P1", "P1"], [(1, 4), (5, 10), (20, 25)])
+            >>> peptides.merged()["P1"]
+            SequenceRangeArray([1:10, 20:25], length=2)
+        """
+
+        start, stop = self._values.pos
+        start, stop = _merge_intervals(_keyed_positions(self._codes, start),
+                                       _keyed_positions(self._codes, stop))
+        codes = (start >> _KEY_SHIFT).astype(np.int32)
+        mask = (1 << _KEY_SHIFT) - 1
+        ranges = SequenceRangeArray._from_columns(
+            (start & mask).astype(np.int32), (stop & mask).astype(np.int32))
+        return self.from_codes(self._categories, codes, ranges, validate=False)
+
+    def coverage(self) -> np.ndarray:
+        "number of covered residues for each key in :code:`categories`"
+        merged = self.merged()
+        return np.bincount(merged._codes, weights=merged.ranges.length,
+                           minlength=len(self._categories)).astype(np.int64)
+
+    # redundancy
+    def containment_forest(self) -> np.ndarray:
+        "the index of the containing range of the same key or -1, see :code:`containment_forest`"
+        return _containment_parents(self.ranges, self._codes)
+
+    def maximal_ranges(self) -> np.ndarray:
+        "indexes of the ranges not contained in another range of the same key"
+        return np.flatnonzero(self.containment_forest() == -1)
+
+    def terminus_groups(self, terminus: str='start', *, min_size: int=2) -> np.ndarray:
+        "groups of ranges of the same key sharing a terminus, see :code:`terminus_groups`"
+        return _terminus_groups(self.ranges, terminus, min_size, self._codes)
+
+    # joins
+    def point_pairs(self, points: KeyedPointArray) -> PointRangeJoin:
+        "all (point, range) pairs of the same key, see :code:`point_range_pairs`"
+        range_codes, point_codes = self._aligned_codes(points)
+        return _point_range_pairs(points.points, self.ranges, point_codes, range_codes)
+
+    def point_counts(self, points: KeyedPointArray) -> np.ndarray:
+        "the number of ranges covering each point, see :code:`point_range_counts`"
+        range_codes, point_codes = self._aligned_codes(points)
+        return _point_range_counts(points.points, self.ranges, point_codes, range_codes)
+
+    def overlap_pairs(self, other: 'KeyedRangeArray', *, min_overlap: int=1) -> OverlapJoin:
+        "all overlapping pairs of the same key, see :code:`range_overlap_pairs`"
+        if min_overlap < 1:
+            raise ValueError("min_overlap({}) < 1".format(min_overlap))
+        left_codes, right_codes = self._aligned_codes(other)
+        left_index, right_index = _overlap_indexes(self.ranges, other.ranges, min_overlap,
+                                                   left_codes, right_codes)
+        return _overlap_join(self.ranges, other.ranges, left_index, right_index)
+
+    def nearest(self, queries: Union[KeyedPointArray, 'KeyedRangeArray']) -> NearestJoin:
+        "the nearest range of the same key to each point or range, see :code:`nearest_range`"
+        range_codes, query_codes = self._aligned_codes(queries)
+        if isinstance(queries, KeyedRangeArray):
+            query_start, query_stop = queries.ranges.pos
+        else:
+            query_start = query_stop = queries.points.pos
+        return _nearest_range(query_start, query_stop, self.ranges, query_codes, range_codes)
+
+    def nearest_terminus(self, points: KeyedPointArray, terminus: str='start') -> NearestJoin:
+        "the range of the same key with the nearest terminus, see :code:`nearest_terminus`"
+        range_codes, point_codes = self._aligned_codes(points)
+        return _nearest_terminus(points.points, self.ranges, terminus, point_codes, range_codes)
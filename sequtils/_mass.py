@@ -0,0 +1,208 @@
+# core imports
+import collections
+from collections.abc import Iterable, Mapping
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._features import EncodedProteins
+from ._kernels import _expand, _searchsorted
+from ._keyed import KeyedRangeArray
+from ._range import SequenceRange
+from ._range_array import SequenceRangeArray
+
+
+# monoisotopic residue masses in Dalton
+MONOISOTOPIC_MASSES = {
+    'G': 57.021463721, 'A': 71.037113785, 'S': 87.032028405, 'P': 97.052763850,
+    'V': 99.068413913, 'T': 101.047678470, 'C': 103.009184785, 'L': 113.084064042,
+    'I': 113.084064042, 'N': 114.042927446, 'D': 115.026943031, 'Q': 128.058577540,
+    'K': 128.094963050, 'E': 129.042593135, 'M': 131.040484922, 'H': 137.058911875,
+    'F': 147.068413913, 'U': 150.953633405, 'R': 156.101111050, 'Y': 163.063328537,
+    'W': 186.079312946, 'O': 237.147726925,
+}
+WATER = 18.010564684
+PROTON = 1.007276466812
+
+
+def mass_to_mz(mass, charge):
+    "the m/z of a neutral mass with :code:`charge` protons added"
+    charge = np.asarray(charge)
+    return (np.asarray(mass) + charge * PROTON) / charge
+
+
+def mz_to_mass(mz, charge):
+    "the neutral mass of an ion with :code:`charge` protons, the inverse of :code:`mass_to_mz`"
+    charge = np.asarray(charge)
+    return np.asarray(mz) * charge - charge * PROTON
+
+
+class MassTable:
+    """
+    Prefix sums of the residue masses of a set of proteins, the monoisotopic mass of any range
+    (e.g. a peptide) is then the difference of two prefix sums, i.e. :math:`O(1)` per range
+    independent of its length and without slicing the sequence
+
+    :param proteins: mapping of protein identifier to sequence, or an iterable of
+                     :code:`(identifier, sequence)` pairs, e.g. from :code:`read_fasta`
+    :param masses: residue masses, ranges with any other residue have the mass :code:`nan`
+
+    .. code-block:: python
+
+        >>> table = MassTable({"P1": "ELVISLIVES"})
+        >>> round(table.mass("P1", SequenceRange(1, 5)), 4)
+        559.3217
+        >>> table.masses(SequenceRangeArray([(1, 5), (6, 10)])).round(4)
+        array([559.3217, 559.3217])
+    """
+
+    def __init__(self, proteins: Union[Mapping, Iterable], *,
+                 masses: Mapping=MONOISOTOPIC_MASSES):
+        self._proteins = EncodedProteins(proteins, alphabet="".join(masses))
+        codes = self._proteins.buffer
+        # the codes are 0 for padding, 1.. for the residues and the last one for unknowns
+        lookup = np.zeros(len(masses) + 2)
+        lookup[1:-1] = list(masses.values())
+        unknown = codes == len(masses) + 1
+        self._prefix_mass = np.concatenate([[0.0], np.cumsum(lookup[codes])])
+        self._prefix_unknown = np.concatenate([[0], np.cumsum(unknown)])
+        self._offsets = np.concatenate([[0], np.cumsum(self._proteins.lengths)])
+
+    @property
+    def categories(self) -> np.ndarray:
+        "the protein identifiers, sorted"
+        return self._proteins.categories
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self._proteins.lengths
+
+    def _masses(self, codes, start, stop):
+        start, stop = start.astype(np.int64), stop.astype(np.int64)
+        lengths = self._proteins.lengths[codes]
+        outside = (start < 1) | (stop > lengths) | (stop < start)
+        if outside.any():
+            row = np.flatnonzero(outside)[0]
+            raise IndexError("row {}: {} is not a range of protein {!r}".format(
+                row, SequenceRange(int(start[row]), int(stop[row]), validate=False),
+                self.categories[codes[row]]))
+        first = self._offsets[codes] + start - 1
+        end = self._offsets[codes] + stop
+        masses = self._prefix_mass[end] - self._prefix_mass[first] + WATER
+        masses[self._prefix_unknown[end] > self._prefix_unknown[first]] = np.nan
+        return masses
+
+    def masses(self, ranges: Union[SequenceRangeArray, KeyedRangeArray, Iterable], *,
+               keys: Union[Iterable, None]=None) -> np.ndarray:
+        """
+        The monoisotopic (neutral) mass of each range, i.e. the residues plus water
+
+        :param ranges: :code:`KeyedRangeArray`, :code:`SequenceRangeArray` or iterable of
+                       range like objects
+        :param keys: the protein of each range, not needed for a :code:`KeyedRangeArray` or
+                     if there is only one protein
+        """
+
+        if isinstance(ranges, KeyedRangeArray):
+            if keys is not None:
+                raise ValueError("keys cannot be given for a KeyedRangeArray")
+            codes = self._proteins._codes(ranges.categories, len(ranges.categories))
+            codes, ranges = codes[ranges.codes], ranges.ranges
+        else:
+            if not isinstance(ranges, SequenceRangeArray):
+                ranges = SequenceRangeArray(ranges, validate=False)
+            codes = self._proteins._codes(keys, len(ranges))
+        return self._masses(codes, *ranges.pos)
+
+    def mass(self, key, sequence_range) -> float:
+        "the monoisotopic mass of a single range of protein :code:`key`"
+        sequence_range = SequenceRange(sequence_range, validate=False)
+        codes = self._proteins._codes([key], 1)
+        start, stop = sequence_range.pos
+        return float(self._masses(codes, np.array([start]), np.array([stop]))[0])
+
+    def __len__(self):
+        return len(self.categories)
+
+    def __repr__(self):
+        return "{}(proteins={}, residues={})".format(type(self).__name__, len(self),
+                                                     len(self._prefix_mass) - 1)
+
+
+class MassMatches(collections.namedtuple("MassMatches", ("query", "range", "error"))):
+    """
+    Matches of a :code:`MassIndex` query, :code:`query[i]` is the index of the m/z in the
+    batch and :code:`range[i]` the index of the matching range, :code:`error[i]` is the
+    mass error (range mass - query mass) in Dalton
+    """
+
+    __slots__ = ()
+
+
+class MassIndex:
+    r"""
+    Sorted index of the masses of ranges (e.g. all peptides of a digest), to find the
+    candidates within a tolerance of a batch of precursor m/z in
+    :math:`O((n + q)\log(n) + k)`
+
+    :param masses: the neutral mass of each range, e.g. from :code:`MassTable.masses`, ranges
+                   with the mass :code:`nan` never match
+
+    .. code-block:: python
+
+        >>> table = MassTable({"P1": "ELVISLIVES"})
+        >>> peptides = SequenceRangeArray([(1, 5), (6, 10), (1, 3)])
+        >>> index = MassIndex(table.masses(peptides))
+        >>> matches = index.query([280.6681, 560.3290, 500.0], charge=[2, 1, 1], tolerance=10)
+        >>> matches.query, matches.range
+        (array([0, 0, 1, 1]), array([0, 1, 0, 1]))
+        >>> index.counts([280.6681, 560.3290, 500.0], charge=[2, 1, 1], tolerance=10)
+        array([2, 2, 0])
+    """
+
+    def __init__(self, masses):
+        masses = np.asarray(masses, dtype=np.float64)
+        self._order = np.flatnonzero(~np.isnan(masses))
+        self._order = self._order[np.argsort(masses[self._order], kind='stable')]
+        self._sorted = masses[self._order]
+
+    def query(self, mz, *, charge=1, tolerance: float=10, unit: str='ppm') -> MassMatches:
+        """
+        All ranges with a mass within :code:`tolerance` of each (precursor) m/z
+
+        :param mz: the m/z values of a batch of spectra
+        :param charge: the charge of each m/z, or one charge for all
+        :param tolerance: the allowed mass error
+        :param unit: :code:`'ppm'` (relative to the query mass) or :code:`'Da'`
+
+        The matches are ordered by query and then by mass
+        """
+
+        mass, lo, hi = self._bounds(mz, charge, tolerance, unit)
+        query, position = _expand(lo, hi)
+        return MassMatches(query, self._order[position], self._sorted[position] - mass[query])
+
+    def counts(self, mz, *, charge=1, tolerance: float=10, unit: str='ppm') -> np.ndarray:
+        "the number of candidates of each m/z, see :code:`query`"
+        _, lo, hi = self._bounds(mz, charge, tolerance, unit)
+        return hi - lo
+
+    def _bounds(self, mz, charge, tolerance, unit):
+        "the query masses and the slices of the sorted masses within the tolerance"
+        if unit not in ('ppm', 'Da'):
+            raise ValueError("unit has to be 'ppm' or 'Da'")
+        if tolerance < 0:
+            raise ValueError("tolerance({}) < 0".format(tolerance))
+        mass = np.atleast_1d(mz_to_mass(mz, charge)).astype(np.float64)
+        delta = mass * tolerance * 1e-6 if unit == 'ppm' else np.full(len(mass), tolerance)
+        lo = _searchsorted(self._sorted, mass - delta, side='left')
+        hi = _searchsorted(self._sorted, mass + delta, side='right')
+        return mass, lo, np.maximum(lo, hi)
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def __repr__(self):
+        return "{}(length={})".format(type(self).__name__, len(self))
@@ -0,0 +1,197 @@
+# core imports
+import concurrent.futures
+import re
+from collections.abc import Iterable, Mapping
+from typing import Dict, Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._keyed import KeyedRangeArray
+from ._range import SequenceRange
+from ._range_array import SequenceRangeArray
+
+
+_DEFAULT_CHUNK_SIZE = 1000
+# e.g. <[ST](2,3)>, i.e. anchor, residue(s), repeats and anchor
+_PROSITE_ELEMENT = re.compile(
+    r"^(<?)(x|[A-Z]|\[[A-Z<>]+\]|\{[A-Z]+\})(?:\((\d+)(?:,(\d+))?\))?(>?)$")
+
+# the compiled motifs of a worker process, set once per worker by _init_worker
+_worker_motifs = None
+
+
+def prosite_to_regex(pattern: str) -> str:
+    """
+    Convert a PROSITE pattern to a python regular expression
+
+    .. code-block:: python
+
+        >>> prosite_to_regex("N-{P}-[ST]-{P}.")
+        'N[^P][ST][^P]'
+        >>> prosite_to_regex("<M-x(2,4)-[DE]>")
+        '^M.{2,4}[DE]$'
+    """
+
+    regex = []
+    for element in pattern.strip().rstrip('.').split('-'):
+        match = _PROSITE_ELEMENT.match(element)
+        if match is None:
+            raise ValueError("invalid PROSITE element {!r} in {!r}".format(element, pattern))
+        n_terminal, residue, low, high, c_terminal = match.groups()
+        if residue == 'x':
+            residue = '.'
+        elif residue.startswith('{'):
+            residue = '[^' + residue[1:-1] + ']'
+        elif residue.startswith('['):
+            # [...>] means one of the residues or the C-terminal
+            residues = residue[1:-1].replace('<', '').replace('>', '')
+            if '>' in residue:
+                residue = '(?:[' + residues + ']|$)'
+            elif '<' in residue:
+                residue = '(?:^|[' + residues + '])'
+            else:
+                residue = '[' + residues + ']'
+        if low is not None:
+            residue += '{' + low + (',' + high if high is not None else '') + '}'
+        regex.append(('^' if n_terminal else '') + residue + ('$' if c_terminal else ''))
+    return ''.join(regex)
+
+
+def _compile(patterns):
+    # the match is captured inside a lookahead, so overlapping matches are found as well
+    return [re.compile('(?=(' + pattern + '))') for pattern in patterns]
+
+
+def _init_worker(patterns):
+    global _worker_motifs
+    _worker_motifs = _compile(patterns)
+
+
+def _scan(motifs, offset, sequences, with_seq):
+    "for each motif the arrays (protein, start index, stop index[, seq]) of the hits"
+    hits = []
+    for motif in motifs:
+        protein, start, stop, seq = [], [], [], []
+        for i, sequence in enumerate(sequences, offset):
+            for match in motif.finditer(sequence):
+                # empty matches, e.g. of anchors only, are not valid ranges
+                if match.end(1) > match.start(1):
+                    protein.append(i)
+                    start.append(match.start(1))
+                    stop.append(match.end(1))
+                    if with_seq:
+                        seq.append(match.group(1))
+        hits.append((protein, start, stop, seq if with_seq else None))
+    return hits
+
+
+def _scan_in_worker(offset, sequences, with_seq):
+    return _scan(_worker_motifs, offset, sequences, with_seq)
+
+
+def _sequences(proteins):
+    "split the proteins in keys and sequence strings"
+    if isinstance(proteins, Mapping):
+        proteins = proteins.items()
+    keys, sequences = [], []
+    for key, sequence in proteins:
+        keys.append(key)
+        sequences.append(sequence.seq if isinstance(sequence, SequenceRange) else sequence)
+    if any(not isinstance(sequence, str) for sequence in sequences):
+        raise TypeError("the proteins has to have a sequence")
+    return keys, sequences
+
+
+class MotifScanner:
+    """
+    Find sequence motifs (regular expressions or PROSITE patterns) in many proteins, the
+    motifs are compiled once and the proteins can be scanned in parallel processes
+
+    :param motifs: mapping of motif name to pattern, or an iterable of patterns, which are then
+                   also the names
+    :param prosite: if :code:`True` the patterns are PROSITE patterns, see
+                    :code:`prosite_to_regex`
+
+    All matches are reported, also overlapping ones (but at most one per start position), and
+    the hits have the coordinates of :code:`SequenceRange.from_slice(match.start(),
+    match.end())`
+
+    .. code-block:: python
+
+        >>> scanner = MotifScanner({"N-glyco": "N-{P}-[ST]-{P}", "KR": "[KR]-[KR]"},
+        ...                        prosite=True)
+        >>> hits = scanner.scan({"P1": "MNGTANKTRRKA", "P2": "NPSA"})
+        >>> hits["N-glyco"]["P1"]
+        SequenceRangeArray([2:5, 6:9], length=2)
+        >>> hits["KR"]["P1"]
+        SequenceRangeArray([9:10, 10:11], length=2)
+    """
+
+    def __init__(self, motifs: Union[Mapping, Iterable], *, prosite: bool=False):
+        if not isinstance(motifs, Mapping):
+            motifs = {motif: motif for motif in motifs}
+        self._names = list(motifs)
+        self._patterns = [prosite_to_regex(pattern) if prosite else pattern
+                          for pattern in motifs.values()]
+        self._motifs = _compile(self._patterns)
+
+    @property
+    def names(self):
+        return list(self._names)
+
+    @property
+    def patterns(self) -> Dict[str, str]:
+        "the regular expression of each motif"
+        return dict(zip(self._names, self._patterns))
+
+    def scan(self, proteins, *, processes: Union[int, None]=None,
+             chunk_size: int=_DEFAULT_CHUNK_SIZE,
+             with_seq: bool=False) -> Dict[str, KeyedRangeArray]:
+        """
+        Scan the proteins for all motifs
+
+        :param proteins: mapping of protein identifier to sequence, or an iterable of
+                         :code:`(identifier, sequence)` pairs, e.g. from :code:`read_fasta`,
+                         where the sequence is a :code:`str` or a :code:`SequenceRange` with
+                         :code:`seq`
+        :param processes: the number of worker processes, scan in this process if :code:`None`
+        :param chunk_size: the number of proteins send to a worker at a time
+        :param with_seq: if :code:`True`, the matched sequence is stored as :code:`seq`
+        :return: for each motif name a :code:`KeyedRangeArray` of the hits keyed by protein
+        """
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size({}) < 1".format(chunk_size))
+        keys, sequences = _sequences(proteins)
+        offsets = range(0, len(sequences), chunk_size)
+        chunks = [sequences[offset:offset + chunk_size] for offset in offsets]
+        if processes is None:
+            results = [_scan(self._motifs, offset, chunk, with_seq)
+                       for offset, chunk in zip(offsets, chunks)]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                    processes, initializer=_init_worker, initargs=(self._patterns,)) as pool:
+                results = list(pool.map(_scan_in_worker, offsets, chunks,
+                                        [with_seq] * len(chunks)))
+
+        categories, inverse = np.unique(np.asarray(keys), return_inverse=True)
+        inverse = inverse.reshape(-1)
+        hits = {}
+        for motif, name in enumerate(self._names):
+            protein, start, stop, seq = [], [], [], []
+            for result in results:
+                for column, values in zip((protein, start, stop, seq), result[motif]):
+                    column.extend(values or ())
+            if with_seq:
+                seq_array = np.empty(len(seq), dtype=object)
+                seq_array[:] = seq
+            ranges = SequenceRangeArray.from_slice(start, stop, seq_array if with_seq else None,
+                                                   validate=False)
+            codes = inverse[np.asarray(protein, dtype=np.intp)]
+            hits[name] = KeyedRangeArray.from_codes(categories, codes, ranges, validate=False)
+        return hits
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, self.patterns)
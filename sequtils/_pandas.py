@@ -0,0 +1,263 @@
+# core imports
+import numbers
+
+# 3rd party imports
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (ExtensionArray, ExtensionDtype, register_extension_dtype,
+                                   register_series_accessor, take)
+from pandas.api.indexers import check_array_indexer
+
+# local imports
+from ._base import BaseSequenceLocation
+from ._kernels import _unpack
+from ._range import SequenceRange
+from ._range_array import SequenceRangeArray, POSITION_DTYPE
+
+
+@register_extension_dtype
+class SequenceRangeDtype(ExtensionDtype):
+    """
+    pandas dtype for columns of :code:`SequenceRange`, use it as :code:`dtype="sequence_range"`
+    """
+
+    name = 'sequence_range'
+    type = SequenceRange
+    kind = 'O'
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return SequenceRangeExtensionArray
+
+
+def _is_na(value):
+    return value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value))
+
+
+class SequenceRangeExtensionArray(ExtensionArray):
+    """
+    pandas ExtensionArray backed by a :code:`SequenceRangeArray` and a missing value mask,
+    elements are :code:`SequenceRange` objects with the same semantics for equality (position
+    and seq), ordering (by position), hashing and :code:`str` (:code:`start:stop`)
+
+    .. code-block:: python
+
+        >>> s = pd.Series(["6:9", (1, 5), SequenceRange(7, 7)], dtype="sequence_range")
+        >>> s.sort_values().astype(str).tolist()
+        ['1:5', '6:9', '7']
+        >>> s.sequtils.length.tolist()
+        [4, 5, 1]
+    """
+
+    def __init__(self, ranges: SequenceRangeArray, mask=None):
+        if not isinstance(ranges, SequenceRangeArray):
+            raise TypeError("ranges has to be a SequenceRangeArray")
+        self._ranges = ranges
+        self._mask = np.zeros(len(ranges), dtype=bool) if mask is None else \
+            np.asarray(mask, dtype=bool)
+
+    # constructors required by pandas
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        elif isinstance(scalars, SequenceRangeArray):
+            return cls(scalars)
+        scalars = list(scalars)
+        mask = np.fromiter(map(_is_na, scalars), dtype=bool, count=len(scalars))
+        ranges = SequenceRangeArray([(1, 1) if missing else scalar
+                                     for scalar, missing in zip(scalars, mask)], validate=False)
+        return cls(ranges, mask)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype=None, copy=False):
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        missing = np.fromiter((_is_na(value) for value in values), dtype=bool, count=len(values))
+        packed = np.array([0 if missing else value if isinstance(value, numbers.Integral) else
+                           value[0] for value, missing in zip(values, missing)], dtype=np.int64)
+        start, stop = _unpack(packed)
+        start, stop = start.astype(POSITION_DTYPE), stop.astype(POSITION_DTYPE)
+        seq = None
+        if values.dtype == object:
+            seq = np.array([None if isinstance(value, numbers.Integral) or missing else value[1]
+                            for value, missing in zip(values, missing)], dtype=object)
+        return cls(SequenceRangeArray._from_columns(start, stop, seq), missing)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        ranges = SequenceRangeArray.concatenate([array._ranges for array in to_concat])
+        return cls(ranges, np.concatenate([array._mask for array in to_concat]))
+
+    # properties required by pandas
+    @property
+    def dtype(self):
+        return SequenceRangeDtype()
+
+    @property
+    def nbytes(self):
+        start, stop = self._ranges.pos
+        nbytes = start.nbytes + stop.nbytes + self._mask.nbytes
+        if self._ranges.seq is not None:
+            nbytes += self._ranges.seq.nbytes
+        return nbytes
+
+    @property
+    def ranges(self) -> SequenceRangeArray:
+        "the underlying ranges, missing values are stored as :code:`SequenceRange(1, 1)`"
+        return self._ranges
+
+    # methods required by pandas
+    def __len__(self):
+        return len(self._ranges)
+
+    def __getitem__(self, item):
+        if isinstance(item, (numbers.Integral, np.integer)):
+            if self._mask[item]:
+                return self.dtype.na_value
+            return self._ranges[int(item)]
+        if not isinstance(item, slice):
+            item = check_array_indexer(self, item)
+        return self.__class__(self._ranges[item], self._mask[item])
+
+    def __setitem__(self, key, value):
+        scalar = isinstance(key, (numbers.Integral, np.integer))
+        if not scalar and not isinstance(key, slice):
+            key = check_array_indexer(self, key)
+        if _is_na(value) or isinstance(value, (BaseSequenceLocation, str, tuple)):
+            value = [value]
+        value = self._from_sequence(value)
+        # a scalar key takes the single value, not a length 1 array
+        row = 0 if scalar else slice(None)
+        start, stop = self._ranges.pos
+        start[key], stop[key] = value._ranges.pos[0][row], value._ranges.pos[1][row]
+        if value._ranges.seq is not None or self._ranges.seq is not None:
+            seq = self._ranges.seq
+            if seq is None:
+                seq = np.full(len(self), None, dtype=object)
+            seq[key] = None if value._ranges.seq is None else value._ranges.seq[row]
+            self._ranges = SequenceRangeArray._from_columns(start, stop, seq)
+        self._mask[key] = value._mask[row]
+
+    def isna(self):
+        return self._mask.copy()
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        index = take(np.arange(len(self)), indices, allow_fill=allow_fill, fill_value=-1)
+        fill = index == -1 if allow_fill else np.zeros(len(index), dtype=bool)
+        if len(self) == 0:
+            # nothing to take from, only -1 passes the checks, so every row is missing
+            result = self._from_sequence([None] * len(index))
+        else:
+            result = self.__class__(self._ranges[np.where(fill, 0, index)],
+                                    self._mask[index] | fill)
+        if allow_fill and fill.any() and not _is_na(fill_value):
+            result = result.copy()
+            result[fill] = fill_value
+        return result
+
+    def copy(self):
+        ranges = self._ranges
+        seq = None if ranges.seq is None else ranges.seq.copy()
+        ranges = SequenceRangeArray._from_columns(ranges.pos[0].copy(), ranges.pos[1].copy(), seq)
+        return self.__class__(ranges, self._mask.copy())
+
+    def _values_for_argsort(self):
+        return self._ranges.pack()
+
+    def _values_for_factorize(self):
+        packed = self._ranges.pack()
+        if self._ranges.seq is None or not np.not_equal(self._ranges.seq, None).any():
+            if not self._mask.any():
+                return packed, None
+            values = packed.astype(object)
+        else:
+            # equality includes seq, so the ranges with a sequence are factorized as tuples
+            values = np.empty(len(self), dtype=object)
+            values[:] = [key if seq is None else (key, seq)
+                         for key, seq in zip(packed.tolist(), self._ranges.seq)]
+        values[self._mask] = None
+        return values, None
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if not isinstance(other, self.__class__):
+            if isinstance(other, (BaseSequenceLocation, str, tuple)):
+                other = [other] * len(self)
+            other = self._from_sequence(other)
+        if len(other) != len(self):
+            raise ValueError("Lengths must match to compare")
+        equal = self._ranges.pos[0] == other._ranges.pos[0]
+        equal &= self._ranges.pos[1] == other._ranges.pos[1]
+        if self._ranges.seq is not None or other._ranges.seq is not None:
+            seq = [np.full(len(self), None, dtype=object) if array._ranges.seq is None else
+                   array._ranges.seq for array in (self, other)]
+            equal &= np.fromiter(map(lambda a, b: a == b, *seq), dtype=bool, count=len(self))
+        return equal & ~self._mask & ~other._mask
+
+    def __array__(self, dtype=None, copy=None):
+        values = np.empty(len(self), dtype=object)
+        values[:] = [self.dtype.na_value if missing else sr
+                     for sr, missing in zip(self._ranges, self._mask)]
+        return values
+
+    def _formatter(self, boxed=False):
+        return str
+
+
+@register_series_accessor('sequtils')
+class SequtilsAccessor:
+    """
+    Vectorized access to :code:`SequenceRange` columns via :code:`series.sequtils`, the results
+    are computed on the underlying position arrays without boxing the elements
+    """
+
+    def __init__(self, series):
+        if not isinstance(series.dtype, SequenceRangeDtype):
+            raise AttributeError("the .sequtils accessor requires dtype 'sequence_range'")
+        self._series = series
+        self._array = series.array
+
+    def _wrap(self, values, dtype=None):
+        values = pd.array(values, dtype=dtype)
+        values[self._array._mask] = pd.NA
+        return pd.Series(values, index=self._series.index, name=self._series.name)
+
+    @property
+    def start(self) -> pd.Series:
+        return self._wrap(self._array.ranges.pos[0], 'Int32')
+
+    @property
+    def stop(self) -> pd.Series:
+        return self._wrap(self._array.ranges.pos[1], 'Int32')
+
+    @property
+    def length(self) -> pd.Series:
+        return self._wrap(self._array.ranges.length, 'Int32')
+
+    @property
+    def seq(self) -> pd.Series:
+        seq = self._array.ranges.seq
+        if seq is None:
+            seq = np.full(len(self._array), None, dtype=object)
+        return pd.Series(seq, index=self._series.index, name=self._series.name)
+
+    def contains(self, item, part=all) -> pd.Series:
+        """
+        vectorized :code:`SequenceRange.contains`, for each range check whether :code:`item` is
+        inside, see :code:`SequenceRange.contains` for :code:`part`
+        """
+
+        if part not in (all, any):
+            raise ValueError("part has to be all or any")
+        item = SequenceRange(item, validate=False)
+        start, stop = self._array.ranges.pos
+        if part is all:
+            inside = (start <= item.start.pos) & (item.stop.pos <= stop)
+        else:
+            inside = (item.start.pos <= stop) & (start <= item.stop.pos)
+        return self._wrap(inside, 'boolean')
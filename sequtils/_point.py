@@ -48,11 +48,17 @@ class SequencePoint(BaseSequenceLocation):
         if isinstance(position, self.__class__.mro()[1]):  # isinstance of parent
             return
 
+        # only the position is stored, index and slice are derived from it
         self._pos = int(position)
         if validate:
             self.validate()
-        self._index = self._pos - 1
-        self._slice = slice(self.index, self.index + 1)
+
+    @classmethod
+    def _from_pos(cls, position: int):
+        "fast internal constructor, without casting or validation, position has to be an int"
+        self = object.__new__(cls)
+        self._pos = position
+        return self
 
     # alternative constructors
     @classmethod
@@ -82,11 +88,11 @@ class SequencePoint(BaseSequenceLocation):
 
     @property
     def index(self):
-        return self._index
+        return self._pos - 1
 
     @property
     def slice(self):
-        return self._slice
+        return slice(self._pos - 1, self._pos)
 
     # dunders
     def __str__(self):
@@ -95,8 +101,13 @@ class SequencePoint(BaseSequenceLocation):
     def __repr__(self):
         return "{}({})".format(type(self).__name__, self.pos)
 
-    # needed for pickle protocol 3+
-    def __getnewargs__(self):
-        return (self.pos,)
+    def __reduce__(self):
+        # only the position is pickled, the index and slice are derived from it
+        return (_unpickle_point, (type(self), self._pos))
+
+
+def _unpickle_point(cls, position):
+    # invalid points can be pickled too, so they are restored without validation
+    return cls(position, validate=False)
 
 
@@ -0,0 +1,250 @@
+# core imports
+from collections.abc import Iterable
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._base import BaseSequenceLocation
+from ._point import SequencePoint
+from ._validation import _check_points
+
+
+POSITION_DTYPE = np.int32
+
+
+class SequencePointArray:
+    """
+    Columnar collection of :code:`SequencePoint`, useful for the millions of PTM's, SNP's etc.
+    in a sample, positions are stored in one compact integer array (human readable counting
+    from 1), element access returns ordinary :code:`SequencePoint` objects
+
+    :param positions: iterable of anything :code:`SequencePoint` accepts or an array of positions
+    :param validate: raise exception if any position is < 1
+
+    All math is index based exactly like :code:`SequencePoint`, thus integers are offsets
+
+    .. code-block:: python
+
+        # protein:      ELVISLIVES
+        #  - positions: 1234567890
+        >>> sites = SequencePointArray([6, 2, SequencePoint(9)])
+        >>> sites.residues("ELVISLIVES")
+        array(['L', 'L', 'E'], dtype='<U1')
+        >>> (sites + 1).pos
+        array([ 7,  3, 10], dtype=int32)
+        >>> sites[0]
+        SequencePoint(6)
+    """
+
+    def __init__(self, positions: Union[Iterable, np.ndarray, 'SequencePointArray'], *,
+                 validate: bool=True):
+        if isinstance(positions, self.__class__):
+            positions = positions._pos
+        elif not isinstance(positions, np.ndarray):
+            positions = [p.pos if isinstance(p, SequencePoint) else SequencePoint(
+                p, validate=False).pos for p in positions]
+        self._pos = np.asarray(positions, dtype=POSITION_DTYPE)
+        if self._pos.ndim != 1:
+            raise ValueError("positions has to be 1 dimensional")
+
+        if validate:
+            self.validate()
+
+    @classmethod
+    def _from_columns(cls, pos):
+        "fast internal constructor, assumes that pos is already a valid numpy array"
+        self = cls.__new__(cls)
+        self._pos = pos
+        return self
+
+    # alternative constructors
+    @classmethod
+    def from_index(cls, index, *, validate=True):
+        """
+        Alternative Constructure, using python indexes
+
+        :param index: python indexes of the positions
+        """
+
+        return cls(np.asarray(index, dtype=POSITION_DTYPE) + 1, validate=validate)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        "Concatenate several :code:`SequencePointArray`'s into one"
+        arrays = [array if isinstance(array, cls) else cls(array) for array in arrays]
+        pos = np.concatenate([array._pos for array in arrays] or [[]]).astype(
+            POSITION_DTYPE, copy=False)
+        return cls._from_columns(pos)
+
+    # interop
+    @classmethod
+    def from_arrow(cls, array, *, validate=True):
+        "Alternative Constructor, from an Arrow array, see :code:`sequtils.from_arrow`"
+        from ._arrow import from_arrow
+        collection = from_arrow(array, validate=validate)
+        if not isinstance(collection, cls):
+            raise TypeError("cannot convert arrow type {} to {}".format(array.type, cls.__name__))
+        return collection
+
+    def to_arrow(self):
+        "Convert to an Arrow array without copying the positions, see :code:`sequtils.to_arrow`"
+        from ._arrow import to_arrow
+        return to_arrow(self)
+
+    # validation
+    def validation(self):
+        "Validate all positions at once without raising, see :code:`SequenceRangeArray.validation`"
+        return _check_points(self._pos)
+
+    def is_valid(self):
+        "boolean mask of the valid positions"
+        return self.validation().valid
+
+    def validate(self):
+        row = self.validation().first_error()
+        if row is not None:
+            raise ValueError("row {}: position({}) < 1".format(row, self._pos[row]))
+
+    # properties, to make it read-only
+    @property
+    def pos(self) -> np.ndarray:
+        return self._pos
+
+    @property
+    def index(self) -> np.ndarray:
+        return self._pos - 1
+
+    # bulk methods
+    def residues(self, full_sequence: str) -> np.ndarray:
+        """
+        The residue letter at each point of :code:`full_sequence`
+
+        :param full_sequence: the biological sequence the points refer to
+        """
+
+        index = self.index
+        if len(index) and (index.min() < 0 or index.max() >= len(full_sequence)):
+            raise IndexError("positions outside of sequence of length {}".format(
+                len(full_sequence)))
+        letters = np.frombuffer(full_sequence.encode('ascii'), dtype='S1')
+        return letters[index].astype('U1')
+
+    def argsort(self):
+        return np.argsort(self._pos, kind='stable')
+
+    def sort(self):
+        "sorted copy"
+        return self._from_columns(np.sort(self._pos))
+
+    def unique(self, return_inverse=False):
+        """
+        sorted unique points, optionally with the inverse index that reconstructs the original
+
+        .. code-block:: python
+
+            >>> SequencePointArray([5, 2, 5]).unique().pos
+            array([2, 5], dtype=int32)
+        """
+
+        if return_inverse:
+            pos, inverse = np.unique(self._pos, return_inverse=True)
+            return self._from_columns(pos), inverse
+        return self._from_columns(np.unique(self._pos))
+
+    def isin(self, other) -> np.ndarray:
+        """
+        boolean mask, :code:`True` where the point is in :code:`other`
+
+        :param other: :code:`SequencePointArray` or iterable of point like objects
+
+        .. code-block:: python
+
+            >>> SequencePointArray([1, 2, 3]).isin([SequencePoint(2), 3])
+            array([False,  True,  True])
+        """
+
+        return np.isin(self._pos, self.__class__(other, validate=False)._pos)
+
+    def equals(self, other) -> np.ndarray:
+        """
+        row wise :code:`==` of two aligned collections, without boxing
+
+        .. code-block:: python
+
+            >>> SequencePointArray([1, 2, 3]).equals([1, SequencePoint(5), 3])
+            array([ True, False,  True])
+        """
+
+        other = self.__class__(other, validate=False)
+        if len(other) != len(self):
+            raise ValueError("cannot compare collections of length {} and {}".format(
+                len(self), len(other)))
+        return self._pos == other._pos
+
+    # math, index based like SequencePoint
+    # make numpy defer to __radd__ and __rsub__, e.g for np.int64(5) + SequencePointArray
+    __array_ufunc__ = None
+
+    def _other_index(self, other):
+        if isinstance(other, (SequencePoint, SequencePointArray)):
+            return other.index
+        elif isinstance(other, BaseSequenceLocation):
+            return None  # let e.g. SequenceRange handle it
+        other = np.asarray(other)
+        if other.dtype.kind not in 'iu':
+            return None
+        return other
+
+    def _arithmetic(self, other, operator):
+        other_index = self._other_index(other)
+        if other_index is None:
+            return NotImplemented
+        return self.from_index(operator(self.index, other_index), validate=False)
+
+    def __add__(self, other):
+        return self._arithmetic(other, np.add)
+
+    def __sub__(self, other):
+        return self._arithmetic(other, np.subtract)
+
+    def __radd__(self, other):
+        return self._arithmetic(other, np.add)
+
+    def __rsub__(self, other):
+        # other - self
+        other_index = self._other_index(other)
+        if other_index is None:
+            return NotImplemented
+        return self.from_index(other_index - self.index, validate=False)
+
+    # dunders
+    def __len__(self):
+        return len(self._pos)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return SequencePoint._from_pos(int(self._pos[item]))
+        return self._from_columns(self._pos[item])
+
+    def __reduce__(self):
+        # with pickle protocol 5 the numpy column can be sent as an out-of-band buffer
+        return (type(self)._from_columns, (self._pos,))
+
+    def __iter__(self):
+        return map(SequencePoint._from_pos, self._pos.tolist())
+
+    def __contains__(self, item):
+        try:
+            pos = SequencePoint(item, validate=False).pos
+        except (ValueError, TypeError):
+            return False
+        return bool((self._pos == pos).any())
+
+    def __repr__(self):
+        pos = self._pos.tolist()
+        if len(pos) > 6:
+            pos = pos[:3] + ['...'] + pos[-3:]
+        return "{}([{}], length={})".format(type(self).__name__, ", ".join(map(str, pos)),
+                                            len(self))
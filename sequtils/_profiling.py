@@ -0,0 +1,208 @@
+# core imports
+import collections
+import contextlib
+import functools
+import threading
+import time
+
+# local imports
+from ._base import BaseSequenceLocation
+from ._point import SequencePoint
+from ._range import SequenceRange
+
+
+# the methods that are instrumented, if the class defines them
+_INSTRUMENTED = (
+    '__new__', '__init__', '_from_pos', '_from_positions', 'from_index', 'from_slice',
+    'from_sequence', 'from_center_and_window', 'validate', 'is_valid', '_comparison_cast',
+    '_arithmetic', '_join', '__add__', '__sub__', '__radd__', '__rsub__', '__eq__', '__lt__',
+    '__le__', '__gt__', '__ge__', '_eq_helper', 'equals', '__hash__', '__contains__',
+    'contains', '_contains', '_contains_range', '__str__', '__repr__')
+# a construction is an implicit cast, if it is called by one of the _CAST_SITES, directly or via
+# one of the _FACTORIES
+_FACTORIES = ('from_index', 'from_slice')
+# the fast internal constructors, used by iteration, array boxing and unpickling
+_FAST_CONSTRUCTORS = ('_from_pos', '_from_positions')
+_CONSTRUCTORS = ('__new__', '__init__') + _FAST_CONSTRUCTORS + _FACTORIES
+_CAST_SITES = ('_arithmetic', '__add__', '__sub__', '__radd__', '__rsub__', '__eq__', '__lt__',
+               '__le__', '__gt__', '__ge__', '_eq_helper', 'equals', '__contains__', 'contains',
+               '_contains', '_contains_range')
+_CLASSES = (BaseSequenceLocation, SequencePoint, SequenceRange)
+
+_lock = threading.Lock()
+_active = None
+
+
+class Profile:
+    """
+    Counters collected by :code:`profiling`, all are :code:`collections.Counter`'s
+
+    :ivar calls: number of calls per method, e.g. :code:`"SequencePoint.__init__"`
+    :ivar time: total (inclusive) seconds per method
+    :ivar constructions: objects created per construction path, i.e. the class, the types of
+                         the arguments and :code:`validate=False`, e.g.
+                         :code:`"SequenceRange(tuple)"`, or the fast internal constructor
+                         used by iteration, array boxing and unpickling, e.g.
+                         :code:`"SequencePoint._from_pos(int)"`
+    :ivar casts: the implicit conversions, i.e. constructions inside math, comparison and
+                 containment, keyed by the method and the conversion, e.g.
+                 :code:`"SequenceRange._eq_helper: tuple -> SequenceRange"`
+    :ivar validations: number of :code:`validate` calls per class
+    :ivar exceptions: exceptions raised by the instrumented methods, keyed by the method they
+                      were raised in (:code:`<caller>` if the calling code called it directly),
+                      the method that raised them and the exception type, e.g.
+                      :code:`"BaseSequenceLocation.is_valid <- SequencePoint.validate: ValueError"`
+    """
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.time = collections.Counter()
+        self.constructions = collections.Counter()
+        self.casts = collections.Counter()
+        self.validations = collections.Counter()
+        self.exceptions = collections.Counter()
+        self._local = threading.local()
+
+    @property
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _caller(self, skip):
+        "the innermost instrumented method on the stack, which is not in :code:`skip`"
+        for name in reversed(self._stack):
+            if name.rsplit('.', 1)[1] not in skip:
+                return name
+        return None
+
+    def _record_cast(self, source, cls):
+        caller = self._caller(_FACTORIES)
+        if caller is not None and caller.rsplit('.', 1)[1] in _CAST_SITES:
+            self.casts["{}: {} -> {}".format(caller, type(source).__name__, cls.__name__)] += 1
+
+    def _record_call(self, method, args, kwargs):
+        if method == '__init__':
+            self_, args = args[0], args[1:]
+            path = [type(arg).__name__ for arg in args]
+            path.extend("{}={}".format(key, value) if key == 'validate' else key
+                        for key, value in kwargs.items() if key != 'validate' or not value)
+            self.constructions["{}({})".format(type(self_).__name__, ", ".join(path))] += 1
+            if args:
+                self._record_cast(args[0], type(self_))
+        elif method in _FAST_CONSTRUCTORS:
+            cls, args = args[0], args[1:]
+            path = [type(arg).__name__ for arg in args if arg is not None]
+            self.constructions["{}.{}({})".format(cls.__name__, method, ", ".join(path))] += 1
+        elif method == '__new__':
+            # SequencePoint.__new__ converts ranges of length 1
+            cls, args = args[0], args[1:]
+            if args and isinstance(args[0], BaseSequenceLocation) and \
+                    not isinstance(args[0], cls):
+                self._record_cast(args[0], cls)
+        elif method == 'validate':
+            self.validations[type(args[0]).__name__] += 1
+
+    def _record_exception(self, name, error):
+        # only count where the exception is raised, not every method it passes through
+        if getattr(error, '_sequtils_profile', None) is self:
+            return
+        error._sequtils_profile = self
+        self._stack.pop()
+        try:
+            context = self._caller(_CONSTRUCTORS) or "<caller>"
+        finally:
+            self._stack.append(name)
+        self.exceptions["{} <- {}: {}".format(context, name, type(error).__name__)] += 1
+
+    def _wrap(self, name, function, kind):
+        method = name.rsplit('.', 1)[1]
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self._record_call(method, args, kwargs)
+            stack = self._stack
+            stack.append(name)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except Exception as error:
+                self._record_exception(name, error)
+                raise
+            finally:
+                self.time[name] += time.perf_counter() - start
+                self.calls[name] += 1
+                stack.pop()
+
+        if kind is None:
+            return wrapper
+        return kind(wrapper)
+
+    def summary(self, top: int=10) -> str:
+        "a plain text report of the :code:`top` entries of each counter"
+        sections = [
+            ("time per method (s)", self.time, "{:.6f}"),
+            ("calls per method", self.calls, "{}"),
+            ("constructions by path", self.constructions, "{}"),
+            ("implicit casts", self.casts, "{}"),
+            ("validate calls", self.validations, "{}"),
+            ("exceptions (in <- raised by)", self.exceptions, "{}"),
+        ]
+        lines = []
+        for title, counter, fmt in sections:
+            lines.append("{} (total {})".format(title, fmt.format(sum(counter.values()))))
+            for key, value in counter.most_common(top):
+                lines.append("    {:>12}  {}".format(fmt.format(value), key))
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return "{}(calls={}, constructions={}, casts={}, exceptions={})".format(
+            type(self).__name__, sum(self.calls.values()), sum(self.constructions.values()),
+            sum(self.casts.values()), sum(self.exceptions.values()))
+
+
+@contextlib.contextmanager
+def profiling():
+    """
+    Opt-in instrumentation of :code:`SequencePoint` and :code:`SequenceRange`, inside the
+    :code:`with` block the methods are replaced with counting and timing wrappers, outside of
+    it the classes are untouched, so there is no overhead when profiling is not used
+
+    .. code-block:: python
+
+        >>> with profiling() as profile:
+        ...     SequenceRange(1, 5) == (1, 5)
+        True
+        >>> profile.casts
+        Counter({'SequenceRange._eq_helper: tuple -> SequenceRange': 1})
+        >>> print(profile.summary())  # doctest: +SKIP
+
+    Nested or concurrent :code:`profiling` blocks are not supported and raise a
+    :code:`RuntimeError`
+    """
+
+    global _active
+    with _lock:
+        if _active is not None:
+            raise RuntimeError("profiling is already active")
+        _active = profile = Profile()
+
+    originals = []
+    try:
+        for cls in _CLASSES:
+            for method in _INSTRUMENTED:
+                if method not in cls.__dict__:
+                    continue
+                original = cls.__dict__[method]
+                kind = type(original) if isinstance(original, (classmethod, staticmethod)) \
+                    else None
+                function = original.__func__ if kind else original
+                originals.append((cls, method, original))
+                setattr(cls, method, profile._wrap("{}.{}".format(cls.__name__, method),
+                                                   function, kind))
+        yield profile
+    finally:
+        for cls, method, original in reversed(originals):
+            setattr(cls, method, original)
+        with _lock:
+            _active = None
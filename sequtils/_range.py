@@ -6,12 +6,18 @@ import math
 import warnings
 from typing import Union
 
+# 3rd party imports
+import numpy as np
+
 # local imports
 from ._base import BaseSequenceLocation
+from ._interning import global_sequence_store
 from ._point import SequencePoint, point_types
 
 
 range_types = Union[str, int, float, Sequence, BaseSequenceLocation]
+# the fast point constructor, profiling replaces it with a counting wrapper
+_point_from_pos = SequencePoint.__dict__['_from_pos']
 
 
 class _Positions(collections.namedtuple("Pos", ("_1", "_2"), rename=True)):
@@ -202,6 +208,16 @@ class SequenceRange(BaseSequenceLocation):
         self._slice = slice(self.start.pos - 1, self.stop.pos)
         self._seq = self._get_seq(seq, full_sequence)
 
+    @classmethod
+    def _from_positions(cls, start: int, stop: int, seq: Union[None, str]=None):
+        "fast internal constructor, without casting or validation, start and stop have to be ints"
+        self = object.__new__(cls)
+        self._start = SequencePoint._from_pos(start)
+        self._stop = SequencePoint._from_pos(stop)
+        self._slice = slice(start - 1, stop)
+        self._seq = seq
+        return self
+
     def _resolve_none_stop(self, start, stop, length, seq):
         #  if isinstance(stop, (str, bytes)):
         #      return int(stop)
@@ -317,6 +333,14 @@ class SequenceRange(BaseSequenceLocation):
             return cls(start_slice.start + 1, start_slice.stop, **kwargs)
         return cls(start_slice, stop_slice, _special='slice', **kwargs)
 
+    @classmethod
+    def from_packed(cls, packed: int, *, validate: bool=True):
+        "Alternative Constructor, from the integer made by :code:`SequenceRange.packed`"
+        packed = int(packed)
+        # the stop is the low 32 bits interpreted as a signed integer
+        stop = ((packed + (1 << 31)) & 0xffffffff) - (1 << 31)
+        return cls((packed - stop) >> 32, stop, validate=validate)
+
     @classmethod
     def from_sequence(cls, full_sequence: str, sequence: str):
         """
@@ -383,24 +407,93 @@ class SequenceRange(BaseSequenceLocation):
     def __len__(self):
         return self.length
 
+    def __lt__(self, other):
+        if type(other) is type(self):
+            # fast path, nothing to cast
+            return (self._start._pos, self._stop._pos) < (other._start._pos, other._stop._pos)
+        return super().__lt__(other)
+
     def __str__(self):
-        if self.start == self.stop:  # call SequencePoints.__str__
-            return str(self.start)
-        return "{}{}{}".format(self.start.pos, self._str_separator, self.stop.pos)
+        # compare the integers directly, it's cheaper than == between SequencePoints
+        start, stop = self._start._pos, self._stop._pos
+        if start == stop:
+            return str(start)
+        return "%d%s%d" % (start, self._str_separator, stop)
 
     def __repr__(self):
-        base = "{}({{}})".format(type(self).__name__)
+        start, stop = self._start._pos, self._stop._pos
         if self.seq is None:
-            return base.format("{}, {}, seq=None".format(self.start, self.stop))
+            return "%s(%d, %d, seq=None)" % (type(self).__name__, start, stop)
 
         seq = self.seq
         if 40 < len(seq):
             seq = self.seq[:5] + '..' + self.seq[-5:]
-        return base.format('{}, {}, seq="{}"'.format(self.start, self.stop, seq))
+        return '%s(%d, %d, seq="%s")' % (type(self).__name__, start, stop, seq)
+
+    def __reduce__(self):
+        # pickle only start, stop and seq instead of the __dict__ with the nested SequencePoints
+        if self._seq is None:
+            return (_unpickle_range, (type(self), self._start._pos, self._stop._pos))
+        return (_unpickle_range, (type(self), self._start._pos, self._stop._pos, self._seq))
 
     def __iter__(self):
-        for pos in range(self.start.pos, self.stop.pos + 1):
-            yield SequencePoint(pos, validate=False)
+        positions = range(self._start._pos, self._stop._pos + 1)
+        if SequencePoint.__dict__['_from_pos'] is not _point_from_pos:
+            # instrumented by profiling, so the points are created via the wrapper
+            yield from map(SequencePoint._from_pos, positions)
+            return
+        # SequencePoint._from_pos inlined, this is the hot loop when walking residues
+        new, cls = object.__new__, SequencePoint
+        for pos in positions:
+            point = new(cls)
+            point._pos = pos
+            yield point
+
+    # cheap iteration
+    def positions(self) -> range:
+        """
+        the positions as a :code:`range`, which is much faster than iterating over the
+        :code:`SequencePoint`'s, if only the numbers are needed
+
+        .. code-block:: python
+
+            >>> list(SequenceRange(5, 9).positions())
+            [5, 6, 7, 8, 9]
+        """
+
+        return range(self._start._pos, self._stop._pos + 1)
+
+    def indexes(self) -> range:
+        """
+        the python indexes as a :code:`range`
+
+        .. code-block:: python
+
+            >>> seq = "ELVISLIVES"
+            >>> [seq[i] for i in SequenceRange(6, 9).indexes()]
+            ['L', 'I', 'V', 'E']
+        """
+
+        return range(self._start._pos - 1, self._stop._pos)
+
+    def iter_chunks(self, chunk_size: int, *, index: bool=False):
+        """
+        iterate over the positions (or indexes if :code:`index=True`) in numpy arrays of up to
+        :code:`chunk_size` elements, for vectorized work on very long ranges
+
+        .. code-block:: python
+
+            >>> [chunk.tolist() for chunk in SequenceRange(1, 5).iter_chunks(2)]
+            [[1, 2], [3, 4], [5]]
+        """
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size({}) < 1".format(chunk_size))
+        first, end = self._start._pos, self._stop._pos + 1
+        if index:
+            first, end = first - 1, end - 1
+        for chunk_start in range(first, end, chunk_size):
+            yield np.arange(chunk_start, min(chunk_start + chunk_size, end))
 
     def __contains__(self, item):
         " returns True if all of item is inside self"
@@ -423,12 +516,12 @@ class SequenceRange(BaseSequenceLocation):
         """
 
         if isinstance(item, self.__class__.mro()[0]):
-            return part(map(self._contains, item))
+            return self._contains_range(item, part)
         try:
             return self._contains(SequencePoint(item))
         except (ValueError, TypeError):
             try:
-                return part(map(self._contains, SequenceRange(item)))
+                return self._contains_range(SequenceRange(item), part)
             except (ValueError, TypeError):
                 pass
         return False
@@ -437,6 +530,17 @@ class SequenceRange(BaseSequenceLocation):
         "Helper method that checks if a SequencePoint is in self"
         return self.start.pos <= sequence_point.pos <= self.stop.pos
 
+    def _contains_range(self, sequence_range, part):
+        "Helper method that checks if all or any of a SequenceRange is in self"
+        start, stop = sequence_range.pos
+        if start <= stop:
+            # no need to iterate over the residues for the two common cases
+            if part is all:
+                return self.start.pos <= start and stop <= self.stop.pos
+            elif part is any:
+                return start <= self.stop.pos and self.start.pos <= stop
+        return part(map(self._contains, sequence_range))
+
     # properties, to make it read-only
     @property
     def seq(self) -> Union[str, None]:
@@ -466,10 +570,47 @@ class SequenceRange(BaseSequenceLocation):
     def length(self) -> int:
         return self.stop.pos - self.start.pos + 1
 
+    @property
+    def packed(self) -> int:
+        """
+        The positions encoded in one integer :code:`(start << 32) + stop`, which sorts like the
+        ranges, so it can be used for sorting, hashing and dict keys (the :code:`seq` is not
+        included), see :code:`from_packed`
+
+        .. code-block:: python
+
+            >>> SequenceRange(1, 5).packed
+            4294967301
+            >>> SequenceRange.from_packed(4294967301)
+            SequenceRange(1, 5, seq=None)
+        """
+
+        return (self._start._pos << 32) + self._stop._pos
+
+    def intern(self, store=None) -> 'SequenceRange':
+        """
+        this range with the :code:`seq` replaced by the shared instance of a
+        :code:`SequenceStore` (the global store if :code:`None`), so equal sequences are stored
+        once and compared by identity
+        """
+
+        if self._seq is None:
+            return self
+        store = global_sequence_store() if store is None else store
+        seq = store.intern(self._seq)
+        if seq is self._seq:
+            return self
+        return self._from_positions(self._start._pos, self._stop._pos, seq)
+
     def __eq__(self, other):
         return self._eq_helper(other)
 
     def _eq_helper(self, other, *, compare_seq=True):
+        if type(other) is type(self):
+            # fast path, compare the fields without constructing a copy of other
+            return (self._start._pos == other._start._pos and
+                    self._stop._pos == other._stop._pos and
+                    (not compare_seq or self._seq == other._seq))
         if self._comparison_cast(other):
             #  try:
             other = self.__class__(other, validate=False)
@@ -513,3 +654,8 @@ class SequenceRange(BaseSequenceLocation):
         elif isinstance(other, self.__class__.mro()[1]):  # isinstance of parent
             return self._eq_helper(other, compare_seq=compare_seq)
         return False
+
+
+def _unpickle_range(cls, start, stop, seq=None):
+    # invalid ranges can be pickled too, so they are restored without validation
+    return cls._from_positions(start, stop, seq)
@@ -0,0 +1,479 @@
+# core imports
+from collections.abc import Iterable
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._kernels import _pack, _unpack
+from ._point_array import SequencePointArray, POSITION_DTYPE
+from ._base import BaseSequenceLocation
+from ._interning import SequenceStore, global_sequence_store
+from ._point import SequencePoint
+from ._range import SequenceRange, _Pos, _Index
+from ._validation import _check_ranges, InvalidReason
+
+
+class SequenceRangeArray:
+    """
+    Columnar collection of :code:`SequenceRange`, the positions are stored as two compact
+    integer arrays (:code:`start` and :code:`stop`, human readable counting from 1) and an
+    optional object array of sequences, this makes bulk operations run at numpy speed, while
+    element access still returns ordinary :code:`SequenceRange` objects
+
+    viable calls to the constructor includes:
+
+        * :code:`SequenceRangeArray([SequenceRange(1, 5), (6, 9), "10:12"])`
+        * :code:`SequenceRangeArray([1, 6, 10], [5, 9, 12])`
+        * :code:`SequenceRangeArray(numpy_starts, numpy_stops, seq=peptides)`
+
+    :param start: iterable of anything :code:`SequenceRange` accepts, or start positions
+    :param stop: stop positions or :code:`None` if :code:`start` is an iterable of ranges
+    :param seq: optional sequences, one per range (:code:`None` for missing)
+    :param validate: raise exception if any row is invalid
+
+    .. code-block:: python
+
+        >>> ranges = SequenceRangeArray([(6, 9), (1, 5)])
+        >>> ranges[0]
+        SequenceRange(6, 9, seq=None)
+        >>> ranges.length
+        array([4, 5], dtype=int32)
+
+        # invalid rows are reported in bulk, without raising
+        >>> ranges = SequenceRangeArray([-1, 6, 5], [5, 9, 2], validate=False)
+        >>> ranges.is_valid()
+        array([False,  True, False])
+    """
+
+    def __init__(self, start: Union[Iterable, np.ndarray, 'SequenceRangeArray'],
+                 stop: Union[None, Iterable, np.ndarray]=None,
+                 seq: Union[None, Iterable]=None, *, validate: bool=True):
+        if stop is None:
+            if isinstance(start, self.__class__):
+                if seq is None:
+                    seq = start._seq
+                start, stop = start._start, start._stop
+            else:
+                start, stop, items_seq = self._columns_from_ranges(start)
+                if seq is None:
+                    seq = items_seq
+
+        self._start = np.asarray(start, dtype=POSITION_DTYPE)
+        self._stop = np.asarray(stop, dtype=POSITION_DTYPE)
+        if self._start.ndim != 1 or self._start.shape != self._stop.shape:
+            raise ValueError("start and stop has to be 1 dimensional and of same length")
+        self._seq = self._get_seq(seq)
+
+        if validate:
+            self.validate()
+
+    @classmethod
+    def _columns_from_ranges(cls, ranges):
+        starts, stops, seqs = [], [], []
+        for sr in ranges:
+            if not isinstance(sr, SequenceRange):
+                sr = SequenceRange(sr, validate=False)
+            start, stop = sr.pos
+            starts.append(start)
+            stops.append(stop)
+            seqs.append(sr.seq)
+        if not any(seq is not None for seq in seqs):
+            seqs = None
+        return starts, stops, seqs
+
+    def _get_seq(self, seq):
+        if seq is None:
+            return None
+        if isinstance(seq, np.ndarray) and seq.dtype == object:
+            seq_array = seq
+        else:
+            seq_array = np.empty(len(seq), dtype=object)
+            seq_array[:] = list(seq)
+        if seq_array.shape != self._start.shape:
+            raise ValueError("seq has to have the same length as start and stop")
+        return seq_array
+
+    @classmethod
+    def _from_columns(cls, start, stop, seq=None):
+        "fast internal constructor, assumes that the columns are already valid numpy arrays"
+        self = cls.__new__(cls)
+        self._start = start
+        self._stop = stop
+        self._seq = seq
+        return self
+
+    # alternative constructors
+    @classmethod
+    def from_index(cls, start_index, stop_index, seq=None, *, validate=True):
+        """
+        Alternative Constructure, using python indexes
+
+        :param start_index: python indexes of the start positions
+        :param stop_index: python indexes of the stop positions
+        """
+
+        start = np.asarray(start_index, dtype=POSITION_DTYPE) + 1
+        stop = np.asarray(stop_index, dtype=POSITION_DTYPE) + 1
+        return cls(start, stop, seq, validate=validate)
+
+    @classmethod
+    def from_slice(cls, start_slice, stop_slice, seq=None, *, validate=True):
+        """
+        Alternative Constructor, from slice coordinates, see :code:`SequenceRange.from_slice`
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray.from_slice([5], [9])[0]
+            SequenceRange(6, 9, seq=None)
+        """
+
+        start = np.asarray(start_slice, dtype=POSITION_DTYPE) + 1
+        stop = np.asarray(stop_slice, dtype=POSITION_DTYPE)
+        return cls(start, stop, seq, validate=validate)
+
+    @classmethod
+    def from_sequences(cls, full_sequence: Union[str, Iterable], sequences: Iterable):
+        """
+        Alternative Constructor, cut out many sequences from a full sequence (or one full
+        sequence per sequence), see :code:`SequenceRange.from_sequence`
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray.from_sequences('EVILELVISLIVES', ['ELVIS', 'LIVES'])
+            SequenceRangeArray([5:9, 10:14], length=2)
+
+        **Warning:** if a sequence is found multiple times, then the first occurance is used
+        """
+
+        sequences = list(sequences)
+        if isinstance(full_sequence, str):
+            start_index = list(map(full_sequence.find, sequences))
+        else:
+            full_sequence = list(full_sequence)
+            if len(full_sequence) != len(sequences):
+                raise ValueError("there has to be one full_sequence per sequence")
+            start_index = list(map(str.find, full_sequence, sequences))
+        start_index = np.array(start_index, dtype=POSITION_DTYPE)
+        missing = np.flatnonzero(start_index == -1)
+        if len(missing):
+            raise IndexError("row {}: {} not in the full sequence".format(
+                missing[0], sequences[missing[0]]))
+        length = np.fromiter(map(len, sequences), dtype=POSITION_DTYPE, count=len(sequences))
+        seq = np.empty(len(sequences), dtype=object)
+        seq[:] = sequences
+        return cls(start_index + 1, start_index + length, seq)
+
+    @classmethod
+    def from_packed(cls, packed, *, validate=True):
+        """
+        Alternative Constructor, from the int64 keys made by :code:`SequenceRangeArray.pack`
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray.from_packed([4294967301, 8589934594])
+            SequenceRangeArray([1:5, 2], length=2)
+        """
+
+        start, stop = _unpack(packed)
+        return cls(start.astype(POSITION_DTYPE), stop.astype(POSITION_DTYPE), validate=validate)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """
+        Concatenate several :code:`SequenceRangeArray`'s into one
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray.concatenate([SequenceRangeArray([(1, 2)]),
+            ...                                 SequenceRangeArray([(3, 4)])])
+            SequenceRangeArray([1:2, 3:4], length=2)
+        """
+
+        arrays = [array if isinstance(array, cls) else cls(array) for array in arrays]
+        start = np.concatenate([array._start for array in arrays] or [[]]).astype(
+            POSITION_DTYPE, copy=False)
+        stop = np.concatenate([array._stop for array in arrays] or [[]]).astype(
+            POSITION_DTYPE, copy=False)
+        seq = None
+        if any(array._seq is not None for array in arrays):
+            seq = np.concatenate([np.full(len(array), None, dtype=object) if array._seq is None
+                                  else array._seq for array in arrays])
+        return cls._from_columns(start, stop, seq)
+
+    # interop
+    @classmethod
+    def from_arrow(cls, array, *, validate=True):
+        "Alternative Constructor, from an Arrow array, see :code:`sequtils.from_arrow`"
+        from ._arrow import from_arrow
+        collection = from_arrow(array, validate=validate)
+        if not isinstance(collection, cls):
+            raise TypeError("cannot convert arrow type {} to {}".format(array.type, cls.__name__))
+        return collection
+
+    def to_arrow(self):
+        "Convert to an Arrow array without copying the positions, see :code:`sequtils.to_arrow`"
+        from ._arrow import to_arrow
+        return to_arrow(self)
+
+    def compress(self, *, block_size: int=4096):
+        "Compress the positions, see :code:`sequtils.CompressedRangeArray`"
+        from ._compression import CompressedRangeArray
+        return CompressedRangeArray(self, block_size=block_size)
+
+    # packed encoding, sorting and set operations
+    def pack(self) -> np.ndarray:
+        """
+        The positions of each range encoded in one int64 :code:`(start << 32) + stop`, which sorts
+        like the ranges and round trips exactly with :code:`from_packed`, the :code:`seq` is not
+        included, see :code:`SequenceRange.packed`
+        """
+
+        return _pack(self._start, self._stop)
+
+    def argsort(self):
+        "indexes that sort the ranges by start and then by stop"
+        return np.argsort(self.pack(), kind='stable')
+
+    def sort(self):
+        "sorted copy"
+        return self[self.argsort()]
+
+    def unique(self, return_inverse=False):
+        """
+        sorted unique ranges, optionally with the inverse index that reconstructs the original,
+        only the positions are compared, the :code:`seq` of the first occurrence is kept
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray([(5, 9), (1, 3), (5, 9)]).unique()
+            SequenceRangeArray([1:3, 5:9], length=2)
+        """
+
+        _, first, inverse = np.unique(self.pack(), return_index=True, return_inverse=True)
+        unique = self[first]
+        if return_inverse:
+            return unique, inverse.reshape(-1)
+        return unique
+
+    def isin(self, other) -> np.ndarray:
+        """
+        boolean mask, :code:`True` where the positions of the range are in :code:`other`
+
+        :param other: :code:`SequenceRangeArray` or iterable of range like objects
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray([(1, 3), (5, 9)]).isin([SequenceRange(5, 9)])
+            array([False,  True])
+        """
+
+        if not isinstance(other, SequenceRangeArray):
+            other = SequenceRangeArray(other, validate=False)
+        return np.isin(self.pack(), other.pack())
+
+    def equals(self, other, *, compare_seq: bool=True) -> np.ndarray:
+        """
+        row wise :code:`SequenceRange.equals` of two aligned collections, without boxing
+
+        :param other: :code:`SequenceRangeArray` or iterable of range like objects of the same
+                      length
+        :param compare_seq: if :code:`False` only the positions are compared
+
+        .. code-block:: python
+
+            >>> ranges = SequenceRangeArray([(1, 3), (5, 9)], seq=["AAA", None])
+            >>> ranges.equals([(1, 3), (5, 9)])
+            array([False,  True])
+            >>> ranges.equals([(1, 3), (5, 9)], compare_seq=False)
+            array([ True,  True])
+        """
+
+        if not isinstance(other, SequenceRangeArray):
+            other = SequenceRangeArray(other, validate=False)
+        if len(other) != len(self):
+            raise ValueError("cannot compare collections of length {} and {}".format(
+                len(self), len(other)))
+        equal = (self._start == other._start) & (self._stop == other._stop)
+        if compare_seq and (self._seq is not None or other._seq is not None):
+            missing = np.full(len(self), None, dtype=object)
+            self_seq = missing if self._seq is None else self._seq
+            other_seq = missing if other._seq is None else other._seq
+            equal &= (self_seq == other_seq).astype(bool)
+        return equal
+
+    # interned sequences
+    def seq_ids(self, store: Union[SequenceStore, None]=None) -> np.ndarray:
+        """
+        the id of each :code:`seq` in a :code:`SequenceStore` (the global store if
+        :code:`None`), -1 where there is no sequence, new sequences are added to the store
+        """
+
+        store = global_sequence_store() if store is None else store
+        if self._seq is None:
+            return np.full(len(self), -1, dtype=np.int64)
+        return store.ids(self._seq)
+
+    def intern(self, store: Union[SequenceStore, None]=None) -> 'SequenceRangeArray':
+        """
+        copy where every :code:`seq` is the shared instance of a :code:`SequenceStore` (the
+        global store if :code:`None`), so each distinct sequence is in memory once
+
+        .. code-block:: python
+
+            >>> store = SequenceStore()
+            >>> ranges = SequenceRangeArray([(1, 3), (5, 7)], seq=["AAA", "AA" + "A"])
+            >>> interned = ranges.intern(store)
+            >>> interned.seq[0] is interned.seq[1], len(store)
+            (True, 1)
+        """
+
+        if self._seq is None:
+            return self
+        store = global_sequence_store() if store is None else store
+        return self._from_columns(self._start, self._stop, store.sequences(store.ids(self._seq)))
+
+    @classmethod
+    def from_seq_ids(cls, start, stop, seq_ids, store: Union[SequenceStore, None]=None, *,
+                     validate: bool=True):
+        "Alternative Constructor, with the sequences given as ids of a :code:`SequenceStore`"
+        store = global_sequence_store() if store is None else store
+        return cls(start, stop, store.sequences(seq_ids), validate=validate)
+
+    # math, index based like SequenceRange + SequencePoint, i.e. shifts of both ends
+    # make numpy defer to __radd__, e.g for np.int64(5) + SequenceRangeArray
+    __array_ufunc__ = None
+
+    def _shift(self, other, operator):
+        if isinstance(other, (SequencePoint, SequencePointArray)):
+            other_index = other.index
+        elif isinstance(other, BaseSequenceLocation):
+            return NotImplemented
+        else:
+            other_index = np.asarray(other)
+            if other_index.dtype.kind not in 'iu':
+                return NotImplemented
+        # computed in int64, so positions outside of POSITION_DTYPE raise instead of wrapping
+        other_index = np.asarray(other_index, dtype=np.int64)
+        start = operator(self._start.astype(np.int64), other_index)
+        stop = operator(self._stop.astype(np.int64), other_index)
+        limits = np.iinfo(POSITION_DTYPE)
+        for column in (start, stop):
+            if column.size and (column.min() < limits.min or column.max() > limits.max):
+                raise OverflowError("shifted positions do not fit into {}".format(
+                    np.dtype(POSITION_DTYPE).name))
+        # the length is unchanged, so the seq is kept
+        return self._from_columns(start.astype(POSITION_DTYPE), stop.astype(POSITION_DTYPE),
+                                  self._seq)
+
+    def __add__(self, other):
+        """
+        shift the ranges by the index of points or by integers, like
+        :code:`SequenceRange + SequencePoint`, only :code:`ranges + other`,
+        :code:`other + ranges` and :code:`ranges - other` are supported, positions that do not
+        fit into :code:`POSITION_DTYPE` raise an :code:`OverflowError`
+
+        .. code-block:: python
+
+            >>> SequenceRangeArray([(1, 3), (2, 5)]) + SequencePoint(11)
+            SequenceRangeArray([11:13, 12:15], length=2)
+        """
+
+        return self._shift(other, np.add)
+
+    def __sub__(self, other):
+        return self._shift(other, np.subtract)
+
+    def __radd__(self, other):
+        return self._shift(other, np.add)
+
+    # validation
+    def validation(self):
+        """
+        Validate all rows at once without raising, returns a :code:`ValidationResult` with
+        a boolean mask of the valid rows and the :code:`InvalidReason` flags of each row
+
+        .. code-block:: python
+
+            >>> ranges = SequenceRangeArray([0, 5], [3, 6], seq=[None, "A"], validate=False)
+            >>> result = ranges.validation()
+            >>> result.valid
+            array([False, False])
+            >>> [InvalidReason(reason) for reason in result.reasons]
+            [<InvalidReason.START_BELOW_ONE: 1>, <InvalidReason.SEQ_LENGTH_MISMATCH: 4>]
+        """
+
+        return _check_ranges(self._start, self._stop, self._seq)
+
+    def is_valid(self):
+        "boolean mask of the valid rows, see :code:`validation`"
+        return self.validation().valid
+
+    def validate(self):
+        result = self.validation()
+        row = result.first_error()
+        if row is None:
+            return
+        reason = result.reasons[row]
+        start, stop = int(self._start[row]), int(self._stop[row])
+        if reason & InvalidReason.START_BELOW_ONE:
+            msg = "start < 1"
+        elif reason & InvalidReason.STOP_BEFORE_START:
+            msg = "stop({}) < start({})".format(stop, start)
+        else:
+            msg = "The sequence {} length does not match the one implied by {}".format(
+                self._seq[row], SequenceRange(start, stop, validate=False))
+        raise ValueError("row {}: {}".format(row, msg))
+
+    # properties, to make it read-only
+    @property
+    def seq(self) -> Union[None, np.ndarray]:
+        return self._seq
+
+    @property
+    def start(self) -> SequencePointArray:
+        return SequencePointArray._from_columns(self._start)
+
+    @property
+    def stop(self) -> SequencePointArray:
+        return SequencePointArray._from_columns(self._stop)
+
+    @property
+    def pos(self) -> _Pos:
+        return _Pos(self._start, self._stop)
+
+    @property
+    def index(self) -> _Index:
+        return _Index(self._start - 1, self._stop - 1)
+
+    @property
+    def length(self) -> np.ndarray:
+        return self._stop - self._start + 1
+
+    # dunders
+    def __len__(self):
+        return len(self._start)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            seq = None if self._seq is None else self._seq[item]
+            return SequenceRange._from_positions(int(self._start[item]), int(self._stop[item]),
+                                                 seq)
+        seq = None if self._seq is None else self._seq[item]
+        return self._from_columns(self._start[item], self._stop[item], seq)
+
+    def __reduce__(self):
+        # with pickle protocol 5 the numpy columns can be sent as out-of-band buffers
+        return (type(self)._from_columns, (self._start, self._stop, self._seq))
+
+    def __iter__(self):
+        seqs = [None] * len(self) if self._seq is None else self._seq
+        return map(SequenceRange._from_positions, self._start.tolist(), self._stop.tolist(),
+                   seqs)
+
+    def __repr__(self):
+        items = [str(sr) for sr in (self if len(self) <= 6 else self[[0, 1, 2, -3, -2, -1]])]
+        if len(self) > 6:
+            items[3:3] = ['...']
+        return "{}([{}], length={})".format(type(self).__name__, ", ".join(items), len(self))
@@ -0,0 +1,113 @@
+# core imports
+from collections.abc import Iterable
+from typing import Union
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._join import _as_ranges
+from ._kernels import _factorize, _keyed_positions, _previous_greater_equal
+from ._range_array import SequenceRangeArray
+
+
+_TERMINI = ('start', 'stop')
+ranges_types = Union[SequenceRangeArray, Iterable]
+
+
+def _codes(keys):
+    if keys is None:
+        return None
+    _, (codes,) = _factorize(keys)
+    return codes
+
+
+def _containment_parents(ranges, codes):
+    start, stop = ranges.pos
+    start, stop = _keyed_positions(codes, start), _keyed_positions(codes, stop)
+    # sorted by start and then by decreasing stop, every range is after all of its containers,
+    # so its container is the closest previous range that stops at or after its stop
+    order = np.lexsort((-stop, start))
+    previous = _previous_greater_equal(stop[order])
+    parents = np.full(len(ranges), -1, dtype=np.intp)
+    parents[order] = np.where(previous >= 0, order[previous], -1)
+    return parents
+
+
+def containment_forest(ranges: ranges_types, *, keys=None) -> np.ndarray:
+    r"""
+    The ranges nested into a forest, for each range the index of the range it is contained in
+    or -1 for the ranges, which are not inside any other range (see :code:`maximal_ranges`),
+    computed in :math:`O(n \log n)` instead of comparing all pairs with :code:`in`
+
+    :param ranges: :code:`SequenceRangeArray` or iterable of range like objects
+    :param keys: optional sequence identifier (e.g protein accession) of each range, ranges
+                 can only contain ranges with the same key
+
+    If several ranges contain a range, the parent is the one with the largest start (and for
+    equal starts the smallest stop), of identical ranges the first is the parent of the others,
+    the :code:`seq` is not compared
+
+    .. code-block:: python
+
+        >>> peptides = SequenceRangeArray([(1, 20), (3, 10), (5, 8), (12, 20), (25, 30)])
+        >>> containment_forest(peptides)
+        array([-1,  0,  1,  0, -1])
+    """
+
+    return _containment_parents(_as_ranges(ranges), _codes(keys))
+
+
+def maximal_ranges(ranges: ranges_types, *, keys=None) -> np.ndarray:
+    """
+    Indexes of the ranges, which are not contained in any other range (for identical ranges
+    only the first), i.e. the roots of :code:`containment_forest`, collapsing a peptide ladder
+    to its longest peptides
+
+    .. code-block:: python
+
+        >>> maximal_ranges([(1, 20), (3, 10), (1, 20), (12, 25)])
+        array([0, 3])
+    """
+
+    return np.flatnonzero(containment_forest(ranges, keys=keys) == -1)
+
+
+def _terminus_groups(ranges, terminus, min_size, codes):
+    if terminus not in _TERMINI:
+        raise ValueError("terminus has to be one of {}".format(_TERMINI))
+    if min_size < 1:
+        raise ValueError("min_size({}) < 1".format(min_size))
+    positions = ranges.pos[_TERMINI.index(terminus)]
+    _, inverse, counts = np.unique(_keyed_positions(codes, positions), return_inverse=True,
+                                   return_counts=True)
+    inverse = inverse.reshape(-1)
+    is_group = counts >= min_size
+    group = np.cumsum(is_group) - 1
+    return np.where(is_group[inverse], group[inverse], -1)
+
+
+def terminus_groups(ranges: ranges_types, terminus: str='start', *, min_size: int=2,
+                    keys=None) -> np.ndarray:
+    """
+    Group the ranges that share a terminus (ladders of peptides from the same cleavage site),
+    returns the group number of each range, or -1 for ranges in groups smaller than
+    :code:`min_size`, the groups are numbered by (key and) position, so
+    :code:`np.flatnonzero(groups == g)` are the indexes of group :code:`g`
+
+    :param ranges: :code:`SequenceRangeArray` or iterable of range like objects
+    :param terminus: :code:`'start'` or :code:`'stop'`, the shared position
+    :param min_size: the minimum number of ranges in a group
+    :param keys: optional sequence identifier of each range, only ranges with the same key
+                 are grouped
+
+    .. code-block:: python
+
+        >>> peptides = SequenceRangeArray([(1, 20), (3, 10), (1, 15), (5, 10), (1, 8)])
+        >>> terminus_groups(peptides, 'start')
+        array([ 0, -1,  0, -1,  0])
+        >>> terminus_groups(peptides, 'stop')
+        array([-1,  0, -1,  0, -1])
+    """
+
+    return _terminus_groups(_as_ranges(ranges), terminus, min_size, _codes(keys))
@@ -0,0 +1,95 @@
+# core imports
+from collections.abc import Iterable
+
+# 3rd party imports
+import numpy as np
+
+# local imports
+from ._point_array import POSITION_DTYPE
+from ._range_array import SequenceRangeArray
+
+
+def tile_sequence(length: int, chunk_size: int, *, overlap: int=0) -> SequenceRangeArray:
+    """
+    Split a sequence (e.g. a long protein or a concatenated proteome) into chunks of
+    :code:`chunk_size` residues, where consecutive chunks share :code:`overlap` residues, so
+    the chunks can be scanned in parallel
+
+    :param length: the length of the sequence
+    :param chunk_size: the length of each chunk, the last one can be shorter
+    :param overlap: residues shared by consecutive chunks, a hit of up to
+                    :code:`overlap + 1` residues is then completely inside of a chunk
+
+    .. code-block:: python
+
+        >>> tiles = tile_sequence(25, 10, overlap=3)
+        >>> tiles
+        SequenceRangeArray([1:10, 8:17, 15:24, 22:25], length=4)
+        >>> "ELVISLIVESINTHEBUILDINGYEAH"[tiles[1].slice]
+        'VESINTHEBU'
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size({}) < 1".format(chunk_size))
+    if not 0 <= overlap < chunk_size:
+        raise ValueError("overlap({}) has to be >= 0 and < chunk_size({})".format(
+            overlap, chunk_size))
+    if length < 1:
+        empty = np.zeros(0, dtype=POSITION_DTYPE)
+        return SequenceRangeArray._from_columns(empty, empty)
+
+    step = chunk_size - overlap
+    # the last chunk is the first one reaching the end of the sequence
+    n = max(1, -(-(length - overlap) // step))
+    start = 1 + step * np.arange(n, dtype=np.int64)
+    stop = np.minimum(start + chunk_size - 1, length)
+    return SequenceRangeArray._from_columns(start.astype(POSITION_DTYPE),
+                                            stop.astype(POSITION_DTYPE))
+
+
+def merge_tile_hits(tiles: SequenceRangeArray, hits: Iterable) -> SequenceRangeArray:
+    """
+    Combine the hits found in each tile into the hits of the whole sequence, the chunk local
+    positions are shifted back to global positions (:code:`local_hits + tile.start`) and
+    every hit is only kept in the tile that owns its start, i.e. from the start of the tile
+    up to the start of the next tile, so hits in the overlap of two tiles are not reported
+    twice
+
+    :param tiles: the tiles from :code:`tile_sequence`
+    :param hits: for each tile the hits in local positions (1 is the start of the tile), as
+                 :code:`SequenceRangeArray` or iterable of range like objects
+
+    If the hits are at most :code:`overlap + 1` residues long, the result is the same as
+    scanning the whole sequence at once, any longer hits might be missed or cut at a tile
+    border
+
+    .. code-block:: python
+
+        # "[KR][KR]" in each tile of "MKRAAAKKAARR"
+        >>> tiles = tile_sequence(12, 5, overlap=1)
+        >>> [str(tile) for tile in tiles]
+        ['1:5', '5:9', '9:12']
+        >>> hits = [[(2, 3)], [(3, 4)], [(3, 4)]]
+        >>> merge_tile_hits(tiles, hits)
+        SequenceRangeArray([2:3, 7:8, 11:12], length=3)
+    """
+
+    hits = list(hits)
+    if len(hits) != len(tiles):
+        raise ValueError("there has to be one set of hits per tile, got {} for {} tiles".format(
+            len(hits), len(tiles)))
+
+    merged = []
+    tile_start = tiles.pos[0]
+    for i, tile_hits in enumerate(hits):
+        if not isinstance(tile_hits, SequenceRangeArray):
+            tile_hits = SequenceRangeArray(tile_hits, validate=False)
+        tile_hits = tile_hits + tiles.start[i]
+        if i + 1 < len(tiles):
+            # hits starting in the overlap are reported by the next tile
+            tile_hits = tile_hits[tile_hits.pos[0] < tile_start[i + 1]]
+        merged.append(tile_hits)
+    if not merged:
+        empty = np.zeros(0, dtype=POSITION_DTYPE)
+        return SequenceRangeArray._from_columns(empty, empty)
+    return SequenceRangeArray.concatenate(merged)
@@ -0,0 +1,87 @@
+# core imports
+import collections
+import enum
+
+# 3rd party imports
+import numpy as np
+
+
+class InvalidReason(enum.IntFlag):
+    """
+    Bit flags describing why a row of a columnar collection is invalid, a row can fail for
+    several reasons at once, thus the flags are combined with :code:`|`
+
+    .. code-block:: python
+
+        >>> InvalidReason.START_BELOW_ONE | InvalidReason.STOP_BEFORE_START
+        <InvalidReason.START_BELOW_ONE|STOP_BEFORE_START: 3>
+    """
+
+    VALID = 0
+    START_BELOW_ONE = 1
+    STOP_BEFORE_START = 2
+    SEQ_LENGTH_MISMATCH = 4
+    # alias used for SequencePoint's, a position is the start of a point
+    POSITION_BELOW_ONE = 1
+
+
+class ValidationResult(collections.namedtuple("ValidationResult", ("valid", "reasons"))):
+    """
+    Result of a bulk validation
+
+    :param valid: boolean mask, :code:`True` for the valid rows
+    :param reasons: :code:`numpy.uint8` array of :code:`InvalidReason` flags (0 for valid rows)
+    """
+
+    __slots__ = ()
+
+    def counts(self):
+        """
+        Number of rows failing for each reason
+
+        .. code-block:: python
+
+            >>> result = ValidationResult(np.array([True, False]), np.array([0, 3], np.uint8))
+            >>> result.counts()[InvalidReason.STOP_BEFORE_START]
+            1
+        """
+
+        return {reason: int(np.count_nonzero(self.reasons & reason))
+                for reason in InvalidReason if reason}
+
+    def first_error(self):
+        "index of the first invalid row or :code:`None`"
+        invalid = np.flatnonzero(~self.valid)
+        if len(invalid):
+            return int(invalid[0])
+        return None
+
+
+def _check_ranges(start, stop, seq=None):
+    """
+    vectorized equivalent of :code:`SequenceRange.validate` and the length check in
+    :code:`SequenceRange._get_seq`, returns a :code:`ValidationResult`
+    """
+
+    reasons = (start < 1).view(np.uint8) * np.uint8(InvalidReason.START_BELOW_ONE)
+    reasons |= (stop < start).view(np.uint8) * np.uint8(InvalidReason.STOP_BEFORE_START)
+    if seq is not None:
+        reasons |= _seq_length_mismatch(seq, stop - start + 1).view(np.uint8) * \
+            np.uint8(InvalidReason.SEQ_LENGTH_MISMATCH)
+    return ValidationResult(reasons == 0, reasons)
+
+
+def _check_points(pos):
+    "vectorized equivalent of :code:`SequencePoint.validate`"
+    reasons = (pos < 1).view(np.uint8) * np.uint8(InvalidReason.POSITION_BELOW_ONE)
+    return ValidationResult(reasons == 0, reasons)
+
+
+def _seq_length_mismatch(seq, length):
+    has_seq = np.not_equal(seq, None)
+    mismatch = np.zeros(len(seq), dtype=bool)
+    if has_seq.any():
+        seq_length = np.fromiter(map(len, seq[has_seq]), dtype=np.int64,
+                                 count=int(has_seq.sum()))
+        mismatch[has_seq] = seq_length != length[has_seq]
+    return mismatch
@@ -44,7 +44,16 @@ with open("README.rst", "r") as fh:
         name=name,
         version=version,
         scripts=[],
+        install_requires=[
+            'numpy',
+        ],
         extras_require={
+            'arrow': [
+                'pyarrow',
+            ],
+            'pandas': [
+                'pandas',
+            ],
             'dev': [
                 'pytest',
                 #  'pytest-pep8',
@@ -0,0 +1,33 @@
+
+# core imports
+import os
+
+# 3rd party imports
+import pytest
+
+TEST_FOLDER = os.path.abspath(os.path.dirname(__file__))
+TEST_FILES_FOLDER = os.path.abspath(os.path.join(TEST_FOLDER, 'test_files'))
+
+########################################
+# fixtures
+########################################
+@pytest.fixture(scope='session')
+def glucagon_seq():
+    with open(os.path.join(TEST_FILES_FOLDER, 'glucagon.fasta')) as f:
+        return "".join(line.strip() for line in f.readlines()[1:])
+
+
+@pytest.fixture(scope='session')
+def glucagon_peptides():
+    """ all peptides from glucagon as ((start, stop, seq), ..) """
+
+    def get_peptide(f):
+        start, stop = map(int, f.readline().split('|')[-1].split('-'))
+        seq = f.readline().strip()
+        return start, stop, seq
+
+    peptides = []
+    with open(os.path.join(TEST_FILES_FOLDER, 'glucagon_peptides.fasta')) as f:
+        while f.tell() != os.fstat(f.fileno()).st_size:
+            peptides.append(get_peptide(f))
+    return tuple(peptides)
@@ -0,0 +1,79 @@
+
+# core imports
+import asyncio
+import threading
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import (SequenceRangeArray, KeyedRangeArray, aiter_chunks, aiter_from_sequences,
+                      from_sequences_async, run_async)
+
+
+########################################
+# Tests for the asyncio API
+########################################
+class TestAsync:
+    def test_from_sequences_matches_sync(self, glucagon_seq, glucagon_peptides):
+        sequences = [seq for _, _, seq in glucagon_peptides]
+        expected = SequenceRangeArray.from_sequences(glucagon_seq, sequences)
+        ranges = asyncio.run(from_sequences_async(glucagon_seq, sequences, chunk_size=7))
+        assert list(ranges) == list(expected)
+
+    def test_one_full_sequence_per_sequence(self):
+        async def collect():
+            return [ranges async for ranges in aiter_from_sequences(
+                ["ELVIS", "LIVES"], ["VIS", "LI"], chunk_size=1)]
+        chunks = asyncio.run(collect())
+        assert [str(chunk[0]) for chunk in chunks] == ["3:5", "1:2"]
+
+    def test_backpressure(self):
+        submitted = []
+
+        def work(chunk):
+            submitted.append(chunk[0])
+            return chunk
+
+        async def consume_two():
+            results = []
+            chunks = aiter_chunks(work, list(range(100)), chunk_size=10, prefetch=1)
+            async for chunk in chunks:
+                results.append(chunk)
+                if len(results) == 2:
+                    break
+            await chunks.aclose()
+            return results
+
+        results = asyncio.run(consume_two())
+        assert [chunk[0] for chunk in results] == [0, 10]
+        # two consumed chunks, and at most prefetch + 1 more submitted
+        assert len(submitted) <= 4
+
+    def test_runs_outside_the_loop_thread(self):
+        async def thread_of_work():
+            return await run_async(threading.get_ident), threading.get_ident()
+        worker, loop = asyncio.run(thread_of_work())
+        assert worker != loop
+
+    def test_run_async_coverage(self):
+        peptides = KeyedRangeArray(["P1", "P1"], [(1, 4), (3, 8)])
+        assert list(asyncio.run(run_async(peptides.coverage))) == [8]
+
+    def test_invalid_arguments(self):
+        async def consume(**kwargs):
+            return [chunk async for chunk in aiter_chunks(len, [1, 2], **kwargs)]
+        with pytest.raises(ValueError):
+            asyncio.run(consume(chunk_size=0))
+        with pytest.raises(ValueError):
+            asyncio.run(consume(prefetch=-1))
+        with pytest.raises(IndexError):
+            asyncio.run(from_sequences_async("ELVIS", ["X"]))
+
+
+class TestFromSequences:
+    def test_errors(self):
+        with pytest.raises(IndexError):
+            SequenceRangeArray.from_sequences("ELVIS", ["LIVES"])
+        with pytest.raises(ValueError):
+            SequenceRangeArray.from_sequences(["ELVIS"], ["EL", "VI"])
@@ -0,0 +1,61 @@
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import (SequenceRange, SequencePointArray, SequenceRangeArray, KeyedRangeArray,
+                      KeyedPointArray, to_arrow, from_arrow, write_parquet, read_parquet)
+
+pa = pytest.importorskip('pyarrow')
+
+
+########################################
+# Tests for the Arrow and Parquet interop
+########################################
+class TestArrow:
+    def test_range_round_trip_is_zero_copy(self):
+        ranges = SequenceRangeArray([1, 6], [5, 9])
+        array = to_arrow(ranges)
+        assert array.type == pa.struct([('start', pa.int32()), ('stop', pa.int32()),
+                                        ('seq', pa.string())])
+        assert array.field('start').buffers()[1].address == ranges.pos[0].ctypes.data
+        back = from_arrow(array)
+        assert list(back) == list(ranges)
+        assert back.pos[0].ctypes.data == ranges.pos[0].ctypes.data
+        assert back.seq is None
+
+    def test_seq(self):
+        ranges = SequenceRangeArray([SequenceRange(6, seq="LIVE"), SequenceRange(1, 2)])
+        array = ranges.to_arrow()
+        assert array.field('seq').to_pylist() == ["LIVE", None]
+        assert list(SequenceRangeArray.from_arrow(array)) == list(ranges)
+
+    def test_points(self):
+        points = SequencePointArray([6, 9])
+        array = points.to_arrow()
+        assert array.type == pa.int32()
+        assert list(SequencePointArray.from_arrow(array)) == list(points)
+        with pytest.raises(TypeError):
+            SequenceRangeArray.from_arrow(array)
+
+    def test_invalid_rows_are_validated(self):
+        array = to_arrow(SequenceRangeArray([5], [1], validate=False))
+        with pytest.raises(ValueError):
+            from_arrow(array)
+        assert not from_arrow(array, validate=False).is_valid().any()
+
+    def test_parquet(self, tmp_path):
+        ranges = SequenceRangeArray([SequenceRange(6, seq="LIVE"), SequenceRange(1, 2)])
+        write_parquet(ranges, tmp_path / "ranges.parquet")
+        assert list(read_parquet(tmp_path / "ranges.parquet")) == list(ranges)
+
+        keyed = KeyedRangeArray(["P2", "P1", "P2"], [(1, 5), (2, 3), (4, 9)])
+        write_parquet(keyed, tmp_path / "keyed.parquet")
+        back = read_parquet(tmp_path / "keyed.parquet")
+        assert isinstance(back, KeyedRangeArray)
+        assert back.key.tolist() == keyed.key.tolist()
+        assert list(back["P2"]) == list(keyed["P2"])
+
+        points = KeyedPointArray(["P2", "P1"], [3, 4])
+        write_parquet(points, tmp_path / "points.parquet")
+        assert read_parquet(tmp_path / "points.parquet").key.tolist() == ["P2", "P1"]
@@ -0,0 +1,82 @@
+# core imports
+import io
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import SequenceRangeArray, CompressedRangeArray, iter_compressed
+
+
+########################################
+# Tests for CompressedRangeArray
+########################################
+def _assert_same_positions(left, right):
+    np.testing.assert_array_equal(left.pos[0], right.pos[0])
+    np.testing.assert_array_equal(left.pos[1], right.pos[1])
+
+
+@pytest.fixture
+def peptides():
+    rng = np.random.default_rng(47)
+    start = np.sort(rng.integers(1, 100000, 10000))
+    return SequenceRangeArray(start, start + rng.integers(5, 40, len(start)))
+
+
+class TestCompressedRangeArray:
+    @pytest.mark.parametrize("block_size", [1, 7, 4096, 100000])
+    def test_roundtrip(self, peptides, block_size):
+        compressed = CompressedRangeArray(peptides, block_size=block_size)
+        assert len(compressed) == len(peptides)
+        _assert_same_positions(compressed.decompress(), peptides)
+        restored = CompressedRangeArray.from_bytes(compressed.to_bytes())
+        _assert_same_positions(restored.decompress(), peptides)
+
+    def test_unsorted_negative_and_invalid_ranges(self):
+        ranges = SequenceRangeArray([(50, 60), (-3, 2), (8, 4), (2**30, 2**30), (1, 1)],
+                                    validate=False)
+        _assert_same_positions(CompressedRangeArray(ranges, block_size=2).decompress(), ranges)
+
+    def test_sorted_ranges_compress(self, peptides):
+        compressed = peptides.compress()
+        assert compressed.nbytes * 4 < peptides.pos[0].nbytes + peptides.pos[1].nbytes
+
+    def test_random_access(self, peptides):
+        compressed = CompressedRangeArray(peptides, block_size=100)
+        assert compressed.n_blocks == 100
+        _assert_same_positions(compressed.block(42), peptides[4200:4300])
+        _assert_same_positions(compressed.block(-1), peptides[9900:])
+        assert compressed[4321] == peptides[4321]
+        assert compressed[-1] == peptides[-1]
+        with pytest.raises(IndexError):
+            compressed[len(peptides)]
+        with pytest.raises(IndexError):
+            compressed.block(100)
+        with pytest.raises(TypeError):
+            compressed[1:3]
+
+    def test_streaming_from_file(self, peptides):
+        file = io.BytesIO()
+        CompressedRangeArray(peptides, block_size=300).write(file)
+        file.seek(0)
+        blocks = list(iter_compressed(file))
+        assert [len(block) for block in blocks[:2]] == [300, 300]
+        _assert_same_positions(SequenceRangeArray.concatenate(blocks), peptides)
+        file.seek(0)
+        _assert_same_positions(CompressedRangeArray.read(file).decompress(), peptides)
+
+    def test_empty(self):
+        compressed = CompressedRangeArray([])
+        assert len(compressed) == 0 and compressed.n_blocks == 0
+        assert len(compressed.decompress()) == 0
+        assert len(CompressedRangeArray.from_bytes(compressed.to_bytes())) == 0
+
+    def test_errors(self, peptides):
+        data = CompressedRangeArray(peptides).to_bytes()
+        with pytest.raises(ValueError):
+            CompressedRangeArray.from_bytes(b"XXXX" + data[4:])
+        with pytest.raises(ValueError):
+            list(iter_compressed(io.BytesIO(data[:-10])))
+        with pytest.raises(ValueError):
+            CompressedRangeArray(peptides, block_size=0)
@@ -0,0 +1,98 @@
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import KeyedRangeArray, CoverageReport, coverage_report, iter_coverage_report
+
+
+########################################
+# Tests for coverage_report
+########################################
+def _random_sample(rng, lengths, n):
+    proteins = sorted(lengths)
+    keys = rng.choice(proteins, n)
+    start = rng.integers(-3, 60, n)
+    return KeyedRangeArray(keys, list(zip(start, start + rng.integers(0, 15, n))),
+                           validate=False)
+
+
+def _expected(peptides, length, max_depth):
+    "per residue loop over the ranges of one protein"
+    depth = np.zeros(length, dtype=int)
+    for sr in peptides:
+        for pos in sr.positions():
+            if 1 <= pos <= length:
+                depth[pos - 1] += 1
+    runs, previous = [], None
+    for covered in depth > 0:
+        if covered != previous:
+            runs.append([covered, 0])
+            previous = covered
+        runs[-1][1] += 1
+    histogram = [int((np.minimum(depth, max_depth) == d).sum()) for d in range(max_depth + 1)]
+    return (int((depth > 0).sum()), sum(covered for covered, _ in runs),
+            max([n for covered, n in runs if not covered], default=0), histogram)
+
+
+class TestCoverageReport:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+    def test_agrees_with_loops(self, chunk_size):
+        rng = np.random.default_rng(45)
+        lengths = {"P{}".format(i): int(length)
+                   for i, length in enumerate(rng.integers(0, 70, 8))}
+        samples = {"A": _random_sample(rng, lengths, 50), "B": _random_sample(rng, lengths, 5)}
+        report = coverage_report(samples, lengths, max_depth=3, chunk_size=chunk_size)
+        assert len(report) == 2 * len(lengths)
+        for i in range(len(report)):
+            sample, protein = report.sample[i], report.protein[i]
+            peptides = samples[sample][protein] if protein in samples[sample] else []
+            covered, segments, longest_gap, histogram = _expected(
+                peptides, lengths[protein], 3)
+            assert report.length[i] == lengths[protein]
+            assert report.covered[i] == covered
+            assert report.segments[i] == segments
+            assert report.longest_gap[i] == longest_gap
+            assert report.depth_histogram[i].tolist() == histogram
+            if lengths[protein]:
+                assert report.percent_covered[i] == pytest.approx(
+                    100 * covered / lengths[protein])
+
+    def test_streams_chunks_in_order(self):
+        peptides = KeyedRangeArray(["P1", "P3"], [(1, 5), (2, 3)])
+        lengths = [("P3", 10), ("P2", 4), ("P1", 5)]
+        chunks = list(iter_coverage_report(peptides, lengths, chunk_size=2))
+        assert [chunk.protein.tolist() for chunk in chunks] == [["P1", "P2"], ["P3"]]
+        assert all(sample is None for chunk in chunks for sample in chunk.sample)
+        assert CoverageReport.concatenate(chunks).covered.tolist() == [5, 0, 2]
+
+    def test_processes(self):
+        rng = np.random.default_rng(46)
+        lengths = {"P{}".format(i): 60 for i in range(20)}
+        peptides = _random_sample(rng, lengths, 200)
+        serial = coverage_report(peptides, lengths, chunk_size=3)
+        parallel = coverage_report(peptides, lengths, chunk_size=3, processes=2)
+        for left, right in zip(serial, parallel):
+            np.testing.assert_array_equal(left, right)
+
+    def test_errors(self):
+        peptides = KeyedRangeArray(["P1"], [(1, 5)])
+        with pytest.raises(KeyError):
+            coverage_report(peptides, {"P2": 10})
+        with pytest.raises(ValueError):
+            coverage_report(peptides, {"P1": 10}, max_depth=0)
+        with pytest.raises(ValueError):
+            coverage_report(peptides, [("P1", 10), ("P1", 5)])
+
+    def test_empty(self):
+        report = coverage_report(KeyedRangeArray([], []), {})
+        assert len(report) == 0
+        assert report.depth_histogram.shape == (0, 11)
+        assert coverage_report({}, {"P1": 10}, max_depth=3).depth_histogram.shape == (0, 4)
+
+    def test_to_pandas(self):
+        pytest.importorskip("pandas")
+        report = coverage_report(KeyedRangeArray(["P1"], [(1, 5)]), {"P1": 10}, max_depth=2)
+        frame = report.to_pandas()
+        assert list(frame.columns[-3:]) == ["depth_0", "depth_1", "depth_2"]
+        assert frame["covered"].tolist() == [5]
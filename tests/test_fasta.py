@@ -0,0 +1,71 @@
+
+# core imports
+import os
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import SequenceRange, FastaBatch, read_fasta, read_peptide_fasta
+
+TEST_FOLDER = os.path.abspath(os.path.dirname(__file__))
+TEST_FILES_FOLDER = os.path.abspath(os.path.join(TEST_FOLDER, 'test_files'))
+GLUCAGON = os.path.join(TEST_FILES_FOLDER, 'glucagon.fasta')
+GLUCAGON_PEPTIDES = os.path.join(TEST_FILES_FOLDER, 'glucagon_peptides.fasta')
+
+
+########################################
+# Tests for the FASTA readers
+########################################
+class TestReadFasta:
+    def test_protein(self, glucagon_seq):
+        (header, protein), = read_fasta(GLUCAGON)
+        assert header.startswith("sp|P01275|GLUC_HUMAN")
+        assert protein == SequenceRange(1, seq=glucagon_seq)
+
+    def test_peptides(self, glucagon_peptides):
+        records = list(read_peptide_fasta(GLUCAGON_PEPTIDES))
+        assert [sr for header, sr in records] == [SequenceRange(*peptide)
+                                                 for peptide in glucagon_peptides]
+        assert records[0][0] == "sp|P01275|1-20"
+
+    def test_batches(self, glucagon_peptides):
+        batches = list(read_peptide_fasta(GLUCAGON_PEPTIDES, batch_size=4))
+        assert [len(batch.headers) for batch in batches] == [4, 4, 3]
+        assert all(isinstance(batch, FastaBatch) for batch in batches)
+        ranges = [sr for batch in batches for sr in batch.ranges]
+        assert ranges == [SequenceRange(*peptide) for peptide in glucagon_peptides]
+        with pytest.raises(ValueError):
+            read_peptide_fasta(GLUCAGON_PEPTIDES, batch_size=0)
+        with pytest.raises(ValueError):
+            read_fasta(GLUCAGON, batch_size=-1)
+
+    def test_multi_line_crlf_and_empty_files(self, tmp_path):
+        path = tmp_path / "test.fasta"
+        path.write_bytes(b">P1 first\r\nELVIS\r\nLIVES\r\n>P2\nEVIL\n")
+        records = list(read_fasta(path))
+        assert records == [("P1 first", SequenceRange(1, seq="ELVISLIVES")),
+                           ("P2", SequenceRange(1, seq="EVIL"))]
+        batch, = read_fasta(path, batch_size=10)
+        assert batch.ranges.length.tolist() == [10, 4]
+
+        empty = tmp_path / "empty.fasta"
+        empty.write_bytes(b"")
+        assert list(read_fasta(empty)) == []
+
+    def test_empty_records_are_skipped(self, tmp_path):
+        path = tmp_path / "test.fasta"
+        path.write_bytes(b">p1\nMKV\n>p2\n\n>p3\nABC\n>p4")
+        assert list(read_fasta(path)) == [("p1", SequenceRange(1, seq="MKV")),
+                                          ("p3", SequenceRange(1, seq="ABC"))]
+        batch, = read_fasta(path, batch_size=10)
+        assert batch.headers == ["p1", "p3"]
+        path.write_bytes(b">sp|P1|1-3\nMKV\n>sp|P1|4-6\n>sp|P1|7-9\nABC\n")
+        assert [header for header, _ in read_peptide_fasta(path)] == ["sp|P1|1-3", "sp|P1|7-9"]
+
+    def test_custom_coordinates(self, tmp_path):
+        path = tmp_path / "test.fasta"
+        path.write_text(">P1 start=6 stop=9\nLIVE\n")
+        coordinates = lambda header: [int(field.split('=')[1]) for field in header.split()[1:]]
+        (header, peptide), = read_peptide_fasta(path, coordinates=coordinates)
+        assert peptide == SequenceRange(6, 9, seq="LIVE")
@@ -0,0 +1,86 @@
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import (SequenceRange, SequencePointArray, KeyedPointArray, EncodedProteins)
+
+
+########################################
+# Tests for EncodedProteins
+########################################
+@pytest.fixture
+def proteins(glucagon_seq):
+    return {"glucagon": glucagon_seq, "short": "MKWVX", "empty_window": "A"}
+
+
+def _expected_window(encoded, sequence, center, window):
+    "the window via from_center_and_window and slicing, padded where it is clipped"
+    sr = SequenceRange.from_center_and_window(center, window, max_length=len(sequence))
+    row = np.zeros(2 * window + 1, dtype=np.uint8)
+    offset = sr.start.pos - (center - window)
+    row[offset:offset + len(sr)] = encoded.encode(sequence[sr.slice])
+    return row
+
+
+class TestEncodedProteins:
+    def test_encoding(self, proteins):
+        encoded = EncodedProteins(proteins)
+        assert list(encoded.categories) == sorted(proteins)
+        assert list(encoded.lengths) == [len(proteins[key]) for key in sorted(proteins)]
+        # M, K, W, V and the unknown X
+        assert list(encoded["short"]) == [11, 9, 19, 18, 21]
+        assert len(encoded.buffer) == sum(map(len, proteins.values()))
+        with pytest.raises(KeyError):
+            encoded["missing"]
+        with pytest.raises(ValueError):
+            EncodedProteins([("P1", "A"), ("P1", "C")])
+
+    @pytest.mark.parametrize("window", [0, 1, 7])
+    def test_windows_match_from_center_and_window(self, proteins, window):
+        encoded = EncodedProteins(proteins)
+        keys, centers = [], []
+        for key, sequence in proteins.items():
+            keys.extend([key] * len(sequence))
+            centers.extend(range(1, len(sequence) + 1))
+        windows = encoded.windows(centers, window, keys=keys)
+        assert windows.shape == (len(centers), 2 * window + 1)
+        assert windows.dtype == np.uint8
+        for row, key, center in zip(windows, keys, centers):
+            np.testing.assert_array_equal(
+                row, _expected_window(encoded, proteins[key], center, window))
+
+        ranges = encoded.window_ranges(centers, window, keys=keys)
+        assert list(ranges) == [
+            SequenceRange.from_center_and_window(center, window, max_length=len(proteins[key]))
+            for key, center in zip(keys, centers)]
+
+    def test_keyed_points(self, proteins):
+        encoded = EncodedProteins(proteins)
+        points = KeyedPointArray(["short", "glucagon"], SequencePointArray([2, 30]))
+        np.testing.assert_array_equal(
+            encoded.windows(points, 3),
+            encoded.windows([2, 30], 3, keys=["short", "glucagon"]))
+        with pytest.raises(ValueError):
+            encoded.windows(points, 3, keys=["short", "glucagon"])
+
+    def test_single_protein_needs_no_keys(self, glucagon_seq):
+        encoded = EncodedProteins({"glucagon": glucagon_seq})
+        np.testing.assert_array_equal(encoded.windows([1], 2)[0],
+                                      _expected_window(encoded, glucagon_seq, 1, 2))
+
+    def test_errors(self, proteins):
+        encoded = EncodedProteins(proteins)
+        with pytest.raises(ValueError):
+            encoded.windows([1], 2)
+        with pytest.raises(KeyError):
+            encoded.windows([1], 2, keys=["missing"])
+        with pytest.raises(ValueError):
+            encoded.windows([1], -1, keys=["short"])
+
+    def test_one_hot(self, proteins):
+        encoded = EncodedProteins(proteins)
+        windows = encoded.windows([1, 3], 2, keys=["short", "short"])
+        one_hot = np.eye(len(encoded.alphabet) + 2, dtype=np.uint8)[windows]
+        assert one_hot.shape == (2, 5, 22)
+        assert (one_hot.sum(axis=2) == 1).all()
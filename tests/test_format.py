@@ -0,0 +1,42 @@
+
+# core imports
+import io
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import SequencePointArray, SequenceRangeArray, format_ranges, write_ranges
+
+
+########################################
+# Tests for the bulk formatter
+########################################
+class TestFormatRanges:
+    def test_matches_str(self):
+        rng = np.random.default_rng(8)
+        start = rng.integers(1, 1000, 500)
+        ranges = SequenceRangeArray(start, start + rng.integers(0, 3, 500))
+        assert format_ranges(ranges).splitlines() == [str(sr) for sr in ranges]
+
+    def test_points(self):
+        points = SequencePointArray([1, 20])
+        assert format_ranges(points, line_end=",") == "1,20,"
+
+    def test_write_in_chunks(self):
+        ranges = SequenceRangeArray([(1, 5), (7, 7), (10, 20)])
+        buffer = io.StringIO()
+        write_ranges(ranges, buffer, chunk_size=2)
+        assert buffer.getvalue() == "1:5\n7\n10:20\n"
+        with pytest.raises(ValueError):
+            write_ranges(ranges, buffer, chunk_size=0)
+
+    def test_empty(self):
+        assert format_ranges(SequenceRangeArray([], [])) == ""
+
+    def test_zero_and_negative(self):
+        ranges = SequenceRangeArray([0, 10, -3], [0, 100, 5], validate=False)
+        assert format_ranges(ranges) == "0\n10:100\n-3:5\n"
+        ranges = SequenceRangeArray([0, 105], [7, 105], validate=False)
+        assert format_ranges(ranges) == "0:7\n105\n"
@@ -0,0 +1,62 @@
+
+# core imports
+import random
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import SequenceRange, SequenceRangeArray, RangeIndex
+
+
+def _covered(ranges):
+    return len({pos for sr in ranges for pos in range(sr.start.pos, sr.stop.pos + 1)})
+
+
+########################################
+# Tests for RangeIndex
+########################################
+class TestRangeIndex:
+    def test_random_updates_match_brute_force(self):
+        rng = random.Random(40)
+        index, expected = RangeIndex(), []
+        for step in range(1500):
+            if expected and rng.random() < 0.3:
+                sr = rng.choice(expected)
+                expected.remove(sr)
+                index.remove(sr)
+            else:
+                start = rng.randint(1, 3000)
+                sr = SequenceRange(start, start + rng.randint(0, 40))
+                expected.append(sr)
+                index.add(sr)
+            if step % 100 == 0:
+                assert index.coverage == _covered(expected)
+                start = rng.randint(1, 3000)
+                stop = start + rng.randint(0, 50)
+                overlapping = sorted(sr for sr in expected
+                                     if sr.start.pos <= stop and start <= sr.stop.pos)
+                assert index.overlapping(start, stop) == overlapping
+        assert list(index) == sorted(expected)
+        assert len(index) == len(expected)
+
+    def test_duplicates_and_seq(self):
+        index = RangeIndex([(1, 4), (1, 4), SequenceRange(1, 4, seq="ELVI")])
+        assert len(index) == 3 and index.coverage == 4
+        index.remove(SequenceRange(1, 4, seq="ELVI"))
+        assert SequenceRange(1, 4, seq="ELVI") not in index
+        assert (1, 4) in index
+        index.remove((1, 4))
+        index.remove((1, 4))
+        assert len(index) == 0 and index.coverage == 0
+        with pytest.raises(KeyError):
+            index.remove((1, 4))
+        index.discard((1, 4))
+
+    def test_grows_and_validates(self):
+        index = RangeIndex(SequenceRangeArray([(1, 3), (5000, 5010)]))
+        assert index.coverage == 14
+        assert index.to_array().pos[0].tolist() == [1, 5000]
+        assert index.overlapping(5005) == [SequenceRange(5000, 5010)]
+        with pytest.raises(ValueError):
+            index.add(SequenceRange(5, 3, validate=False))
@@ -0,0 +1,81 @@
+# core imports
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import SequenceRange, SequenceRangeArray, SequenceStore, global_sequence_store
+
+
+########################################
+# Tests for SequenceStore and interning
+########################################
+def _copy(sequence):
+    "an equal but distinct str object"
+    return "".join(list(sequence))
+
+
+class TestSequenceStore:
+    def test_ids_and_sequences_roundtrip(self):
+        store = SequenceStore(["ELVIS"])
+        sequences = ["LIVES", None, _copy("ELVIS"), "LIVES", "KING"]
+        ids = store.ids(sequences)
+        assert ids.tolist() == [1, -1, 0, 1, 2]
+        assert store.sequences(ids).tolist() == sequences
+        assert store.id("KING") == 2 and len(store) == 3
+        assert "LIVES" in store and "QUEEN" not in store
+        assert list(store) == ["ELVIS", "LIVES", "KING"]
+
+    def test_errors(self):
+        store = SequenceStore(["ELVIS"])
+        with pytest.raises(TypeError):
+            store.id(5)
+        with pytest.raises(IndexError):
+            store.sequences([1])
+        with pytest.raises(IndexError):
+            store[-1]
+
+    def test_intern_ranges(self):
+        store = SequenceStore()
+        first = SequenceRange(1, 5, seq=_copy("ELVIS")).intern(store)
+        second = SequenceRange(10, 14, seq=_copy("ELVIS")).intern(store)
+        assert first.seq is second.seq
+        assert first.intern(store) is first
+        assert SequenceRange(1, 2).intern(store).seq is None
+
+    def test_intern_range_arrays(self):
+        store = SequenceStore()
+        ranges = SequenceRangeArray([(1, 3), (5, 7), (8, 9)], seq=[_copy("AAA"), "AAA", None])
+        interned = ranges.intern(store)
+        assert list(interned) == list(ranges)
+        assert interned.seq[0] is interned.seq[1] is store[0]
+        ids = ranges.seq_ids(store)
+        assert ids.tolist() == [0, 0, -1]
+        restored = SequenceRangeArray.from_seq_ids(*ranges.pos, ids, store)
+        assert list(restored) == list(ranges)
+        assert SequenceRangeArray([(1, 2)]).seq_ids(store).tolist() == [-1]
+
+    def test_global_store(self):
+        sr = SequenceRange(1, 5, seq=_copy("GLOBALSEQ"[:5])).intern()
+        assert sr.seq is global_sequence_store().intern("GLOBA")
+        ids = SequenceRangeArray([sr]).seq_ids()
+        assert global_sequence_store()[int(ids[0])] == "GLOBA"
+
+    def test_interned_sequences_pickle_once(self):
+        ranges = SequenceRangeArray(np.arange(1, 1001), np.arange(5, 1005),
+                                    seq=[_copy("ELVIS") for _ in range(1000)])
+        interned = ranges.intern(SequenceStore())
+        assert len(pickle.dumps(interned)) < len(pickle.dumps(ranges))
+
+    def test_threads_share_a_store(self):
+        store = SequenceStore()
+        sequences = [_copy("PEP{}".format(i % 500)) for i in range(20000)]
+        with ThreadPoolExecutor(8) as pool:
+            ids = list(pool.map(store.ids, [sequences[i::8] for i in range(8)]))
+        assert len(store) == 500
+        for i, chunk in enumerate(ids):
+            assert store.sequences(chunk).tolist() == sequences[i::8]
+        assert list(pickle.loads(pickle.dumps(store))) == list(store)
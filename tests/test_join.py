@@ -0,0 +1,191 @@
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import (SequencePoint, SequenceRange, SequencePointArray, SequenceRangeArray,
+                      KeyedPointArray, KeyedRangeArray, point_range_pairs, point_range_counts,
+                      range_overlap_pairs, iter_range_overlaps, nearest_range, nearest_terminus)
+
+
+def _random_ranges(rng, n, max_pos=200, max_length=30):
+    start = rng.integers(1, max_pos, n)
+    return SequenceRangeArray(start, start + rng.integers(0, max_length, n))
+
+
+########################################
+# Tests for point in range joins
+########################################
+class TestPointRangeJoin:
+    def test_pairs_agree_with_nested_loops(self):
+        rng = np.random.default_rng(0)
+        points = SequencePointArray(rng.integers(1, 250, 300))
+        ranges = _random_ranges(rng, 200)
+        pairs = point_range_pairs(points, ranges)
+        expected = {(p, r) for p, point in enumerate(points) for r, sr in enumerate(ranges)
+                    if sr._contains(point)}
+        assert set(zip(pairs.point.tolist(), pairs.range.tolist())) == expected
+        assert len(pairs.point) == len(expected)
+
+    def test_counts_agree_with_pairs(self):
+        rng = np.random.default_rng(1)
+        points = SequencePointArray(rng.integers(1, 250, 300))
+        ranges = _random_ranges(rng, 200)
+        pairs = point_range_pairs(points, ranges)
+        expected = np.bincount(pairs.point, minlength=len(points))
+        assert point_range_counts(points, ranges).tolist() == expected.tolist()
+
+    def test_keys(self):
+        rng = np.random.default_rng(2)
+        points = SequencePointArray(rng.integers(1, 100, 200))
+        ranges = _random_ranges(rng, 100, max_pos=80)
+        point_keys = rng.choice(["P1", "P2", "P3"], len(points))
+        range_keys = rng.choice(["P1", "P2", "P4"], len(ranges))
+        pairs = point_range_pairs(points, ranges, point_keys=point_keys, range_keys=range_keys)
+        expected = {(p, r) for p, point in enumerate(points) for r, sr in enumerate(ranges)
+                    if sr._contains(point) and point_keys[p] == range_keys[r]}
+        assert set(zip(pairs.point.tolist(), pairs.range.tolist())) == expected
+        counts = point_range_counts(points, ranges, point_keys=point_keys, range_keys=range_keys)
+        assert counts.tolist() == np.bincount(pairs.point, minlength=len(points)).tolist()
+
+    def test_keys_are_required_for_both_sides(self):
+        with pytest.raises(ValueError):
+            point_range_pairs([1], [(1, 2)], point_keys=["P1"])
+
+    def test_accepts_plain_objects(self):
+        pairs = point_range_pairs([SequencePoint(3)], [SequenceRange(1, 5), SequenceRange(4, 6)])
+        assert pairs.range.tolist() == [0]
+
+    def test_empty(self):
+        pairs = point_range_pairs(SequencePointArray([]), SequenceRangeArray([], []))
+        assert len(pairs.point) == len(pairs.range) == 0
+
+
+########################################
+# Tests for range overlap joins
+########################################
+class TestRangeOverlapJoin:
+    @staticmethod
+    def _expected(left, right, min_overlap=1, left_keys=None, right_keys=None):
+        expected = {}
+        for l, left_sr in enumerate(left):
+            for r, right_sr in enumerate(right):
+                if left_keys is not None and left_keys[l] != right_keys[r]:
+                    continue
+                start = max(left_sr.start.pos, right_sr.start.pos)
+                stop = min(left_sr.stop.pos, right_sr.stop.pos)
+                if stop - start + 1 >= min_overlap:
+                    expected[l, r] = SequenceRange(start, stop)
+        return expected
+
+    @staticmethod
+    def _found(join):
+        return dict(zip(zip(join.left.tolist(), join.right.tolist()), join.overlap))
+
+    def test_pairs_agree_with_nested_loops(self):
+        rng = np.random.default_rng(3)
+        left, right = _random_ranges(rng, 150), _random_ranges(rng, 100, max_length=60)
+        for min_overlap in (1, 5, 20):
+            join = range_overlap_pairs(left, right, min_overlap=min_overlap)
+            assert self._found(join) == self._expected(left, right, min_overlap)
+            assert (join.overlap.length >= min_overlap).all()
+
+    def test_keys(self):
+        rng = np.random.default_rng(4)
+        left, right = _random_ranges(rng, 150), _random_ranges(rng, 100)
+        left_keys = rng.choice(["P1", "P2"], len(left))
+        right_keys = rng.choice(["P1", "P2", "P3"], len(right))
+        join = range_overlap_pairs(left, right, left_keys=left_keys, right_keys=right_keys)
+        assert self._found(join) == self._expected(left, right, 1, left_keys, right_keys)
+
+    def test_identical_and_touching_ranges(self):
+        join = range_overlap_pairs([(5, 10)], [(5, 10), (10, 12), (11, 12), (1, 4)])
+        assert join.right.tolist() == [0, 1]
+
+    def test_streaming_gives_the_same_pairs(self):
+        rng = np.random.default_rng(5)
+        left, right = _random_ranges(rng, 150), _random_ranges(rng, 100)
+        join = range_overlap_pairs(left, right)
+        batches = list(iter_range_overlaps(left, right, batch_size=7))
+        assert all(len(batch.left) <= 7 for batch in batches)
+        assert np.concatenate([batch.left for batch in batches]).tolist() == join.left.tolist()
+        assert np.concatenate([batch.overlap.length for batch in batches]).tolist() == \
+            join.overlap.length.tolist()
+
+    def test_min_overlap_has_to_be_positive(self):
+        with pytest.raises(ValueError):
+            range_overlap_pairs([(1, 2)], [(1, 2)], min_overlap=0)
+
+
+########################################
+# Tests for nearest neighbour queries
+########################################
+def _signed_distance(start, stop, target_start, target_stop):
+    if stop < target_start:
+        return stop - target_start
+    if start > target_stop:
+        return start - target_stop
+    return 0
+
+
+class TestNearest:
+    @staticmethod
+    def _check(join, queries, targets, query_keys=None, target_keys=None):
+        "the found target is at the minimal distance, and upstream on ties"
+        for i, (start, stop) in enumerate(queries):
+            distances = {j: _signed_distance(start, stop, *target)
+                         for j, target in enumerate(targets)
+                         if target_keys is None or target_keys[j] == query_keys[i]}
+            if not distances:
+                assert join.range[i] == -1 and join.distance[i] == 0
+                continue
+            best = min(abs(distance) for distance in distances.values())
+            assert join.distance[i] == distances[join.range[i]]
+            assert abs(join.distance[i]) == best
+            if best and best in distances.values():
+                assert join.distance[i] > 0
+
+    def test_points_agree_with_all_pairs(self):
+        rng = np.random.default_rng(46)
+        points = SequencePointArray(rng.integers(1, 250, 300))
+        ranges = _random_ranges(rng, 40)
+        join = nearest_range(points, ranges)
+        self._check(join, zip(points.pos, points.pos), list(zip(*ranges.pos)))
+
+    def test_ranges_and_keys(self):
+        rng = np.random.default_rng(47)
+        queries, ranges = _random_ranges(rng, 200), _random_ranges(rng, 30)
+        query_keys = rng.choice(["P1", "P2", "P3"], len(queries))
+        range_keys = rng.choice(["P1", "P2"], len(ranges))
+        join = nearest_range(queries, ranges, query_keys=query_keys, range_keys=range_keys)
+        self._check(join, zip(*queries.pos), list(zip(*ranges.pos)), query_keys, range_keys)
+        assert (join.range[query_keys == "P3"] == -1).all()
+
+        keyed = KeyedRangeArray(range_keys, ranges).nearest(KeyedRangeArray(query_keys, queries))
+        assert keyed.range.tolist() == join.range.tolist()
+        assert keyed.distance.tolist() == join.distance.tolist()
+
+    @pytest.mark.parametrize("terminus", ["start", "stop"])
+    def test_terminus(self, terminus):
+        rng = np.random.default_rng(48)
+        points = SequencePointArray(rng.integers(1, 250, 300))
+        ranges = _random_ranges(rng, 40)
+        point_keys = rng.choice(["P1", "P2"], len(points))
+        range_keys = rng.choice(["P1", "P2"], len(ranges))
+        join = nearest_terminus(points, ranges, terminus, point_keys=point_keys,
+                                range_keys=range_keys)
+        termini = getattr(ranges, terminus).pos
+        self._check(join, zip(points.pos, points.pos), list(zip(termini, termini)),
+                    point_keys, range_keys)
+
+        keyed = KeyedRangeArray(range_keys, ranges).nearest_terminus(
+            KeyedPointArray(point_keys, points), terminus)
+        assert keyed.range.tolist() == join.range.tolist()
+
+    def test_invalid_and_missing_ranges(self):
+        invalid = SequenceRangeArray([(10, 5)], validate=False)
+        assert nearest_range([1, 2], invalid).range.tolist() == [-1, -1]
+        assert nearest_terminus([1], [], 'stop').range.tolist() == [-1]
+        with pytest.raises(ValueError):
+            nearest_terminus([1], [(1, 2)], 'middle')
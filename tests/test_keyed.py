@@ -0,0 +1,79 @@
+
+# core imports
+import pickle
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import (SequenceRange, SequenceRangeArray, KeyedPointArray, KeyedRangeArray,
+                      point_range_pairs, range_overlap_pairs)
+
+
+@pytest.fixture
+def keyed_ranges():
+    rng = np.random.default_rng(6)
+    start = rng.integers(1, 150, 300)
+    ranges = SequenceRangeArray(start, start + rng.integers(0, 25, 300))
+    return KeyedRangeArray(rng.choice(["P1", "P2", "P3"], 300), ranges)
+
+
+########################################
+# Tests for KeyedRangeArray and KeyedPointArray
+########################################
+class TestKeyedRangeArray:
+    def test_groups_are_sorted_and_complete(self, keyed_ranges):
+        rows = []
+        for key, ranges in keyed_ranges.groups():
+            assert list(ranges) == sorted(ranges)
+            assert (keyed_ranges.key[keyed_ranges.rows(key)] == key).all()
+            rows.extend(keyed_ranges.rows(key))
+        assert sorted(rows) == list(range(len(keyed_ranges)))
+
+    def test_mapping_interface(self, keyed_ranges):
+        assert "P1" in keyed_ranges and "P4" not in keyed_ranges
+        with pytest.raises(KeyError):
+            keyed_ranges["P4"]
+
+    def test_pickle(self, keyed_ranges):
+        restored = pickle.loads(pickle.dumps(keyed_ranges, protocol=5))
+        assert (restored.key == keyed_ranges.key).all()
+        assert list(restored["P2"]) == list(keyed_ranges["P2"])
+
+    def test_from_dict(self):
+        keyed = KeyedRangeArray.from_dict({"P2": [(1, 3)], "P1": [(5, 9), (2, 3)]})
+        assert keyed.categories.tolist() == ["P1", "P2"]
+        assert list(keyed["P1"]) == [SequenceRange(2, 3), SequenceRange(5, 9)]
+        assert keyed.key.tolist() == ["P2", "P1", "P1"]
+
+    def test_overlapping(self, keyed_ranges):
+        for key in keyed_ranges.categories:
+            for start, stop in ((1, 1), (20, 40), (100, 300)):
+                query = SequenceRange(start, stop)
+                expected = [row for row in keyed_ranges.rows(key)
+                            if keyed_ranges.ranges[row].contains(query, part=any)]
+                assert sorted(keyed_ranges.overlapping(key, start, stop)) == sorted(expected)
+
+    def test_coverage(self, keyed_ranges):
+        for key, coverage in zip(keyed_ranges.categories, keyed_ranges.coverage()):
+            covered = {pos for sr in keyed_ranges[key] for pos in range(sr.start.pos,
+                                                                        sr.stop.pos + 1)}
+            assert coverage == len(covered)
+
+    def test_joins_agree_with_key_arguments(self, keyed_ranges):
+        rng = np.random.default_rng(7)
+        points = KeyedPointArray(rng.choice(["P0", "P1", "P2"], 100), rng.integers(1, 160, 100))
+        pairs = keyed_ranges.point_pairs(points)
+        expected = point_range_pairs(points.points, keyed_ranges.ranges,
+                                     point_keys=points.key, range_keys=keyed_ranges.key)
+        assert sorted(zip(pairs.point, pairs.range)) == sorted(zip(expected.point,
+                                                                   expected.range))
+        counts = keyed_ranges.point_counts(points)
+        assert counts.tolist() == np.bincount(pairs.point, minlength=len(points)).tolist()
+
+        other = KeyedRangeArray(["P3", "P1"], [(10, 20), (30, 35)])
+        join = keyed_ranges.overlap_pairs(other, min_overlap=2)
+        expected = range_overlap_pairs(keyed_ranges.ranges, other.ranges, min_overlap=2,
+                                       left_keys=keyed_ranges.key, right_keys=other.key)
+        assert sorted(zip(join.left, join.right)) == sorted(zip(expected.left, expected.right))
@@ -0,0 +1,91 @@
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import (SequenceRange, KeyedRangeArray, MassTable, MassIndex, mass_to_mz,
+                      mz_to_mass)
+from sequtils._mass import MONOISOTOPIC_MASSES, WATER
+
+
+########################################
+# Tests for MassTable and MassIndex
+########################################
+def _mass(sequence):
+    return sum(MONOISOTOPIC_MASSES[residue] for residue in sequence) + WATER
+
+
+@pytest.fixture
+def proteins(glucagon_seq):
+    return {"glucagon": glucagon_seq, "P2": "MKWVTFISLLFLFSSAYS", "unknown": "PEPXIDE"}
+
+
+def _random_peptides(rng, proteins, n):
+    keys = rng.choice(sorted(proteins), n)
+    lengths = np.array([len(proteins[key]) for key in keys])
+    start = (rng.random(n) * lengths).astype(int) + 1
+    stop = np.minimum(start + rng.integers(0, 20, n), lengths)
+    return KeyedRangeArray(keys, list(zip(start, stop)))
+
+
+class TestMassTable:
+    def test_agrees_with_summing_the_residues(self, proteins):
+        table = MassTable(proteins)
+        peptides = _random_peptides(np.random.default_rng(49), proteins, 300)
+        masses = table.masses(peptides)
+        for mass, key, sr in zip(masses, peptides.key, peptides.ranges):
+            sequence = proteins[key][sr.slice]
+            if "X" in sequence:
+                assert np.isnan(mass)
+            else:
+                assert mass == pytest.approx(_mass(sequence), abs=1e-6)
+        np.testing.assert_array_equal(
+            table.masses(peptides.ranges, keys=peptides.key), masses)
+
+    def test_single_range(self, proteins):
+        table = MassTable(proteins)
+        assert table.mass("P2", (1, 4)) == pytest.approx(_mass("MKWV"))
+        assert table.mass("unknown", SequenceRange(1, 3)) == pytest.approx(_mass("PEP"))
+        assert np.isnan(table.mass("unknown", SequenceRange(3, 5)))
+
+    def test_errors(self, proteins):
+        table = MassTable(proteins)
+        with pytest.raises(IndexError):
+            table.mass("P2", (10, 19))
+        with pytest.raises(KeyError):
+            table.mass("missing", (1, 2))
+        with pytest.raises(ValueError):
+            table.masses([(1, 2)])
+
+
+class TestMassIndex:
+    def test_mz_conversion(self):
+        assert mz_to_mass(mass_to_mz(1000.0, 3), 3) == pytest.approx(1000.0)
+
+    @pytest.mark.parametrize("unit, tolerance", [("ppm", 20), ("Da", 0.5)])
+    def test_agrees_with_all_pairs(self, proteins, unit, tolerance):
+        rng = np.random.default_rng(50)
+        table = MassTable(proteins)
+        masses = table.masses(_random_peptides(rng, proteins, 500))
+        index = MassIndex(masses)
+        charge = rng.integers(1, 4, 50)
+        query_mass = rng.choice(masses[~np.isnan(masses)], 50) + rng.normal(0, 0.3, 50)
+        mz = mass_to_mz(query_mass, charge)
+        matches = index.query(mz, charge=charge, tolerance=tolerance, unit=unit)
+        query_mass = mz_to_mass(mz, charge)
+        delta = query_mass * tolerance * 1e-6 if unit == "ppm" else np.full(50, tolerance)
+        expected = {(q, r) for q in range(50) for r in range(len(masses))
+                    if abs(masses[r] - query_mass[q]) <= delta[q]}
+        assert set(zip(matches.query.tolist(), matches.range.tolist())) == expected
+        np.testing.assert_allclose(matches.error, masses[matches.range] -
+                                   query_mass[matches.query])
+        assert index.counts(mz, charge=charge, tolerance=tolerance, unit=unit).tolist() == \
+            np.bincount(matches.query, minlength=50).tolist()
+
+    def test_errors(self):
+        index = MassIndex([100.0, np.nan])
+        assert len(index) == 1
+        with pytest.raises(ValueError):
+            index.query([100.0], unit="mDa")
+        with pytest.raises(ValueError):
+            index.query([100.0], tolerance=-1)
@@ -0,0 +1,61 @@
+
+# core imports
+import os
+import re
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import SequenceRange, MotifScanner, prosite_to_regex, read_fasta
+from conftest import TEST_FILES_FOLDER
+
+
+########################################
+# Tests for MotifScanner
+########################################
+class TestProsite:
+    @pytest.mark.parametrize("pattern, regex", [
+        ("N-{P}-[ST]-{P}.", "N[^P][ST][^P]"),
+        ("C-x(2)-C-x(3,5)-H", "C.{2}C.{3,5}H"),
+        ("<M-[AG]", "^M[AG]"),
+        ("[ST]-x-[RK]>", "[ST].[RK]$"),
+        ("R-[G>]", "R(?:[G]|$)"),
+    ])
+    def test_conversion(self, pattern, regex):
+        assert prosite_to_regex(pattern) == regex
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            prosite_to_regex("N-{P}-ST")
+
+
+class TestMotifScanner:
+    def test_matches_from_slice(self, glucagon_seq):
+        scanner = MotifScanner(["[KR][KR]", "N[^P][ST]"])
+        hits = scanner.scan({"glucagon": glucagon_seq}, with_seq=True)
+        for pattern in scanner.names:
+            expected = [SequenceRange.from_slice(match.start(1), match.end(1),
+                                                 seq=match.group(1))
+                        for match in re.finditer("(?=(" + pattern + "))", glucagon_seq)]
+            assert list(hits[pattern]["glucagon"]) == expected
+
+    def test_overlapping_matches(self):
+        hits = MotifScanner({"AA": "AA"}).scan([("P1", "AAAA"), ("P2", "CAAC")])
+        assert [str(sr) for sr in hits["AA"]["P1"]] == ["1:2", "2:3", "3:4"]
+        assert [str(sr) for sr in hits["AA"]["P2"]] == ["2:3"]
+
+    def test_parallel_matches_serial(self):
+        proteins = list(read_fasta(os.path.join(TEST_FILES_FOLDER, 'glucagon_peptides.fasta')))
+        scanner = MotifScanner({"N-glyco": "N-{P}-[ST]-{P}", "dibasic": "[KR]-[KR]"},
+                               prosite=True)
+        serial = scanner.scan(proteins, chunk_size=7)
+        parallel = scanner.scan(proteins, processes=2, chunk_size=7)
+        for name in scanner.names:
+            assert (serial[name].key == parallel[name].key).all()
+            assert list(serial[name].ranges) == list(parallel[name].ranges)
+        assert len(serial["dibasic"]) > 0
+
+    def test_no_hits(self):
+        hits = MotifScanner(["W"]).scan({"P1": "AAA"})
+        assert len(hits["W"]) == 0
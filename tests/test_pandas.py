@@ -0,0 +1,85 @@
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import SequenceRange, SequenceRangeArray
+
+pd = pytest.importorskip('pandas')
+
+
+@pytest.fixture
+def series():
+    return pd.Series(["6:9", (1, 5), SequenceRange(7, 7), None, SequenceRange(6, seq="LIVE")],
+                     dtype="sequence_range")
+
+
+########################################
+# Tests for the pandas extension dtype
+########################################
+class TestSequenceRangeDtype:
+    def test_elements_are_sequence_ranges(self, series):
+        assert series[0] == SequenceRange(6, 9)
+        assert series[3] is pd.NA
+        assert series[4].seq == "LIVE"
+        assert series.isna().tolist() == [False, False, False, True, False]
+
+    def test_str(self, series):
+        assert series.astype(str).tolist()[:3] == ["6:9", "1:5", "7"]
+
+    def test_equality_includes_seq(self, series):
+        assert (series == SequenceRange(6, 9)).tolist() == [True, False, False, False, False]
+        assert series.nunique() == 4
+
+    def test_sort_groupby_and_merge(self, series):
+        assert series.dropna().sort_values().tolist() == sorted(series.dropna().tolist())
+        df = pd.DataFrame({"peptide": series, "intensity": [1, 2, 3, 4, 5]})
+        summed = df.groupby("peptide").intensity.sum()
+        assert summed[SequenceRange(6, 9)] == 1
+        assert summed[SequenceRange(6, seq="LIVE")] == 5
+        merged = df.merge(df.iloc[[1, 4]], on="peptide")
+        assert merged.intensity_x.tolist() == [2, 5]
+
+    def test_take_and_reindex(self, series):
+        reindexed = series.reindex([1, 10])
+        assert reindexed[1] == SequenceRange(1, 5)
+        assert reindexed[10] is pd.NA
+        filled = series.array.take([0, -1], allow_fill=True, fill_value=SequenceRange(2, 3))
+        assert list(filled) == [SequenceRange(6, 9), SequenceRange(2, 3)]
+        empty = pd.Series([], dtype="sequence_range").reindex([0, 1])
+        assert empty.isna().tolist() == [True, True]
+
+    def test_setitem(self, series):
+        series.iloc[0] = (2, 3)
+        series[1] = "2:3"
+        series.array[2] = SequenceRange(7, 9, seq="ELV")
+        series[4] = None
+        assert series.tolist()[:3] == [SequenceRange(2, 3), SequenceRange(2, 3),
+                                       SequenceRange(7, 9, seq="ELV")]
+        assert series.isna().tolist() == [False, False, False, True, True]
+        series[:2] = ["1:1", SequenceRange(4, seq="VI")]
+        assert series.tolist()[:2] == [SequenceRange(1, 1), SequenceRange(4, seq="VI")]
+
+    def test_is_backed_by_a_sequence_range_array(self, series):
+        assert isinstance(series.array.ranges, SequenceRangeArray)
+        assert series.array.ranges.pos[0].dtype == np.int32
+
+
+class TestAccessor:
+    def test_columns(self, series):
+        assert series.sequtils.start.tolist()[:3] == [6, 1, 7]
+        assert series.sequtils.length.tolist() == [4, 5, 1, pd.NA, 4]
+        assert series.sequtils.seq.tolist()[4] == "LIVE"
+
+    def test_contains_agrees_with_sequence_range(self, series):
+        for item in (7, (5, 6), (6, 9)):
+            for part in (all, any):
+                result = series.sequtils.contains(item, part=part).tolist()
+                expected = [pd.NA if sr is pd.NA else sr.contains(item, part=part)
+                            for sr in series]
+                assert result == expected
+
+    def test_requires_the_dtype(self):
+        with pytest.raises(AttributeError):
+            pd.Series([1, 2]).sequtils
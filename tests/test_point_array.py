@@ -0,0 +1,74 @@
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import SequencePoint, SequenceRange, SequencePointArray, SequenceRangeArray
+
+
+########################################
+# Tests for SequencePointArray
+########################################
+class TestSequencePointArray:
+    #              1234567890
+    protein_seq = "ELVISLIVES"
+
+    class TestConstructor:
+        def test_from_points_ints_and_strings(self):
+            points = SequencePointArray([SequencePoint(1), 2, "3", b"4"])
+            assert points.pos.tolist() == [1, 2, 3, 4]
+            assert points.index.tolist() == [0, 1, 2, 3]
+
+        def test_from_index(self):
+            assert SequencePointArray.from_index([0, 5]).pos.tolist() == [1, 6]
+
+        def test_invalid_positions_raise(self):
+            with pytest.raises(ValueError):
+                SequencePointArray([1, 0])
+            points = SequencePointArray([1, 0, -5], validate=False)
+            assert points.is_valid().tolist() == [True, False, False]
+
+    def test_element_access_returns_sequence_points(self):
+        points = SequencePointArray([6, 9])
+        assert points[1] == SequencePoint(9)
+        assert list(points) == [SequencePoint(6), SequencePoint(9)]
+        assert isinstance(points[:1], SequencePointArray)
+
+    def test_math_agrees_with_sequence_point(self):
+        points = SequencePointArray([2, 10])
+        for other in (1, SequencePoint(2)):
+            assert list(points + other) == [p + other for p in points]
+            assert list(other + points) == [other + p for p in points]
+            assert list(points - other) == [p - other for p in points]
+        assert list(10 - points) == [10 - p for p in points]
+        assert list(np.int64(3) + points) == [3 + p for p in points]
+        assert list(points + points) == [p + p for p in points]
+
+    def test_point_plus_range_is_not_implemented(self):
+        with pytest.raises(TypeError):
+            SequencePointArray([2]) + SequenceRange(2, 3)
+
+    def test_sort_unique_and_membership(self):
+        points = SequencePointArray([5, 2, 5, 9])
+        assert points.sort().pos.tolist() == [2, 5, 5, 9]
+        unique, inverse = points.unique(return_inverse=True)
+        assert unique.pos.tolist() == [2, 5, 9]
+        assert unique.pos[inverse].tolist() == points.pos.tolist()
+        assert points.isin([9, SequencePoint(2)]).tolist() == [False, True, False, True]
+        assert SequencePoint(9) in points
+        assert 3 not in points
+        assert points.equals([5, SequencePoint(3), 5, 9]).tolist() == [True, False, True, True]
+        with pytest.raises(ValueError):
+            points.equals([5])
+
+    def test_residues(self):
+        points = SequencePointArray([1, 6, 10])
+        assert points.residues(self.protein_seq).tolist() == ['E', 'L', 'S']
+        with pytest.raises(IndexError):
+            SequencePointArray([11]).residues(self.protein_seq)
+
+    def test_start_and_stop_of_range_arrays(self):
+        ranges = SequenceRangeArray([(6, 9), (1, 5)])
+        assert list(ranges.start) == [SequencePoint(6), SequencePoint(1)]
+        assert ranges.stop.residues(self.protein_seq).tolist() == ['E', 'S']
@@ -0,0 +1,69 @@
+
+# core imports
+import pickle
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import (SequencePoint, SequenceRange, SequencePointArray, SequenceRangeArray,
+                      profiling)
+
+
+########################################
+# Tests for the profiling instrumentation
+########################################
+class TestProfiling:
+    def test_counters(self):
+        with profiling() as profile:
+            SequenceRange(1, 5) == (1, 5)
+            SequencePoint(3) + 2
+            SequenceRange(5, 1, validate=False).is_valid()
+        assert profile.constructions["SequenceRange(int, int)"] == 1
+        assert profile.constructions["SequenceRange(tuple, validate=False)"] == 1
+        assert profile.casts["SequenceRange._eq_helper: tuple -> SequenceRange"] == 1
+        assert profile.casts["BaseSequenceLocation._arithmetic: int -> SequencePoint"] == 1
+        assert profile.validations["SequenceRange"] == 2
+        key = "BaseSequenceLocation.is_valid <- SequenceRange.validate: ValueError"
+        assert profile.exceptions == {key: 1}
+        assert profile.calls["SequenceRange.__init__"] == 3
+        assert profile.time["SequenceRange.__init__"] > 0
+        assert "implicit casts (total 2)" in profile.summary()
+
+    def test_fast_constructions(self):
+        points, ranges = SequencePointArray([1, 2, 3]), SequenceRangeArray([(1, 2), (3, 5)])
+        data = pickle.dumps(SequenceRange(2, seq="AB"))
+        with profiling() as profile:
+            assert len(list(SequenceRange(1, 50))) == 50
+            list(points)
+            points[0]
+            list(ranges)
+            ranges[1]
+            pickle.loads(data)
+        assert profile.constructions["SequencePoint._from_pos(int)"] == 50 + 4 + 2 * 4
+        assert profile.constructions["SequenceRange._from_positions(int, int)"] == 3
+        assert profile.constructions["SequenceRange._from_positions(int, int, str)"] == 1
+        assert list(SequenceRange(1, 3)) == [SequencePoint(1), SequencePoint(2),
+                                             SequencePoint(3)]
+
+    def test_swallowed_exceptions_in_arithmetic(self):
+        with profiling() as profile:
+            SequencePoint(2) + SequenceRange(1, 5)
+        key = "BaseSequenceLocation._arithmetic <- SequencePoint.__new__: TypeError"
+        assert profile.exceptions[key] == 1
+
+    def test_classes_are_restored(self):
+        init, from_index = SequencePoint.__init__, SequenceRange.__dict__['from_index']
+        with pytest.raises(ZeroDivisionError):
+            with profiling():
+                assert SequencePoint.__init__ is not init
+                1 / 0
+        assert SequencePoint.__init__ is init
+        assert SequenceRange.__dict__['from_index'] is from_index
+        assert SequenceRange.from_index(0, 4) == SequenceRange(1, 5)
+
+    def test_not_reentrant(self):
+        with profiling():
+            with pytest.raises(RuntimeError):
+                with profiling():
+                    pass
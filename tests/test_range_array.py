@@ -0,0 +1,154 @@
+
+# core imports
+import pickle
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import (SequencePoint, SequenceRange, SequencePointArray, SequenceRangeArray,
+                      InvalidReason)
+
+
+########################################
+# Tests for SequenceRangeArray
+########################################
+class TestSequenceRangeArray:
+    class TestConstructor:
+        def test_from_ranges_and_from_columns_are_equivalent(self):
+            from_ranges = SequenceRangeArray([SequenceRange(1, 5), (6, 9), "10:12"])
+            from_columns = SequenceRangeArray([1, 6, 10], [5, 9, 12])
+            assert list(from_ranges) == list(from_columns)
+
+        def test_seq_is_kept(self):
+            ranges = SequenceRangeArray([SequenceRange(6, seq="LIVE"), SequenceRange(1, 2)])
+            assert ranges[0] == SequenceRange(6, seq="LIVE")
+            assert ranges[1].seq is None
+
+        def test_from_index_and_from_slice(self):
+            assert SequenceRangeArray.from_index([5], [8])[0] == SequenceRange.from_index(5, 8)
+            assert SequenceRangeArray.from_slice([5], [9])[0] == SequenceRange.from_slice(5, 9)
+
+        def test_invalid_rows_raise(self):
+            with pytest.raises(ValueError):
+                SequenceRangeArray([1, 5], [2, 4])
+            with pytest.raises(ValueError):
+                SequenceRangeArray([1], [2], seq=["ABC"])
+
+        def test_mismatched_columns_raise(self):
+            with pytest.raises(ValueError):
+                SequenceRangeArray([1, 2], [3])
+
+    def test_slicing_returns_an_array(self):
+        ranges = SequenceRangeArray([1, 6, 10], [5, 9, 12])
+        assert isinstance(ranges[1:], SequenceRangeArray)
+        assert list(ranges[ranges.length > 3]) == [SequenceRange(1, 5), SequenceRange(6, 9)]
+
+    def test_pos_and_index(self):
+        ranges = SequenceRangeArray([(6, 9)])
+        assert ranges.pos[0][0] == 6 and ranges.pos[1][0] == 9
+        assert ranges.index[0][0] == 5 and ranges.index[1][0] == 8
+
+    class TestValidation:
+        def test_agrees_with_is_valid_of_the_elements(self):
+            ranges = SequenceRangeArray([-2, 1, 5, 0, 3], [4, 1, 4, -1, 3], validate=False)
+            assert ranges.is_valid().tolist() == [sr.is_valid() for sr in ranges]
+
+        def test_reasons(self):
+            ranges = SequenceRangeArray([1, 0, 5, 0, 1], [3, 3, 4, -1, 2],
+                                        seq=["ABC", None, None, None, "A"], validate=False)
+            result = ranges.validation()
+            assert result.valid.tolist() == [True, False, False, False, False]
+            assert result.reasons.tolist() == [
+                InvalidReason.VALID,
+                InvalidReason.START_BELOW_ONE,
+                InvalidReason.STOP_BEFORE_START,
+                InvalidReason.START_BELOW_ONE | InvalidReason.STOP_BEFORE_START,
+                InvalidReason.SEQ_LENGTH_MISMATCH]
+            assert result.counts()[InvalidReason.START_BELOW_ONE] == 2
+            assert result.first_error() == 1
+
+        def test_after_arithmetic(self):
+            ranges = SequenceRangeArray([sr - 5 for sr in SequenceRangeArray([3, 8], [9, 12])],
+                                        validate=False)
+            assert ranges.is_valid().tolist() == [False, True]
+
+    class TestPickle:
+        def test_roundtrip(self):
+            ranges = SequenceRangeArray([1, 6], [5, 9], seq=["ELVIS", "LIVE"])
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                restored = pickle.loads(pickle.dumps(ranges, protocol=protocol))
+                assert list(restored) == list(ranges)
+
+        def test_out_of_band_buffers(self):
+            ranges = SequenceRangeArray(np.arange(1, 1001), np.arange(1, 1001) + 3)
+            buffers = []
+            data = pickle.dumps(ranges, protocol=5, buffer_callback=buffers.append)
+            assert len(buffers) == 2
+            assert len(data) < 1000
+            restored = pickle.loads(data, buffers=buffers)
+            assert np.shares_memory(restored.pos[0], ranges.pos[0])
+            assert list(restored) == list(ranges)
+
+    class TestPacked:
+        def test_roundtrip_and_order(self):
+            rng = np.random.default_rng(39)
+            start = rng.integers(-1000, 1000, 500)
+            ranges = SequenceRangeArray(start, start + rng.integers(-5, 20, 500), validate=False)
+            packed = ranges.pack()
+            assert packed.dtype == np.int64
+            restored = SequenceRangeArray.from_packed(packed, validate=False)
+            assert list(restored) == list(ranges)
+            assert list(ranges.sort()) == sorted(ranges)
+            assert [sr.packed for sr in ranges] == packed.tolist()
+            assert all(SequenceRange.from_packed(key, validate=False) == sr
+                       for key, sr in zip(packed.tolist(), ranges))
+
+        def test_canonical(self):
+            assert SequenceRange(3, 5).packed == 3 << 32 | 5
+            with pytest.raises(ValueError):
+                SequenceRange.from_packed(SequenceRange(5, 3, validate=False).packed)
+
+        def test_unique_and_isin(self):
+            ranges = SequenceRangeArray([(5, 9), (1, 3), (5, 9), (5, 7)], seq=None)
+            unique, inverse = ranges.unique(return_inverse=True)
+            assert [str(sr) for sr in unique] == ["1:3", "5:7", "5:9"]
+            assert list(unique[inverse]) == list(ranges)
+            assert ranges.isin(["5:9", (1, 4)]).tolist() == [True, False, True, False]
+
+    def test_shift_agrees_with_the_elements(self):
+        ranges = SequenceRangeArray([(1, 3), (5, 9)], seq=["AAA", None])
+        for other in (SequencePoint(11), 4, np.int64(4)):
+            assert list(ranges + other) == [sr + other for sr in ranges]
+            assert list(other + ranges) == [sr + other for sr in ranges]
+            assert list(ranges - other) == [sr - other for sr in ranges]
+        shifts = SequencePointArray([2, 10])
+        assert list(ranges + shifts) == [sr + point for sr, point in zip(ranges, shifts)]
+        with pytest.raises(TypeError):
+            ranges + SequenceRange(1, 2)
+        with pytest.raises(TypeError):
+            ranges + 1.5
+        with pytest.raises(TypeError):
+            10 - ranges
+
+    def test_shift_overflow(self):
+        ranges = SequenceRangeArray([(2**31 - 5, 2**31 - 1)])
+        with pytest.raises(OverflowError):
+            ranges + 10
+        with pytest.raises(OverflowError):
+            SequenceRangeArray([(-2**31 + 1, 5)], validate=False) - 10
+        assert (ranges - 10).pos[1].tolist() == [2**31 - 11]
+
+    def test_equals_agrees_with_the_elements(self):
+        ranges = SequenceRangeArray([(1, 3), (5, 9), (5, 9), (2, 2)],
+                                    seq=["AAA", None, "ABCDE", None])
+        other = SequenceRangeArray([(1, 3), (5, 9), (5, 9), (2, 3)],
+                                   seq=["AAA", None, "VWXYZ", None])
+        for compare_seq in (True, False):
+            assert ranges.equals(other, compare_seq=compare_seq).tolist() == [
+                a.equals(b, compare_seq=compare_seq) for a, b in zip(ranges, other)]
+        assert ranges.equals([(1, 3), (5, 9), (5, 9), (2, 2)]).tolist() == \
+            [False, True, False, True]
+        with pytest.raises(ValueError):
+            ranges.equals(other[:2])
@@ -0,0 +1,78 @@
+
+# 3rd party imports
+import numpy as np
+import pytest
+
+# local imports
+from sequtils import (SequenceRangeArray, KeyedRangeArray, containment_forest, maximal_ranges,
+                      terminus_groups)
+from test_join import _random_ranges
+
+
+def _brute_force_containers(ranges):
+    ranges = list(ranges)
+    return [[j for j, other in enumerate(ranges) if j != i and sr in other and
+             (sr.pos != other.pos or j < i)] for i, sr in enumerate(ranges)]
+
+
+########################################
+# Tests for the redundancy collapsing
+########################################
+class TestContainmentForest:
+    def test_glucagon_peptides(self, glucagon_peptides):
+        peptides = SequenceRangeArray([(start, stop) for start, stop, _ in glucagon_peptides])
+        parents = containment_forest(peptides)
+        containers = _brute_force_containers(peptides)
+        for i, parent in enumerate(parents):
+            if containers[i]:
+                assert parent in containers[i]
+            else:
+                assert parent == -1
+        assert list(maximal_ranges(peptides)) == [i for i, c in enumerate(containers) if not c]
+
+    def test_random_ranges(self):
+        rng = np.random.default_rng(36)
+        ranges = _random_ranges(rng, 300, max_pos=60, max_length=15)
+        parents = containment_forest(ranges)
+        for i, containers in enumerate(_brute_force_containers(ranges)):
+            assert (parents[i] in containers) if containers else parents[i] == -1
+
+    def test_parent_is_closest(self):
+        parents = containment_forest([(1, 30), (2, 30), (2, 20), (5, 10), (5, 10)])
+        assert list(parents) == [-1, 0, 1, 2, 3]
+
+    def test_keys(self):
+        ranges = [(1, 20), (5, 10), (5, 10)]
+        assert list(containment_forest(ranges, keys=["P1", "P2", "P1"])) == [-1, -1, 0]
+        keyed = KeyedRangeArray(["P1", "P2", "P1"], ranges)
+        assert list(keyed.containment_forest()) == [-1, -1, 0]
+        assert list(keyed.maximal_ranges()) == [0, 1]
+
+    def test_empty(self):
+        assert len(containment_forest(SequenceRangeArray([], []))) == 0
+
+
+class TestTerminusGroups:
+    def test_groups(self, glucagon_peptides):
+        peptides = SequenceRangeArray([(start, stop) for start, stop, _ in glucagon_peptides])
+        for terminus in ('start', 'stop'):
+            groups = terminus_groups(peptides, terminus, min_size=3)
+            position = getattr(peptides, terminus).pos
+            for group in np.unique(groups[groups >= 0]):
+                members = np.flatnonzero(groups == group)
+                assert len(members) >= 3
+                assert len(set(position[members])) == 1
+            for i in np.flatnonzero(groups == -1):
+                assert (position == position[i]).sum() < 3
+
+    def test_keys(self):
+        ranges = [(1, 5), (1, 8), (1, 9)]
+        assert list(terminus_groups(ranges, keys=["P1", "P2", "P1"])) == [0, -1, 0]
+        keyed = KeyedRangeArray(["P1", "P2", "P1"], ranges)
+        assert list(keyed.terminus_groups('stop', min_size=1)) == [0, 2, 1]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            terminus_groups([(1, 5)], 'middle')
+        with pytest.raises(ValueError):
+            terminus_groups([(1, 5)], min_size=0)
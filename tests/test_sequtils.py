@@ -1,6 +1,5 @@
 
 # core imports
-import os
 import pickle
 import math
 
@@ -11,35 +10,9 @@ import pytest
 import sequtils
 from sequtils import SequencePoint, SequenceRange
 
-TEST_FOLDER = os.path.abspath(os.path.dirname(__file__))
-TEST_FILES_FOLDER = os.path.abspath(os.path.join(TEST_FOLDER, 'test_files'))
-
 ########################################
-# fixtures
-# move to conftest when project becomes larger!
+# fixtures are in conftest.py
 ########################################
-@pytest.fixture(scope='session')
-def glucagon_seq():
-    with open(os.path.join(TEST_FILES_FOLDER, 'glucagon.fasta')) as f:
-        return "".join(line.strip() for line in f.readlines()[1:])
-
-
-@pytest.fixture(scope='session')
-def glucagon_peptides():
-    """ all peptides from glucagon as ((start, stop, seq), ..) """
-
-    def get_peptide(f):
-        start, stop = map(int, f.readline().split('|')[-1].split('-'))
-        seq = f.readline().strip()
-        return start, stop, seq
-
-    peptides = []
-    with open(os.path.join(TEST_FILES_FOLDER, 'glucagon_peptides.fasta')) as f:
-        while f.tell() != os.fstat(f.fileno()).st_size:
-            peptides.append(get_peptide(f))
-    return tuple(peptides)
-
-
 def test_fixtures(glucagon_peptides, glucagon_seq):
     assert len(glucagon_peptides) == 11
     assert len(glucagon_seq) == 60 * 3  # full std fasta lines
@@ -765,6 +738,38 @@ class TestSequenceRange(BaseTestSequence):
         assert SequenceRange(10, seq="A"*11) != (10, 20)
         assert SequenceRange(10, 20) == (10, 20)
 
+    def test_same_type_fast_path(self):
+        class SubRange(SequenceRange):
+            pass
+
+        sr = SequenceRange(10, 20, seq="A"*11)
+        assert sr == SequenceRange(10, 20, seq="A"*11)
+        assert sr != SequenceRange(10, 20)
+        assert sr.equals(SequenceRange(10, 20), compare_seq=False, cast=False)
+        assert SequenceRange(10, 20) < SequenceRange(10, 21) < SequenceRange(11, 12)
+        assert not SequenceRange(10, 20) < SequenceRange(10, 20)
+        assert SequenceRange(10, 20) <= SequenceRange(10, 20)
+        assert SequenceRange(11, 12) > SequenceRange(10, 21)
+        # other types still take the casting path
+        assert SequenceRange(10, 20) == SubRange(10, 20)
+        assert SequenceRange(10, 20) < (10, 21)
+        assert SequencePoint(3) < SequencePoint(4)
+        assert SequencePoint(3) == SequencePoint(3) == 3
+
+    def test_iteration_modes(self):
+        sr = SequenceRange(5, 9)
+        points = list(sr)
+        assert points == [SequencePoint(pos) for pos in range(5, 10)]
+        assert all(type(point) is SequencePoint for point in points)
+        assert [point.slice for point in points] == [SequencePoint(pos).slice
+                                                     for pos in range(5, 10)]
+        assert sr.positions() == range(5, 10)
+        assert sr.indexes() == range(4, 9)
+        assert [chunk.tolist() for chunk in sr.iter_chunks(2)] == [[5, 6], [7, 8], [9]]
+        assert [chunk.tolist() for chunk in sr.iter_chunks(10, index=True)] == [[4, 5, 6, 7, 8]]
+        with pytest.raises(ValueError):
+            list(sr.iter_chunks(0))
+
 
 class TestInteroperability:
     def test_conversion(self):
@@ -802,3 +807,13 @@ class TestInteroperability:
     def test_can_not_create_a_sequence_from_range_if_start_and_stop_are_different(self):
         with pytest.raises(TypeError):
             assert SequencePoint(SequenceRange(10, 12))
+
+    def test_pickle_roundtrip(self):
+        items = (SequencePoint(3), SequencePoint(-1, validate=False), SequenceRange(1, 5),
+                 SequenceRange(5, 1, validate=False), SequenceRange(2, seq="AB"))
+        for item in items:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                restored = pickle.loads(pickle.dumps(item, protocol=protocol))
+                assert type(restored) is type(item)
+                assert restored.pos == item.pos
+                assert getattr(restored, 'seq', None) == getattr(item, 'seq', None)
@@ -0,0 +1,50 @@
+# core imports
+import re
+
+# 3rd party imports
+import pytest
+
+# local imports
+from sequtils import SequenceRange, SequenceRangeArray, tile_sequence, merge_tile_hits
+
+
+########################################
+# Tests for tile_sequence and merge_tile_hits
+########################################
+def _scan(pattern, sequence):
+    return [SequenceRange.from_slice(match.start(1), match.end(1), seq=match.group(1))
+            for match in re.finditer("(?=(" + pattern + "))", sequence)]
+
+
+class TestTiling:
+    @pytest.mark.parametrize("length, chunk_size, overlap", [
+        (1, 5, 0), (5, 5, 2), (6, 5, 0), (25, 10, 3), (100, 7, 6)])
+    def test_tiles_cover_the_sequence(self, length, chunk_size, overlap):
+        tiles = tile_sequence(length, chunk_size, overlap=overlap)
+        start, stop = tiles.pos
+        assert start[0] == 1 and stop[-1] == length
+        assert (tiles.length <= chunk_size).all()
+        # consecutive tiles share exactly overlap residues
+        assert (stop[:-1] - start[1:] + 1 == overlap).all()
+        assert tiles.is_valid().all()
+
+    def test_invalid_arguments(self):
+        assert len(tile_sequence(0, 5)) == 0
+        with pytest.raises(ValueError):
+            tile_sequence(10, 0)
+        with pytest.raises(ValueError):
+            tile_sequence(10, 5, overlap=5)
+
+    @pytest.mark.parametrize("chunk_size", [6, 11, 50, 1000])
+    def test_merged_hits_are_the_hits_of_the_whole_sequence(self, glucagon_seq, chunk_size):
+        # hits of at most 3 residues need an overlap of 2
+        pattern = "[KR][KR]|N[^P][ST]|G"
+        tiles = tile_sequence(len(glucagon_seq), chunk_size, overlap=2)
+        hits = [SequenceRangeArray(_scan(pattern, glucagon_seq[tile.slice]))
+                for tile in tiles]
+        merged = merge_tile_hits(tiles, hits)
+        assert list(merged) == _scan(pattern, glucagon_seq)
+
+    def test_hits_per_tile_are_required(self):
+        with pytest.raises(ValueError):
+            merge_tile_hits(tile_sequence(20, 5), [[(1, 2)]])